@@ -0,0 +1,77 @@
+"""
+Compare the cost of sending one tick of device data for a robot as JSON inside RobotData (RequestTickUpdates),
+against the typed messages of RobotDevices (RequestDeviceUpdates).
+
+Run from the root of the repository with ``python -m benchmarks.device_data``.
+"""
+import json
+import timeit
+
+from google.protobuf.internal import api_implementation
+import ev3sim.simulation.comm_schema_pb2 as comm_schema
+from ev3sim.simulation.device_data import device_data_message, device_state
+
+# Device data for the default soccer bot, as returned by RobotInteractor.collectDeviceData.
+DEVICE_DATA = {
+    'tacho-motor': {
+        f'motor{x}': {
+            'address': f'out{port}',
+            'command': 'run-forever',
+            'count_per_rot': 3,
+            'driver_name': 'lego-ev3-l-motor',
+            'max_speed': 100,
+            'speed_sp': 50,
+            'state': 'running',
+            'stop_action': 'hold',
+            'time_sp': 0,
+        } for x, port in enumerate('BC')
+    },
+    'lego-sensor': {
+        'sensor0': {'address': 'in1', 'driver_name': 'ht-nxt-ir-seek-v2', 'mode': 'AC-ALL', **{f'value{x}': x for x in range(7)}},
+        'sensor1': {'address': 'in2', 'driver_name': 'lego-ev3-color', 'mode': 'RGB-RAW', 'value0': 178, 'value1': 313, 'value2': 224},
+        'sensor2': {'address': 'in3', 'driver_name': 'lego-ev3-us', 'mode': 'US-DIST-CM', 'value0': 68, 'decimals': 0},
+        'sensor3': {'address': 'in4', 'driver_name': 'ht-nxt-compass', 'mode': 'COMPASS', 'value0': 180, 'decimals': 0},
+    },
+}
+
+def encode_json():
+    return comm_schema.RobotData(tick=1, tick_rate=60, content=json.dumps(DEVICE_DATA)).SerializeToString()
+
+def decode_json(message):
+    return json.loads(comm_schema.RobotData.FromString(message).content)
+
+def encode_typed():
+    return comm_schema.RobotDevices(tick=1, tick_rate=60, devices=[
+        device_data_message(device_type, name, attributes)
+        for device_type, devices in DEVICE_DATA.items()
+        for name, attributes in devices.items()
+    ]).SerializeToString()
+
+def encode_typed_changed():
+    # With deltas accepted, only the devices which changed are sent, which is usually just a sensor or two.
+    return comm_schema.RobotDevices(tick=1, tick_rate=60, devices=[
+        device_data_message('lego-sensor', 'sensor1', DEVICE_DATA['lego-sensor']['sensor1']),
+    ]).SerializeToString()
+
+def decode_typed(message):
+    current = {}
+    for device in comm_schema.RobotDevices.FromString(message).devices:
+        current.setdefault(device.device_type, {})[device.name] = device_state(device)
+    return current
+
+def report(name, function, number):
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f'{name:<16}{seconds * 1e6:>10.1f}us')
+
+if __name__ == '__main__':
+    # The cost of protobuf messages depends heavily on whether the pure python or the compiled implementation is used.
+    print(f'Protobuf implementation: {api_implementation.Type()}')
+    json_message, typed_message, changed_message = encode_json(), encode_typed(), encode_typed_changed()
+    print(f'JSON message:  {len(json_message)} bytes')
+    print(f'Typed message: {len(typed_message)} bytes ({len(changed_message)} bytes with one changed device)')
+    report('JSON encode', encode_json, 2000)
+    report('JSON decode', lambda: decode_json(json_message), 2000)
+    report('Typed encode', encode_typed, 2000)
+    report('Typed decode', lambda: decode_typed(typed_message), 2000)
+    report('Changed encode', encode_typed_changed, 2000)
+    report('Changed decode', lambda: decode_typed(changed_message), 2000)
@@ -1,4 +1,6 @@
 import sys
+import math
+import contextlib
 import logging
 import json
 import time
@@ -7,10 +9,67 @@ import grpc
 import threading
 import ev3sim.simulation.comm_schema_pb2
 import ev3sim.simulation.comm_schema_pb2_grpc
+from ev3sim.simulation.device_data import apply_device_data_delta, device_state, get_device_attribute, typed_messages_preferred
+from ev3sim.simulation.tick_timers import TickTimers
 from unittest import mock
 from queue import Queue
 from os import path, getcwd
 
+def acknowledge_tick(data, tick):
+    """In lockstep, let the simulator move on from ``tick``, as the script has finished reacting to it."""
+    with data['ack_lock']:
+        if not data['lockstep'] or tick <= data['acked_tick']:
+            return
+        data['acked_tick'] = tick
+        # Goes through the actions queue, so that any writes already made arrive before the acknowledgement.
+        data['actions_queue'].put(('tick_ack', tick))
+
+def end_tick(data):
+    """Send everything the script has done since the last tick ended, as it is done with the tick it has (for now)."""
+    data['actions_queue'].put(('end_tick', None))
+
+def write_batches(actions_queue, robot_id):
+    """
+    Yield a ``RobotWriteBatch`` of the writes made and devices opened for each tick, taken from ``actions_queue``.
+
+    A tick ends when the next one arrives, or when the script blocks or acknowledges it, so that writes made
+    together in a tick are sent (and applied) together, however long the script takes between them.
+    """
+    writes = []
+    opened = []
+    while True:
+        action_type, info = actions_queue.get()
+        if action_type == 'write':
+            device_type, name, attribute, value = info
+            writes.append(ev3sim.simulation.comm_schema_pb2.DeviceWrite(device_type=device_type, name=name, attribute=attribute, value=value))
+        elif action_type == 'open':
+            device_type, name = info
+            opened.append(ev3sim.simulation.comm_schema_pb2.DevicePath(device_type=device_type, name=name))
+        elif action_type == 'tick_ack':
+            yield ev3sim.simulation.comm_schema_pb2.RobotWriteBatch(robot_id=robot_id, writes=writes, opened=opened, ack=True, tick=info)
+            writes = []
+            opened = []
+        elif action_type == 'end_tick' and (writes or opened):
+            yield ev3sim.simulation.comm_schema_pb2.RobotWriteBatch(robot_id=robot_id, writes=writes, opened=opened)
+            writes = []
+            opened = []
+
+@contextlib.contextmanager
+def blocked_on_simulator(data):
+    """
+    While inside, the script is waiting for something to happen in the simulator (a tick to pass, a message to arrive),
+    so it is done with the tick it has, and any ticks arriving meanwhile are acknowledged on its behalf.
+    """
+    with data['ack_lock']:
+        data['blocked'] += 1
+    acknowledge_tick(data, data['tick'])
+    end_tick(data)
+    try:
+        yield
+    finally:
+        with data['ack_lock']:
+            data['blocked'] -= 1
+
 def main(passed_args = None):
     called_from = getcwd()
     if passed_args is None:
@@ -29,12 +88,27 @@ def main(passed_args = None):
     shared_data = {
         'tick': 0,
         'tickrate': 1,
+        'dropped_ticks': 0,
         'current_data': {},
         'actions_queue': Queue(maxsize=0),
+        'logs_queue': Queue(maxsize=0),
         'start_robot_queue': Queue(maxsize=0),
-        'active_data_handlers': {},
+        # Wakes sleeps and waits in the script on the tick they are waiting for.
+        'tick_timers': TickTimers(),
+        # Each device the script has opened, numbered in the order they were reported to the simulator,
+        # and how many of those the simulator is keeping up to date.
+        'opened_devices': {},
+        'opened_applied': 0,
+        # In lockstep, the simulator waits for the script to acknowledge each tick before simulating the next one.
+        'lockstep': False,
+        'acked_tick': -1,
+        # How many of the script's threads are blocked waiting on the simulator, and whether the script has finished.
+        'blocked': 0,
+        'script_finished': False,
+        'ack_lock': threading.Lock(),
+        # The tick each (device_type, name, attribute) was last read on.
+        'last_reads': {},
         'update_lock': threading.Lock(),
-        'write_results': Queue(maxsize=0),
         'active_connections': [],
         'thread_ids': {},
     }
@@ -47,7 +121,7 @@ def main(passed_args = None):
         thread_id = threading.get_ident()
         if thread_id in shared_data['thread_ids']:
             source = shared_data['thread_ids'][thread_id]
-            shared_data['actions_queue'].put(('send_log', (message, source)))
+            shared_data['logs_queue'].put((message, source))
             if not args.send_logs:
                 print_builtin(message, end='', **kwargs)
         else:
@@ -56,28 +130,72 @@ def main(passed_args = None):
     def run_simulation():
         class CommunicationsError(Exception): pass
 
+        # Requests for bot communications are made straight from the script, so they never hold up writes, or each other.
+        comms_channel = grpc.insecure_channel(args.simulator_addr)
+        comms_stub = ev3sim.simulation.comm_schema_pb2_grpc.SimulationDealerStub(comms_channel)
+
+        def comms_request(rpc, message):
+            """Make a communications request to the simulator, and wait for the result, raising a ``CommunicationsError`` if it fails."""
+            with blocked_on_simulator(shared_data):
+                d = getattr(comms_stub, rpc)(message)
+            if not d.result:
+                raise CommunicationsError(d.msg)
+            return d
+
         def comms(data, result):
             data['thread_ids'][threading.get_ident()] = ev3sim.simulation.comm_schema_pb2.RobotLogSource.COMMS
             from grpc._channel import _MultiThreadedRendezvous
             logging.basicConfig()
             first_message = True
+            use_typed_messages = typed_messages_preferred()
             while True:
                 with grpc.insecure_channel(args.simulator_addr) as channel:
                     try:
                         stub = ev3sim.simulation.comm_schema_pb2_grpc.SimulationDealerStub(channel)
-                        response = stub.RequestTickUpdates(ev3sim.simulation.comm_schema_pb2.RobotRequest(robot_id=robot_id))
+                        request = ev3sim.simulation.comm_schema_pb2.RobotRequest(
+                            robot_id=robot_id,
+                            accept_deltas=True,
+                            report_opened_devices=True,
+                        )
+                        # JSON is cheaper to decode unless protobuf is compiled.
+                        response = (stub.RequestDeviceUpdates if use_typed_messages else stub.RequestTickUpdates)(request)
+                        connected = False
                         for r in response:
+                            # Anything the script did on the last tick is sent before it sees this one.
+                            end_tick(data)
+                            if not connected:
+                                connected = True
+                                # A new connection starts with nothing opened, so report everything opened on the last one again.
+                                for device_path in data['opened_devices']:
+                                    data['actions_queue'].put(('open', device_path))
                             data['tick'] = r.tick
                             data['tick_rate'] = r.tick_rate
-                            data['current_data'] = json.loads(r.content)
+                            data['dropped_ticks'] = r.dropped_ticks
+                            data['opened_applied'] = r.opened_devices
+                            # Only devices which have changed are sent, so keep the rest.
+                            if use_typed_messages:
+                                changed = [(device.device_type, device.name) for device in r.devices]
+                                for device in r.devices:
+                                    data['current_data'].setdefault(device.device_type, {})[device.name] = device_state(device)
+                            elif r.content:
+                                data['current_data'] = json.loads(r.content)
+                                changed = None
+                            else:
+                                delta = json.loads(r.delta) if r.delta else {}
+                                apply_device_data_delta(data['current_data'], delta)
+                                changed = [(device_type, name) for device_type, named in delta.items() for name in named]
                             if first_message:
                                 print("Connection initialised.")
                                 first_message = False
                                 data['start_robot_queue'].put(True)
-                            for key in data['active_data_handlers']:
-                                data['active_data_handlers'][key].put(True)
+                            data['lockstep'] = r.lockstep
+                            woken = data['tick_timers'].advance(r.tick, changed)
                             with data['condition_updating']:
-                                data['condition_updated'].notify()
+                                data['condition_updated'].notify_all()
+                            # Otherwise the script acknowledges the tick itself, once it has reacted to it (see blocked_on_simulator).
+                            # A thread woken by this tick will react to it, so it isn't acknowledged on the script's behalf.
+                            if data['script_finished'] or (data['blocked'] and not woken):
+                                acknowledge_tick(data, r.tick)
                     except Exception as e:
                         # https://github.com/MelbourneHighSchoolRobotics/ev3sim/issues/55 pygame window dragging will deadline.
                         if not (isinstance(e, _MultiThreadedRendezvous) and e._state.details == "Deadline Exceeded"):
@@ -88,52 +206,34 @@ def main(passed_args = None):
 
         def write(data, result):
             data['thread_ids'][threading.get_ident()] = ev3sim.simulation.comm_schema_pb2.RobotLogSource.WRITE
+
+            with grpc.insecure_channel(args.simulator_addr) as channel:
+                try:
+                    stub = ev3sim.simulation.comm_schema_pb2_grpc.SimulationDealerStub(channel)
+                    # Writes (and tick acknowledgements) are sent in batches over a single stream, which keeps them in order.
+                    batches = Queue()
+                    # Keep hold of the call, otherwise it is cancelled once garbage collected.
+                    write_stream = stub.SendWriteStream.future(iter(batches.get, None))
+                    try:
+                        for batch in write_batches(data['actions_queue'], robot_id):
+                            if write_stream.done():
+                                # The simulator only stops taking writes if something went wrong, so raise that rather than queueing writes forever.
+                                write_stream.result()
+                            batches.put(batch)
+                    finally:
+                        # End the stream, rather than leaving it to be cancelled.
+                        batches.put(None)
+                except Exception as e:
+                    result.put(('Communications', e))
+
+        def logs(data, result):
+            # Logs have a thread of their own, so printing a lot never delays writes.
             with grpc.insecure_channel(args.simulator_addr) as channel:
                 try:
                     stub = ev3sim.simulation.comm_schema_pb2_grpc.SimulationDealerStub(channel)
                     while True:
-                        action_type, info = data['actions_queue'].get()
-                        if action_type == 'write':
-                            path, value = info
-                            stub.SendWriteInfo(ev3sim.simulation.comm_schema_pb2.RobotWrite(robot_id=robot_id, attribute_path=path, value=value))
-                        elif action_type == 'send_log':
-                            message, source = info
-                            stub.SendRobotLog(ev3sim.simulation.comm_schema_pb2.RobotLogRequest(robot_id=robot_id, log=message, source=source, print=args.send_logs))
-                        elif action_type == 'begin_server':
-                            d = stub.RequestServer(ev3sim.simulation.comm_schema_pb2.ServerRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'connect':
-                            d = stub.RequestConnect(ev3sim.simulation.comm_schema_pb2.ClientRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'accept_client':
-                            d = stub.RequestGetClient(ev3sim.simulation.comm_schema_pb2.GetClientRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'send_data':
-                            d = stub.RequestSend(ev3sim.simulation.comm_schema_pb2.SendRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'recv_data':
-                            d = stub.RequestRecv(ev3sim.simulation.comm_schema_pb2.RecvRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'close_server':
-                            d = stub.CloseServerConnection(ev3sim.simulation.comm_schema_pb2.CloseServerRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
-                        elif action_type == 'close_client':
-                            d = stub.CloseClientConnection(ev3sim.simulation.comm_schema_pb2.CloseClientRequest(**info))
-                            if not d.result:
-                                raise CommunicationsError(d.msg)
-                            data['write_results'].put(d)
+                        message, source = data['logs_queue'].get()
+                        stub.SendRobotLog(ev3sim.simulation.comm_schema_pb2.RobotLogRequest(robot_id=robot_id, log=message, source=source, print=args.send_logs))
                 except Exception as e:
                     result.put(('Communications', e))
 
@@ -148,24 +248,46 @@ def main(passed_args = None):
                         self.seek_point = 0
                     
                     def read(self):
-                        if isinstance(data['current_data'][self.k2][self.k3][self.k4], int):
-                            res = str(data['current_data'][self.k2][self.k3][self.k4])
-                        if isinstance(data['current_data'][self.k2][self.k3][self.k4], str):
-                            if self.seek_point == 0:
-                                res = data['current_data'][self.k2][self.k3][self.k4]
-                            else:
-                                res = data['current_data'][self.k2][self.k3][self.k4][self.seek_point:]
+                        wait_until_calculated((self.k2, self.k3))
+                        if data['lockstep']:
+                            attribute = (self.k2, self.k3, self.k4)
+                            # Reading something again on the same tick means the script is after the next tick's readings.
+                            if data['last_reads'].get(attribute) == data['tick']:
+                                wait_for(data['tick_timers'].watch(until=data['tick'] + 1))
+                            data['last_reads'][attribute] = data['tick']
+                        res = get_device_attribute(data['current_data'][self.k2][self.k3], self.k4)
+                        if isinstance(res, int):
+                            res = str(res)
+                        elif self.seek_point != 0:
+                            res = res[self.seek_point:]
                         return res.encode('utf-8')
                     
                     def seek(self, i):
                         self.seek_point = i
                     
                     def write(self, value):
-                        data['actions_queue'].put(('write', (f'{self.k2} {self.k3} {self.k4}', value.decode())))
+                        data['actions_queue'].put(('write', (self.k2, self.k3, self.k4, value.decode())))
                     
                     def flush(self):
                         pass
 
+                def open_device(device_path):
+                    """Tell the simulator the script has opened the device at ``device_path``, so that its readings need calculating."""
+                    if device_path not in data['opened_devices']:
+                        data['opened_devices'][device_path] = len(data['opened_devices']) + 1
+                        data['actions_queue'].put(('open', device_path))
+
+                def wait_for(event):
+                    """Block the script until ``event`` (from ``data['tick_timers']``) is set."""
+                    with blocked_on_simulator(shared_data):
+                        event.wait()
+
+                def wait_until_calculated(device_path):
+                    """Wait until the data received for the device at ``device_path`` has been calculated since it was opened."""
+                    number = data['opened_devices'].get(device_path, 0)
+                    while data['opened_applied'] < number:
+                        wait_for(data['tick_timers'].watch(until=data['tick_timers'].tick + 1))
+
                 def device__init__(self, class_name, name_pattern='*', name_exact=False, **kwargs):
                     self._path = [class_name]
                     self.kwargs = kwargs
@@ -182,15 +304,17 @@ def main(passed_args = None):
                         self._path.append(name_pattern)
                         self._device_index = get_index(name_pattern)
                     else:
-                        for name in data['current_data'][self._path[0]].keys():
+                        for name, state in data['current_data'][self._path[0]].items():
                             for k in kwargs:
-                                if k not in data['current_data'][self._path[0]][name]:
+                                try:
+                                    value = get_device_attribute(state, k)
+                                except KeyError:
                                     break
                                 if isinstance(kwargs[k], list):
-                                    if data['current_data'][self._path[0]][name][k] not in kwargs[k]:
+                                    if value not in kwargs[k]:
                                         break
                                 else:
-                                    if data['current_data'][self._path[0]][name][k] != kwargs[k]:
+                                    if value != kwargs[k]:
                                         break
                             else:
                                 self._path.append(name)
@@ -201,37 +325,40 @@ def main(passed_args = None):
                             self._device_index = None
 
                             raise DeviceNotFound("%s is not connected." % self)
+                    open_device(tuple(self._path))
 
                 def _attribute_file_open(self, name):
                     return MockedFile((self._path[0], self._path[1], name))
 
+                def tick_at(seconds):
+                    """The first tick at which the simulation will have reached ``seconds``."""
+                    # Allow for floating point error, so that a whole number of ticks isn't rounded up to the next one.
+                    return math.ceil(seconds * data['tick_rate'] - 1e-6)
+
                 def wait(self, cond, timeout=None):
-                    import time
-                    tic = time.time()
-                    if cond(self.state):
-                        return True
-                    # Register to active_data_handlers so we can do something every tick without lagging.
-                    handler_key = ' ' .join(self._path)
-                    data['active_data_handlers'][handler_key] = Queue(maxsize=0)
-                    while True:
-                        data['active_data_handlers'][handler_key].get()
-                        res = cond(self.state)
-                        if res or ((timeout is not None) and (time.time() >= tic + timeout / 1000)):
-                            del data['active_data_handlers'][handler_key]
-                            return cond(self.state)
+                    until = None if timeout is None else tick_at(get_time() + timeout / 1000)
+                    device = tuple(self._path)
+                    # Only woken when this motor changes, or the timeout is reached.
+                    woken = data['tick_timers'].watch(until=until, device=device)
+                    try:
+                        while True:
+                            woken.clear()
+                            if cond(self.state):
+                                return True
+                            if until is not None and data['tick_timers'].tick >= until:
+                                return False
+                            wait_for(woken)
+                    finally:
+                        data['tick_timers'].unwatch(woken, device)
 
                 def get_time():
                     return data['tick'] / data['tick_rate']
 
+                def dropped_ticks():
+                    return data['dropped_ticks']
+
                 def sleep(seconds):
-                    from time import time
-                    cur = time()
-                    with data['condition_updated']:
-                        while True:
-                            elapsed = time() - cur
-                            if elapsed >= seconds:
-                                return
-                            data['condition_updated'].wait(0.1)
+                    wait_for(data['tick_timers'].watch(until=tick_at(get_time() + seconds)))
 
                 def raiseEV3Error(*args, **kwargs):
                     raise ValueError("This simulator is not compatible with ev3dev. Please use ev3dev2: https://pypi.org/project/python-ev3dev2/")
@@ -244,57 +371,40 @@ def main(passed_args = None):
                     
                     def send(self, d):
                         assert isinstance(d, str), "Can only send string data through simulator."
-                        data['actions_queue'].put(('send_data', {
-                            'robot_id': robot_id,
-                            'client_id': self.sender_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                            'data': d,
-                        }))
-                        # Wait for it to be handled
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        r = data['write_results'].get()
+                        comms_request('RequestSend', ev3sim.simulation.comm_schema_pb2.SendRequest(
+                            robot_id=robot_id,
+                            client_id=self.sender_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                            data=d,
+                        ))
                     
                     def recv(self, buffer):
-                        # At the moment the buffer is ignored.
-                        data['actions_queue'].put(('recv_data', {
-                            'robot_id': robot_id,
-                            'client_id': self.sender_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        return data['write_results'].get().data
+                        return comms_request('RequestRecv', ev3sim.simulation.comm_schema_pb2.RecvRequest(
+                            robot_id=robot_id,
+                            client_id=self.sender_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                            limit=buffer,
+                        )).data
 
                     def close(self):
-                        data['actions_queue'].put(('close_client', {
-                            'robot_id': robot_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                            'server_id': self.sender_id,
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        info = data['write_results'].get()
+                        comms_request('CloseClientConnection', ev3sim.simulation.comm_schema_pb2.CloseClientRequest(
+                            robot_id=robot_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                            server_id=self.sender_id,
+                        ))
 
                 class MockedCommClient(MockedCommSocket):
                     def __init__(self, hostaddr, port):
                         if hostaddr == 'aa:bb:cc:dd:ee:ff':
                             print(f"While this example will work, for competition bots please change the host address from {hostaddr} so competing bots can communicate separately.")
-                        data['actions_queue'].put(('connect', {
-                            'robot_id': robot_id,
-                            'address': hostaddr,
-                            'port': str(port),
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        sender_id = data['write_results'].get().host_robot_id
+                        sender_id = comms_request('RequestConnect', ev3sim.simulation.comm_schema_pb2.ClientRequest(
+                            robot_id=robot_id,
+                            address=hostaddr,
+                            port=str(port),
+                        )).host_robot_id
                         super().__init__(hostaddr, port, sender_id)
                         data['active_connections'].append(self)
 
@@ -308,28 +418,20 @@ def main(passed_args = None):
                             print(f"While this example will work, for competition bots please change the host address from {hostaddr} so competing bots can communicate separately.")
                         self.hostaddr = hostaddr
                         self.port = str(port)
-                        data['actions_queue'].put(('begin_server', {
-                            'robot_id': robot_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        result = data['write_results'].get()
+                        comms_request('RequestServer', ev3sim.simulation.comm_schema_pb2.ServerRequest(
+                            robot_id=robot_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                        ))
                         self.sockets = []
                         data['active_connections'].append(self)
                     
                     def accept_client(self):
-                        data['actions_queue'].put(('accept_client', {
-                            'robot_id': robot_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        client = data['write_results'].get()
+                        client = comms_request('RequestGetClient', ev3sim.simulation.comm_schema_pb2.GetClientRequest(
+                            robot_id=robot_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                        ))
                         self.sockets.append(MockedCommSocket(self.hostaddr, self.port, client.client_id))
                         return self.sockets[-1], (self.hostaddr, self.port)
                     
@@ -337,15 +439,11 @@ def main(passed_args = None):
                         # Close all clients, then close myself
                         for socket in self.sockets:
                             socket.close()
-                        data['actions_queue'].put(('close_server', {
-                            'robot_id': robot_id,
-                            'address': self.hostaddr,
-                            'port': self.port,
-                        }))
-                        with data['write_results'].not_empty:
-                            while not data['write_results']._qsize():
-                                data['write_results'].not_empty.wait(0.1)
-                        info = data['write_results'].get()
+                        comms_request('CloseServerConnection', ev3sim.simulation.comm_schema_pb2.CloseServerRequest(
+                            robot_id=robot_id,
+                            address=self.hostaddr,
+                            port=self.port,
+                        ))
                         data['active_connections'].remove(self)
 
                 fake_path = sys.path.copy()
@@ -358,6 +456,7 @@ def main(passed_args = None):
                 @mock.patch('ev3dev2.Device._attribute_file_open', _attribute_file_open)
                 @mock.patch('ev3sim.code_helpers.is_ev3', False)
                 @mock.patch('ev3sim.code_helpers.is_sim', True)
+                @mock.patch('ev3sim.code_helpers.dropped_ticks', dropped_ticks)
                 @mock.patch('ev3sim.code_helpers.CommServer', MockedCommServer)
                 @mock.patch('ev3sim.code_helpers.CommClient', MockedCommClient)
                 @mock.patch('sys.path', fake_path)
@@ -376,6 +475,11 @@ def main(passed_args = None):
             except Exception as e:
                 result.put(('Robots', e))
                 return
+            finally:
+                # Nothing left to react to ticks, so stop holding up the simulation.
+                data['script_finished'] = True
+                acknowledge_tick(data, data['tick'])
+                end_tick(data)
             result.put(True)
 
         result_bucket = Queue(maxsize=1)
@@ -386,9 +490,11 @@ def main(passed_args = None):
         comm_thread = Thread(target=comms, args=(shared_data, result_bucket,), daemon=True)
         robot_thread = Thread(target=robot, args=(find_abs(args.filename, allowed_areas=['local', 'local/robots/', 'package', 'package/robots/']), shared_data, result_bucket,), daemon=True)
         write_thread = Thread(target=write, args=(shared_data, result_bucket,), daemon=True)
+        log_thread = Thread(target=logs, args=(shared_data, result_bucket,), daemon=True)
 
         comm_thread.start()
         write_thread.start()
+        log_thread.start()
         robot_thread.start()
 
         try:
@@ -397,22 +503,28 @@ def main(passed_args = None):
                     result_bucket.not_empty.wait(0.1)
             r = result_bucket.get()
             if r is not True:
-                # Clear the actions queue.
+                # Clear the actions and logs queues.
                 shared_data['actions_queue'] = Queue()
+                shared_data['logs_queue'] = Queue()
         except KeyboardInterrupt as e:
             r = True
             pass
 
         # Ensure all active connections are closed, provided the Communications thread is still running.
         if r is True or r[0] != 'Communications':
-            for active_connection in shared_data['active_connections']:
-                active_connection.close()
+            for active_connection in shared_data['active_connections'][:]:
+                try:
+                    active_connection.close()
+                except CommunicationsError:
+                    # Already closed by the other end.
+                    pass
 
         with shared_data['condition_updated']:
-            while shared_data['actions_queue']._qsize() > 0:
+            while shared_data['actions_queue']._qsize() > 0 or shared_data['logs_queue']._qsize() > 0:
                 shared_data['condition_updated'].wait(0.1)
 
             shared_data['condition_updated'].wait(0.5)
+        comms_channel.close()
 
         if r is not True:
             print(f"An error occured in the {r[0]} thread. Raising an error now...")
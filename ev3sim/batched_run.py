@@ -1,29 +1,55 @@
+import os
+import csv
 import sys
 import yaml
-import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from ev3sim.file_helper import find_abs
-from multiprocessing import Process
 
-def batched_run(batch_file, bind_addr):
-    from ev3sim.single_run import single_run as sim
-    from ev3sim.attach import main as attach
+# The simulator and scripts use gRPC, which can deadlock in a process forked while another thread is inside it,
+# so every process is started fresh instead.
+processes = multiprocessing.get_context('spawn')
 
+def load_batch(batch_file):
     batch_path = find_abs(batch_file, allowed_areas=['local', 'local/batched_commands/', 'package', 'package/batched_commands/'])
     with open(batch_path, 'r') as f:
-        config = yaml.safe_load(f)
+        return yaml.safe_load(f)
+
+def simulate_with_results(results, *args, **kwargs):
+    """Run the simulator, and put anything it reports once the game is finished onto the ``results`` queue."""
+    from ev3sim.single_run import single_run as sim
+    results.put(sim(*args, **kwargs))
+
+def wait_for_server(bind_addr, timeout=30):
+    """Wait for the gRPC server at ``bind_addr`` to start accepting connections, or for ``timeout`` seconds to pass."""
+    import grpc
+    with grpc.insecure_channel(bind_addr) as channel:
+        try:
+            grpc.channel_ready_future(channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            print(f"The simulator at {bind_addr} did not start within {timeout} seconds.")
+
+def run_batch(config, bind_addr, **kwargs):
+    """
+    Run the simulator and attach all scripts specified in a batched command, then wait for the simulator to exit.
+
+    :returns: The results reported by the simulation, or ``None`` if it didn't report any.
+    """
+    from ev3sim.attach import main as attach
 
     bot_paths = [x['name'] for x in config['bots']]
-    sim_process = Process(target=sim, args=[config['preset_file'], bot_paths, bind_addr])
+    results = processes.Queue()
+    sim_process = processes.Process(target=simulate_with_results, args=[results, config['preset_file'], bot_paths, bind_addr], kwargs=kwargs)
 
     script_processes = []
     for i, bot in enumerate(config['bots']):
         for script in bot.get('scripts', []):
-            script_processes.append(Process(target=attach, kwargs={
+            script_processes.append(processes.Process(target=attach, kwargs={
                 'passed_args': ['Useless', '--send_logs', '--simulator_addr', bind_addr, script, f"Robot-{i}"]
             }))
 
     sim_process.start()
-    time.sleep(0.5) # Give the gRPC server 500ms to start
+    wait_for_server(bind_addr)
     for p in script_processes:
         p.start()
 
@@ -32,3 +58,63 @@ def batched_run(batch_file, bind_addr):
     sim_process.join()
     for p in script_processes:
         p.terminate()
+    return None if results.empty() else results.get()
+
+def batched_run(batch_file, bind_addr, headless=False, fast_forward=False, lockstep=False, profile=False):
+    run_batch(load_batch(batch_file), bind_addr, headless=headless, fast_forward=fast_forward, lockstep=lockstep, profile=profile)
+
+def play_match(match, index, count, bind_addr):
+    """Run match number ``index`` (of ``count``) of a tournament, headless, fast forwarded and in lockstep, and return its results."""
+    print(f"Starting match {index+1} of {count}.")
+    results = run_batch(
+        match,
+        bind_addr,
+        headless=True,
+        fast_forward=True,
+        lockstep=True,
+        wait_for_attach=[f'Robot-{i}' for i, bot in enumerate(match['bots']) if bot.get('scripts')],
+        quit_when_finished=True,
+    )
+    if results:
+        print(f"Match {index+1} finished: " + ' - '.join(f"{name} {score}" for name, score in zip(results['team_names'], results['team_scores'])))
+    else:
+        print(f"Match {index+1} did not finish.")
+    return results
+
+def tournament_run(tournament_file, bind_addr, workers=None, results_file='tournament_results.csv'):
+    """
+    Run every match in a tournament file, ``workers`` matches at a time, and write the final scores of each to ``results_file``.
+
+    Every match is run headless, fast forwarded and in lockstep, on its own port counting up from the one in ``bind_addr``.
+    """
+    config = load_batch(tournament_file)
+    matches = []
+    for match in config['matches']:
+        if isinstance(match, str):
+            match = load_batch(match)
+        match.setdefault('preset_file', config.get('preset_file', 'soccer.yaml'))
+        matches.append(match)
+    host, port = bind_addr.rsplit(':', 1)
+    workers = workers or config.get('workers') or os.cpu_count()
+
+    # Each worker process runs one match at a time, starting the simulator and scripts for it from its main thread.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=processes) as executor:
+        all_results = list(executor.map(
+            play_match,
+            matches,
+            range(len(matches)),
+            [len(matches)] * len(matches),
+            [f'{host}:{int(port) + index}' for index in range(len(matches))],
+        ))
+
+    max_teams = max((len(results['team_scores']) for results in all_results if results), default=0)
+    with open(results_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['match', 'bots'] + [column for x in range(max_teams) for column in (f'team_{x+1}', f'score_{x+1}')])
+        for index, (match, results) in enumerate(zip(matches, all_results)):
+            row = [index+1, '; '.join(f"{bot['name']}: {' '.join(bot.get('scripts', []))}" for bot in match['bots'])]
+            if results:
+                for name, score in zip(results['team_names'], results['team_scores']):
+                    row.extend([name, score])
+            writer.writerow(row)
+    print(f"Results for {len(matches)} matches written to {results_file}.")
@@ -1,6 +1,14 @@
 is_ev3 = True
 is_sim = False
 
+def dropped_ticks():
+    """
+    How many ticks of sensor data the simulator has dropped because this script was too slow to receive them, so that it can tell it is lagging.
+
+    A physical robot always reads its sensors directly, so this is always 0 on the brick.
+    """
+    return 0
+
 class CommServer:
     """
     Communications Server. Allows other bots to connect via a CommClient.
@@ -47,7 +55,7 @@ class CommClient:
         self.socket.send(data)
     
     def recv(self, limit):
-        self.socket.recv(limit)
+        return self.socket.recv(limit)
 
     def close(self):
         self.socket.close()
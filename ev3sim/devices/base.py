@@ -11,6 +11,10 @@ from ev3sim.file_helper import find_abs
 class Device:
 
     device_type = 'CHANGE_ME'
+    # Whether anything might read this device, so its readings need to be kept up to date (see ``RobotInteractor.useDevices``).
+    in_use = True
+    # The key the readings were last calculated for (see ``_readingsKey``).
+    _readings_key = None
 
     def __init__(self, parent, relativePos, relativeRot):
         # parent is the physics object containing this device.
@@ -33,15 +37,40 @@ class Device:
     def toObject(self):
         raise NotImplementedError("Implement the toObject method.")
 
+    def writeHandlers(self):
+        """The attributes which scripts can write to, and the function applying a write of each (called with the value written)."""
+        raise NotImplementedError("Implement the writeHandlers method.")
+
     def applyWrite(self, attribute, value):
-        raise NotImplementedError("Implement the applyWrite method.")
+        handlers = self.writeHandlers()
+        if attribute not in handlers:
+            raise ValueError(f'Unhandled write! {attribute} {value}')
+        handlers[attribute](value)
 
     def _getObjName(self, port):
         return port
 
+    def _readingsKey(self):
+        """
+        Everything the readings of this device depend on, such as the versions of the objects it can sense (see ``PhysicsObject.version``),
+        or ``None`` if they need recalculating every tick.
+        """
+        return None
+
+    def _readingsStale(self):
+        """Whether the readings need recalculating, as their key has changed since they were last calculated. Call just before recalculating."""
+        key = self._readingsKey()
+        if key is None or key != self._readings_key:
+            self._readings_key = key
+            return True
+        return False
+
 class IDeviceInteractor(IInteractor):
 
     name = 'UNNAMED'
+    # Whether devices of this interactor only need updating while they are in use (see ``Device.in_use``).
+    # Lazy interactors should skip devices which aren't in use in ``tickAll``, and calculate their readings in ``refresh`` instead.
+    LAZY = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -78,6 +107,138 @@ class IDeviceInteractor(IInteractor):
             )
             obj.rotation = self.physical_object.rotation + self.relative_rotation
 
+    def refresh(self):
+        """Bring this device up to date straight away, as it has just come into use. Only called for ``LAZY`` interactors."""
+        self.afterPhysics()
+
+    @classmethod
+    def tickAll(cls, group, tick):
+        """
+        Tick every interactor of this class at once. Called by the ``DeviceSystem`` once every tick, in place of ``tick``.
+
+        Override this to handle all devices of a type in a few vectorized passes.
+
+        :param DeviceGroup group: The interactors to tick, and anything kept about them between ticks.
+        """
+        for interactor in group.interactors:
+            interactor.tick(tick)
+
+    @classmethod
+    def afterPhysicsAll(cls, group):
+        """
+        Move the elements of every interactor of this class to follow their physical objects. Called by the ``DeviceSystem`` once every tick, in place of ``afterPhysics``.
+
+        :param DeviceGroup group: The interactors to update, and anything kept about them between ticks.
+        """
+        if group.poses is None:
+            group.poses = DevicePoses(group.interactors)
+        group.poses.update()
+
+class DevicePoses:
+    """
+    The elements of many device interactors, with their positions relative to the physical objects they are attached to stored as arrays,
+    so that all of them can be moved in one pass.
+    """
+
+    def __init__(self, interactors):
+        self.objects = []
+        self.parents = []
+        parent_indices = {}
+        parent_index = []
+        offsets = []
+        rotations = []
+        for interactor in interactors:
+            if id(interactor.physical_object) not in parent_indices:
+                parent_indices[id(interactor.physical_object)] = len(self.parents)
+                self.parents.append(interactor.physical_object)
+            for i, obj in enumerate(interactor.generated):
+                self.objects.append(obj)
+                parent_index.append(parent_indices[id(interactor.physical_object)])
+                offsets.append(interactor.relative_location + local_space_to_world_space(interactor.relative_positions[i], interactor.relative_rotation, np.array([0, 0])))
+                rotations.append(interactor.relative_rotation)
+        self.parent_index = np.array(parent_index, dtype=int)
+        self.offsets = np.array(offsets, dtype=float).reshape(-1, 2)
+        self.rotations = np.array(rotations, dtype=float)
+
+    def update(self):
+        if not self.objects:
+            return
+        parent_positions = np.array([parent.position[:2] for parent in self.parents], dtype=float)[self.parent_index]
+        parent_rotations = np.array([parent.rotation for parent in self.parents], dtype=float)[self.parent_index]
+        cos, sin = np.cos(parent_rotations), np.sin(parent_rotations)
+        positions = parent_positions + np.stack([
+            self.offsets[:, 0] * cos - self.offsets[:, 1] * sin,
+            self.offsets[:, 1] * cos + self.offsets[:, 0] * sin,
+        ], axis=-1)
+        rotations = parent_rotations + self.rotations
+        for obj, position, rotation in zip(self.objects, positions, rotations.tolist()):
+            obj.position = position
+            obj.rotation = rotation
+
+class DeviceGroup:
+    """All device interactors of one class, along with anything the class wants to keep about them between ticks (such as arrays of their state)."""
+
+    def __init__(self):
+        self.interactors = []
+        self.poses = None
+
+    def inUse(self):
+        """The interactors whose devices are in use, and so need their readings calculated."""
+        return [interactor for interactor in self.interactors if interactor.device_class.in_use]
+
+class DeviceSystem(IInteractor):
+    """
+    Acts on behalf of every device interactor, grouped by class, so that each type of device can be handled in a few vectorized passes
+    rather than dozens of separate ``tick`` and ``afterPhysics`` calls (see ``IDeviceInteractor.tickAll``).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.groups = {}
+
+    @classmethod
+    def register(cls, interactor):
+        """Add a device interactor to the device system of the current simulation, creating it if necessary."""
+        system = getattr(ScriptLoader.instance, 'device_system', None)
+        if system is None:
+            system = ScriptLoader.instance.device_system = cls()
+            # Device interactors always act first.
+            ScriptLoader.instance.active_scripts.insert(0, system)
+        if type(interactor) not in system.groups:
+            system.groups[type(interactor)] = DeviceGroup()
+        system.groups[type(interactor)].interactors.append(interactor)
+
+    def startUp(self):
+        for group in self.groups.values():
+            for interactor in group.interactors:
+                interactor.constants = self.constants
+                interactor.startUp()
+
+    def tick(self, tick):
+        profiler = ScriptLoader.instance.profiler
+        for klass, group in self.groups.items():
+            klass.tickAll(group, tick)
+            profiler.lap('tick', group.interactors[0])
+        return False
+
+    def afterPhysics(self):
+        profiler = ScriptLoader.instance.profiler
+        for klass, group in self.groups.items():
+            # Elements of devices nobody is reading can stay where they are, until one comes into use.
+            if not klass.LAZY or group.inUse():
+                klass.afterPhysicsAll(group)
+            profiler.lap('afterPhysics', group.interactors[0])
+
+    def handleEvent(self, event):
+        for group in self.groups.values():
+            for interactor in group.interactors:
+                interactor.handleEvent(event)
+
+    def tearDown(self):
+        for group in self.groups.values():
+            for interactor in group.interactors:
+                interactor.tearDown()
+
 def initialise_device(deviceData, parentObj, index):
     classes = find_abs('devices/classes.yaml')
     devices = yaml.safe_load(open(classes, 'r'))
@@ -111,8 +272,7 @@ def initialise_device(deviceData, parentObj, index):
                 if not hasattr(parentObj, 'device_interactors'):
                     parentObj.device_interactors = []
                 parentObj.device_interactors.append(interactor)
-                # Device interactors always act first.
-                ScriptLoader.instance.active_scripts.insert(0, interactor)
+                DeviceSystem.register(interactor)
         except yaml.YAMLError as exc:
             print(f"An error occured while loading devices. Exited with error: {exc}")
         
\ No newline at end of file
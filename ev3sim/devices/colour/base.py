@@ -1,4 +1,3 @@
-import random
 import numpy as np
 
 class ColourSensorMixin:
@@ -11,31 +10,26 @@ class ColourSensorMixin:
     SENSOR_RADIUS = 1
     SENSOR_POINTS = 100
 
-    def _SenseValueAboutPosition(self, centrePosition, valueGetter):
-        # Randomly sample value from SENSOR_POINTS chosen around the centrePosition.
-        points = [
-            random.random()*self.SENSOR_RADIUS
-            for _ in range(self.SENSOR_POINTS)
-        ]
-        for x in range(len(points)):
-            angle = random.random() * 2 * np.pi
-            points[x] = valueGetter(np.array([np.cos(angle)*points[x], np.cos(angle)*points[x]]) + centrePosition)
-            # For some reason the color module hangs otherwise :/
-            if hasattr(points[x], 'r'):
-                points[x] = np.array([points[x].r, points[x].g, points[x].b])
-        total = points[0]
-        for x in range(1, len(points)):
-            total += points[x]
-        return total / len(points)
+    def _SamplePointsAboutPositions(self, centrePositions):
+        """
+        Randomly choose SENSOR_POINTS points within SENSOR_RADIUS of each of the centrePositions.
+
+        :param centrePositions: An (n, 2) array of positions.
+        :returns: An (n, SENSOR_POINTS, 2) array of points.
+        """
+        centrePositions = np.asarray(centrePositions, dtype=float).reshape(-1, 1, 2)
+        distances = np.random.random((centrePositions.shape[0], self.SENSOR_POINTS)) * self.SENSOR_RADIUS
+        angles = np.random.random((centrePositions.shape[0], self.SENSOR_POINTS)) * 2 * np.pi
+        return centrePositions + np.stack([np.cos(angles) * distances, np.sin(angles) * distances], axis=-1)
 
     def _getObjName(self, port):
         return 'sensor' + port
 
-    def applyWrite(self, attribute, value):
-        if attribute == 'mode':
-            self.mode = value
-        else:
-            raise ValueError(f'Unhandled write! {attribute} {value}')
+    def writeHandlers(self):
+        return {'mode': self._writeMode}
+
+    def _writeMode(self, value):
+        self.mode = value
 
     def toObject(self):
         res = self.raw()
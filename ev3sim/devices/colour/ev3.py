@@ -3,22 +3,34 @@ from ev3sim.devices.base import Device, IDeviceInteractor
 from ev3sim.devices.colour.base import ColourSensorMixin
 from ev3sim.simulation.loader import ScriptLoader
 from ev3sim.visual.manager import ScreenObjectManager
-from ev3sim.visual.utils import worldspace_to_screenspace
 
 class ColorInteractor(IDeviceInteractor):
     
     name = 'COLOUR'
+    LAZY = True
 
     def tick(self, tick):
         if tick == -1:
             self.device_class.saved_raw = (0, 0, 0)
-        try:
-            self.device_class._calc_raw()
-            ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = self.device_class.rgb()
-        except:
-            pass
+        self.device_class._calc_raw()
+        ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = self.device_class.rgb()
         return False
 
+    def refresh(self):
+        super().refresh()
+        ColorSensor._calc_raw_all([self.device_class])
+        self.device_class._readings_key = self.device_class._readingsKey()
+        ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = self.device_class.rgb()
+
+    @classmethod
+    def tickAll(cls, group, tick):
+        interactors = [interactor for interactor in group.inUse() if interactor.device_class._readingsStale()]
+        if not interactors:
+            return
+        ColorSensor._calc_raw_all([interactor.device_class for interactor in interactors])
+        for interactor in interactors:
+            ScriptLoader.instance.object_map[interactor.getPrefix() + 'light_up'].visual.fill = interactor.device_class.rgb()
+
 class ColorSensor(ColourSensorMixin, Device):
     """
     EV3 Color Sensor.
@@ -39,6 +51,9 @@ class ColorSensor(ColourSensorMixin, Device):
         self.__g_bias = random.random()*150/255 + 250/255
         self.__b_bias = random.random()*150/255 + 250/255
 
+    def _readingsKey(self):
+        return self.parent.version, ScreenObjectManager.instance.sensor_floor_version
+
     def raw(self):
         """
         Raw sensor values.
@@ -50,7 +65,17 @@ class ColorSensor(ColourSensorMixin, Device):
         return self.saved_raw
 
     def _calc_raw(self):
-        res = self._SenseValueAboutPosition(self.global_position, lambda pos: ScreenObjectManager.instance.colourAtPixel(worldspace_to_screenspace(pos)))
+        self._calc_raw_all([self])
+
+    @staticmethod
+    def _calc_raw_all(sensors):
+        """Sample the colours seen by all of the sensors, with a single lookup into the floor."""
+        points = sensors[0]._SamplePointsAboutPositions([sensor.global_position for sensor in sensors])
+        colours = ScreenObjectManager.instance.coloursAtPositions(points.reshape(-1, 2))
+        for sensor, res in zip(sensors, colours.reshape(len(sensors), -1, 3).mean(axis=1)):
+            sensor._set_raw(res)
+
+    def _set_raw(self, res):
         # These are 0-255. RAW is meant to be 0-1020 but actually more like 0-300.
         self.saved_raw = [
             int(res[0] * self.__r_bias), 
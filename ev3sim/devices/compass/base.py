@@ -21,18 +21,22 @@ class CompassSensorMixin:
     def _getObjName(self, port):
         return 'sensor' + port
 
-    def applyWrite(self, attribute, value):
-        if attribute == 'mode':
-            self.mode = value
-        elif attribute == 'command':
-            if value == 'BEGIN-CAL':
-                self._setRelative()
-            elif value == 'END-CAL':
-                pass
-            else:
-                raise ValueError(f'Unknown compass command {value}')
+    def writeHandlers(self):
+        return {
+            'mode': self._writeMode,
+            'command': self._writeCommand,
+        }
+
+    def _writeMode(self, value):
+        self.mode = value
+
+    def _writeCommand(self, value):
+        if value == 'BEGIN-CAL':
+            self._setRelative()
+        elif value == 'END-CAL':
+            pass
         else:
-            raise ValueError(f'Unhandled write! {attribute} {value}')
+            raise ValueError(f'Unknown compass command {value}')
 
     def toObject(self):
         return {
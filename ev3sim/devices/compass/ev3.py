@@ -7,10 +7,20 @@ from ev3sim.simulation.loader import ScriptLoader
 class CompassInteractor(IDeviceInteractor):
 
     name = 'COMPASS'
+    LAZY = True
 
     def tick(self, tick):
         self.device_class._calc()
         self.do_rotation = self.device_class.value() * np.pi / 180
+
+    def refresh(self):
+        super().refresh()
+        self.tick(None)
+
+    @classmethod
+    def tickAll(cls, group, tick):
+        for interactor in group.inUse():
+            interactor.tick(tick)
     
     def afterPhysics(self):
         for i, obj in enumerate(self.generated):
@@ -24,6 +34,12 @@ class CompassInteractor(IDeviceInteractor):
             else:
                 obj.rotation = self.physical_object.rotation + self.relative_rotation
 
+    @classmethod
+    def afterPhysicsAll(cls, group):
+        super().afterPhysicsAll(group)
+        for interactor in group.interactors:
+            ScriptLoader.instance.object_map[interactor.getPrefix() + 'relative_north'].rotation = interactor.device_class.global_rotation - interactor.do_rotation
+
 class CompassSensor(CompassSensorMixin, Device):
     """
     EV3 Compass Sensor, calculates the bearing of the device relative to some direction (which can be specified).
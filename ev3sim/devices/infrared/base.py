@@ -1,4 +1,3 @@
-import math
 import numpy as np
 from ev3sim.objects.base import objectFactory
 from ev3sim.simulation.world import World
@@ -27,46 +26,47 @@ class InfraredSensorMixin:
 
     MAX_STRENGTH = 9
 
-    def _sensorStrength(self, relativeBearing, distance):
-        while relativeBearing > np.pi:
-            relativeBearing -= 2*np.pi
-        while relativeBearing < -np.pi:
-            relativeBearing += 2*np.pi
-        if distance > self.MAX_SENSOR_RANGE:
-            return 0
-        if abs(relativeBearing) > self.SENSOR_BEARING_DROPOFF_MAX:
-            return 0
+    def _sensorValues(self, relativeBearings, distances):
+        """
+        Compute the strength seen by each subsensor, for many sensors at once.
+
+        :param relativeBearings: The bearing of the ball relative to each sensor, as an array of length n.
+        :param distances: The distance from each sensor to the ball, as an array of length n.
+        :returns: An (n, 5) integer array of subsensor strengths, left to right.
+        """
+        distances = np.asarray(distances, dtype=float).reshape(-1, 1)
+        bearings = np.asarray(relativeBearings, dtype=float).reshape(-1, 1) - np.array(self.SENSOR_BEARINGS)
+        # Wrap to [-pi, pi).
+        bearings = (bearings + np.pi) % (2 * np.pi) - np.pi
         # At halfway to the sensor, this value is 1/4.
-        sq_dist = pow(distance / self.MAX_SENSOR_RANGE, 2)
+        sq_dist = np.power(distances / self.MAX_SENSOR_RANGE, 2)
         exclude_bearing = (1 - sq_dist) * 9
-        bearing_mult = 1 - abs(relativeBearing) / self.SENSOR_BEARING_DROPOFF_MAX
-        return int(math.floor(exclude_bearing * bearing_mult + 0.5))
-
-    def _sensorValues(self, relativeBearing, distance):
-        return [
-            self._sensorStrength(relativeBearing-b, distance)
-            for b in self.SENSOR_BEARINGS
-        ]
+        bearing_mult = 1 - np.abs(bearings) / self.SENSOR_BEARING_DROPOFF_MAX
+        strengths = np.floor(exclude_bearing * bearing_mult + 0.5).astype(int)
+        visible = (distances <= self.MAX_SENSOR_RANGE) & (np.abs(bearings) <= self.SENSOR_BEARING_DROPOFF_MAX)
+        return np.where(visible, strengths, 0)
 
     def _predict(self, sensorValues):
-        total = sum(sensorValues)
-        if total <= 4:
-            return 0
-        weighted = sum([
-            i*v / total
-            for i, v in enumerate(sensorValues)
-        ])
+        """
+        Crude direction predictions from the subsensor strengths of many sensors at once.
+
+        :param sensorValues: An (n, 5) array, as returned by ``_sensorValues``.
+        :returns: An integer array of length n, with 0 where the ball is lost and 1-9 otherwise.
+        """
+        total = sensorValues.sum(axis=1)
+        weighted = (sensorValues * np.arange(sensorValues.shape[1])).sum(axis=1) / np.maximum(total, 1)
         # weighted is between 0 and len(sensorValues)-1.
-        return int(max(min(1 + math.floor(weighted / (len(sensorValues)-1) * 9), 9), 1))
+        prediction = np.clip(1 + np.floor(weighted / (sensorValues.shape[1]-1) * 9), 1, 9).astype(int)
+        return np.where(total <= 4, 0, prediction)
 
     def _getObjName(self, port):
         return 'sensor' + port
 
-    def applyWrite(self, attribute, value):
-        if attribute == 'mode':
-            self.mode = value
-        else:
-            raise ValueError(f'Unhandled write! {attribute} {value}')
+    def writeHandlers(self):
+        return {'mode': self._writeMode}
+
+    def _writeMode(self, value):
+        self.mode = value
 
     def toObject(self):
         data = {
@@ -1,5 +1,4 @@
 import numpy as np
-from ev3sim.objects.utils import magnitude_sq
 from ev3sim.devices.base import IDeviceInteractor, Device
 from ev3sim.devices.infrared.base import InfraredSensorMixin
 from ev3sim.simulation.loader import ScriptLoader
@@ -7,21 +6,33 @@ from ev3sim.simulation.loader import ScriptLoader
 class InfraredInteractor(IDeviceInteractor):
 
     name = 'INFRARED'
+    LAZY = True
 
     def startUp(self):
         super().startUp()
         self.tracking_ball = ScriptLoader.instance.object_map['IR_BALL']
 
     def tick(self, tick):
-        ball_pos = self.tracking_ball.position
-        sensor = ScriptLoader.instance.object_map[self.getPrefix() + 'light_up_2']
-        distance = np.sqrt(magnitude_sq(ball_pos - sensor.position))
-        vector = ball_pos - sensor.position
-        relative_bearing = np.arctan2(vector[1], vector[0]) - sensor.rotation
-        self.device_class._calc(relative_bearing, distance)
+        InfraredSensor._calc_all([self])
+        self.updateLights()
+        return False
+
+    def refresh(self):
+        super().refresh()
+        self.tick(None)
+
+    @classmethod
+    def tickAll(cls, group, tick):
+        interactors = [interactor for interactor in group.inUse() if interactor.device_class._readingsStale()]
+        if not interactors:
+            return
+        InfraredSensor._calc_all(interactors)
+        for interactor in interactors:
+            interactor.updateLights()
+
+    def updateLights(self):
         for x in range(5):
             ScriptLoader.instance.object_map[self.getPrefix() + f'light_up_{x}'].visual.fill = (max(min(255 * self.device_class.value(x+1) / 9, 255), 0), 0, 0)
-        return False
 
 class InfraredSensor(InfraredSensorMixin, Device):
     """
@@ -31,8 +42,32 @@ class InfraredSensor(InfraredSensorMixin, Device):
     It has one method, `value`, whose input can be 0-6, returning different sensor data.
     """
 
+    def _readingsKey(self):
+        return self.parent.version, self._interactor.tracking_ball.version
+
     def _calc(self, relativeBearing, distance):
-        self._values = self._sensorValues(relativeBearing, distance)
+        self._store(self._sensorValues(relativeBearing, distance))
+
+    @staticmethod
+    def _calc_all(interactors):
+        """Calculate the readings of every sensor at once, from the current positions of the sensors and the balls they track."""
+        sensors = [ScriptLoader.instance.object_map[interactor.getPrefix() + 'light_up_2'] for interactor in interactors]
+        vectors = np.array([interactor.tracking_ball.position - sensor.position for interactor, sensor in zip(interactors, sensors)])
+        distances = np.hypot(vectors[:, 0], vectors[:, 1])
+        relative_bearings = np.arctan2(vectors[:, 1], vectors[:, 0]) - np.array([sensor.rotation for sensor in sensors])
+        values = interactors[0].device_class._sensorValues(relative_bearings, distances)
+        predictions = interactors[0].device_class._predict(values)
+        for interactor, sensor_values, prediction in zip(interactors, values, predictions):
+            interactor.device_class._store(sensor_values, prediction)
+
+    def _store(self, values, prediction=None):
+        # Cache everything that can be read, until the next calculation.
+        values = values.reshape(-1)
+        if prediction is None:
+            prediction = self._predict(values.reshape(1, -1))[0]
+        self._values = values.tolist()
+        self._prediction = int(prediction)
+        self._average = int(sum(self._values) / len(self._values))
     
     def value(self, index):
         """
@@ -63,9 +98,9 @@ class InfraredSensor(InfraredSensorMixin, Device):
         ```
         """
         if index == 0:
-            return self._predict(self._values)
+            return self._prediction
         if 1 <= index <= 5:
             return self._values[index-1]
         if index == 6:
-            return int(sum(self._values) / len(self._values))
+            return self._average
         raise ValueError(f"Unknown value index {index}, should be an integer from 0-6.")
\ No newline at end of file
@@ -1,12 +1,13 @@
 import numpy as np
-from ev3sim.simulation.loader import ScriptLoader
 
 class MotorMixin:
 
     MAX_FORCE = 10000
-    time_wait = -1
 
-    applied_force = 0
+    # The applied force and time left to wait of a motor are kept together in a small array, so that the
+    # MotorInteractor can gather every motor's state into one array and update them all at once.
+    FORCE_INDEX = 0
+    TIME_WAIT_INDEX = 1
 
     device_type = 'tacho-motor'
     command = 'None'
@@ -17,14 +18,25 @@ class MotorMixin:
     position_sp = 0
     counts_per_rot = 3
 
-    def _updateTime(self, tick):
-        if self.time_wait > 0:
-            self.time_wait -= 1 / ScriptLoader.instance.GAME_TICK_RATE
-            if self.time_wait <= 0:
-                self.off()
-    
-    def _applyMotors(self, object, position, rotation):
-        object.apply_force(self.applied_force * np.array([np.cos(rotation), np.sin(rotation)]), pos=position)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._state = np.array([0.0, -1.0])
+
+    @property
+    def applied_force(self):
+        return float(self._state[self.FORCE_INDEX])
+
+    @applied_force.setter
+    def applied_force(self, value):
+        self._state[self.FORCE_INDEX] = value
+
+    @property
+    def time_wait(self):
+        return float(self._state[self.TIME_WAIT_INDEX])
+
+    @time_wait.setter
+    def time_wait(self, value):
+        self._state[self.TIME_WAIT_INDEX] = value
 
     def on(self, speed, **kwargs):
         """
@@ -84,31 +96,41 @@ class MotorMixin:
             'count_per_rot': self.counts_per_rot,
             'driver_name': self.driver_name,
             'max_speed': 100,
-            'speed_sp': self.speed_sp,
+            'speed_sp': int(self.speed_sp),
             'state': self.state,
             'stop_action': self.stop_action,
             'time_sp': self.time_sp,
         }
 
-    def applyWrite(self, attribute, value):
-        if attribute == 'time_sp':
-            self.time_sp = int(value)
-        elif attribute == 'speed_sp':
-            self.speed_sp = float(value)
-        elif attribute == 'position_sp':
-            self.position_sp = float(value)
-        elif attribute == 'stop_action':
-            self.stop_action = value
-        elif attribute == 'command':
-            if value == 'run-forever':
-                self.on(self.speed_sp, stop_action=self.stop_action)
-            elif value == 'run-timed':
-                self.on_for_seconds(self.speed_sp, self.time_sp / 1000, stop_action=self.stop_action)
-            elif value == 'run-to-rel-pos':
-                self.on_for_rotations(self.speed_sp, self.position_sp / self.counts_per_rot, stop_action=self.stop_action)
-            elif value == 'stop':
-                self.off()
-            else:
-                raise ValueError(f'Unhandled write! {attribute} {value}')
+    def writeHandlers(self):
+        return {
+            'time_sp': self._writeTimeSp,
+            'speed_sp': self._writeSpeedSp,
+            'position_sp': self._writePositionSp,
+            'stop_action': self._writeStopAction,
+            'command': self._writeCommand,
+        }
+
+    def _writeTimeSp(self, value):
+        self.time_sp = int(value)
+
+    def _writeSpeedSp(self, value):
+        self.speed_sp = float(value)
+
+    def _writePositionSp(self, value):
+        self.position_sp = float(value)
+
+    def _writeStopAction(self, value):
+        self.stop_action = value
+
+    def _writeCommand(self, value):
+        if value == 'run-forever':
+            self.on(self.speed_sp, stop_action=self.stop_action)
+        elif value == 'run-timed':
+            self.on_for_seconds(self.speed_sp, self.time_sp / 1000, stop_action=self.stop_action)
+        elif value == 'run-to-rel-pos':
+            self.on_for_rotations(self.speed_sp, self.position_sp / self.counts_per_rot, stop_action=self.stop_action)
+        elif value == 'stop':
+            self.off()
         else:
-            raise ValueError(f'Unhandled write! {attribute} {value}')
+            raise ValueError(f'Unhandled write! command {value}')
@@ -1,11 +1,8 @@
-import pygame
 import numpy as np
 from ev3sim.devices.base import Device, IDeviceInteractor
 from ev3sim.devices.motor.base import MotorMixin
-from ev3sim.objects.utils import local_space_to_world_space
 from ev3sim.simulation.loader import ScriptLoader
-from ev3sim.visual.manager import ScreenObjectManager
-from ev3sim.visual.objects import visualFactory
+from ev3sim.simulation.world import World
 
 class MotorInteractor(IDeviceInteractor):
 
@@ -15,14 +12,59 @@ class MotorInteractor(IDeviceInteractor):
             return 'LMotor'
         return 'MMotor'
 
-    def tick(self, tick):
-        self.device_class._updateTime(tick)
-        if self.device_class.applied_force > 0:
-            ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = (0, 255 * self.device_class.applied_force / self.device_class.MAX_FORCE, 0)
-        else:
-            ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = (- 255 * self.device_class.applied_force / self.device_class.MAX_FORCE, 0, 0)
-        self.device_class._applyMotors(self.physical_object, self.relative_location, self.relative_rotation)
-        return False
+    @classmethod
+    def tickAll(cls, group, tick):
+        if not hasattr(group, 'state'):
+            cls._gatherState(group)
+        state = group.state
+        force, time_wait = state[:, MotorMixin.FORCE_INDEX], state[:, MotorMixin.TIME_WAIT_INDEX]
+        waiting = time_wait > 0
+        time_wait[waiting] -= 1 / ScriptLoader.instance.GAME_TICK_RATE
+        for index in np.flatnonzero(waiting & (time_wait <= 0)):
+            group.interactors[index].device_class.off()
+        # Only the lights of motors which have changed speed need filling again.
+        ratios = force / group.max_force
+        for index in np.flatnonzero(ratios != group.light_ratios):
+            ratio = float(ratios[index])
+            group.lights[index].fill = (0, 255 * ratio, 0) if ratio > 0 else (- 255 * ratio, 0, 0)
+        group.light_ratios = ratios
+        if World.instance.paused:
+            return
+        # Sum up the force and torque each motor applies to its object, so each object only needs one update.
+        forces = force[:, np.newaxis] * group.directions
+        totals = np.zeros((len(group.objects), 3))
+        np.add.at(totals, group.object_index, np.column_stack([
+            forces,
+            group.locations[:, 0] * forces[:, 1] - group.locations[:, 1] * forces[:, 0],
+        ]))
+        for obj, (fx, fy, torque) in zip(group.objects, totals.tolist()):
+            body = obj.shape.body
+            cog = body.center_of_gravity
+            body.apply_force_at_local_point((fx, fy), cog)
+            # Torque about the centre of gravity, rather than the origin of the object.
+            body.torque += torque - (cog[0] * fy - cog[1] * fx)
+
+    @classmethod
+    def _gatherState(cls, group):
+        """Move the state of every motor into one array, and work out everything that stays the same between ticks."""
+        motors = [interactor.device_class for interactor in group.interactors]
+        group.state = np.array([motor._state for motor in motors])
+        for index, motor in enumerate(motors):
+            # Each motor now reads and writes its row of the shared array.
+            motor._state = group.state[index]
+        group.max_force = np.array([motor.MAX_FORCE for motor in motors], dtype=float)
+        group.lights = [ScriptLoader.instance.object_map[interactor.getPrefix() + 'light_up'].visual for interactor in group.interactors]
+        # The ratio each light was last filled for. NaN never compares equal, so every light is filled on the first tick.
+        group.light_ratios = np.full(len(motors), np.nan)
+        group.directions = np.array([[np.cos(interactor.relative_rotation), np.sin(interactor.relative_rotation)] for interactor in group.interactors])
+        group.locations = np.array([interactor.relative_location for interactor in group.interactors], dtype=float)
+        group.objects = []
+        object_index = []
+        for interactor in group.interactors:
+            if interactor.physical_object not in group.objects:
+                group.objects.append(interactor.physical_object)
+            object_index.append(group.objects.index(interactor.physical_object))
+        group.object_index = np.array(object_index, dtype=int)
 
 class LargeMotor(MotorMixin, Device):
 
@@ -17,38 +17,92 @@ class UltrasonicSensorMixin:
     ACCEPTANCE_LEVEL = 1
 
     def _SetIgnoredObjects(self, objs):
+        # Rays look straight through the collision group these objects are in (see ``World.assignCollisionGroup``).
         self.ignore_objects = objs
+        self._query_filter = None
+
+    def _QueryFilter(self):
+        if self._query_filter is None:
+            groups = set(shape.filter.group for obj in self.ignore_objects for shape in obj.shapes)
+            if len(groups) == 1 and 0 not in groups:
+                group = groups.pop()
+            else:
+                # The ignored objects don't share a group of their own yet, so make one.
+                group = World.instance.assignCollisionGroup(*self.ignore_objects)
+            self._query_filter = pymunk.ShapeFilter(group=group)
+        return self._query_filter
 
     def _DistanceFromSensor(self, startPosition, centreRotation):
-        top_length = self.MAX_RAYCAST
-        while top_length > 0:
-            endPosition = startPosition + top_length * np.array([np.cos(centreRotation), np.sin(centreRotation)])
-            # Ignore all ignored objects by setting the category on them.
-            cats = []
-            for obj in self.ignore_objects:
-                for shape in obj.shapes:
-                    cats.append(shape.filter.categories)
-                    shape.filter = pymunk.ShapeFilter(categories=0b1)
-            raycast = World.instance.space.segment_query_first(startPosition, endPosition, self.RAYCAST_RADIUS, pymunk.ShapeFilter(mask=pymunk.ShapeFilter.ALL_MASKS ^ 0b1))
-            i = 0
-            for obj in self.ignore_objects:
-                for shape in obj.shapes:
-                    shape.filter = pymunk.ShapeFilter(categories=cats[i])
-                    i += 1
+        direction = np.array([np.cos(centreRotation), np.sin(centreRotation)])
+        return self._DistanceAlongRay(startPosition, direction, self._QueryFilter())
 
+    @classmethod
+    def _DistanceAlongRay(cls, startPosition, direction, query_filter):
+        top_length = cls.MAX_RAYCAST
+        while top_length > 0:
+            endPosition = startPosition + top_length * direction
+            raycast = World.instance.space.segment_query_first(startPosition, endPosition, cls.RAYCAST_RADIUS, query_filter)
             if raycast == None:
                 return top_length
-            top_length = raycast.alpha * top_length - self.ACCEPTANCE_LEVEL
-        return 0                
+            top_length = raycast.alpha * top_length - cls.ACCEPTANCE_LEVEL
+        return 0
+
+    @classmethod
+    def _SensorRays(cls, sensors, startPositions, centreRotations):
+        """
+        Prepare the rays of several sensors at once, checking all of them against every shape in the world in one pass (see ``_RaysNearShapes``).
+
+        :returns: For each sensor, its ray's start, direction and query filter, and the shapes it passes near.
+        """
+        starts = np.asarray(startPositions, dtype=float).reshape(-1, 2)
+        rotations = np.asarray(centreRotations, dtype=float)
+        directions = np.stack([np.cos(rotations), np.sin(rotations)], axis=1)
+        query_filters = [sensor._QueryFilter() for sensor in sensors]
+        shapes, near = cls._RaysNearShapes(starts, directions, np.array([query_filter.group for query_filter in query_filters]))
+        return [
+            (start, direction, query_filter, [shapes[index] for index in np.flatnonzero(near_shapes)])
+            for start, direction, query_filter, near_shapes in zip(starts, directions, query_filters, near)
+        ]
+
+    @classmethod
+    def _DistancesAlongRays(cls, rays):
+        """Find the distance along each of the rays from ``_SensorRays``. Only those which pass near something are traced through the space."""
+        return np.array([
+            cls._DistanceAlongRay(start, direction, query_filter) if near_shapes else cls.MAX_RAYCAST
+            for start, direction, query_filter, near_shapes in rays
+        ], dtype=float)
+
+    @classmethod
+    def _RaysNearShapes(cls, starts, directions, groups):
+        """
+        Check which shapes each ray could hit, against the bounding box of every shape in the world.
+
+        :param starts: An (n, 2) array of where each ray starts.
+        :param directions: An (n, 2) array of the unit vector each ray points along.
+        :param groups: The collision group each ray looks straight through.
+        :returns: The shapes, and an (n, shapes) boolean array of whether each ray passes through each shape's bounding box (widened by the ray's radius).
+        """
+        shapes = World.instance.space.shapes
+        if not shapes:
+            return shapes, np.zeros((len(starts), 0), dtype=bool)
+        boxes = np.array([(shape.bb.left, shape.bb.bottom, shape.bb.right, shape.bb.top) for shape in shapes])
+        # Rays along an axis never cross the other axis' bounds, so only pass through the boxes they start level with.
+        directions = np.where(np.abs(directions) < 1e-12, 1e-12, directions)
+        low = (boxes[None, :, :2] - cls.RAYCAST_RADIUS - starts[:, None]) / directions[:, None]
+        high = (boxes[None, :, 2:] + cls.RAYCAST_RADIUS - starts[:, None]) / directions[:, None]
+        enter = np.minimum(low, high).max(axis=2)
+        leave = np.maximum(low, high).min(axis=2)
+        shape_groups = np.array([shape.filter.group for shape in shapes])
+        return shapes, (enter <= leave) & (leave >= 0) & (enter <= cls.MAX_RAYCAST) & (shape_groups[None] != groups[:, None])
 
     def _getObjName(self, port):
         return 'sensor' + port
 
-    def applyWrite(self, attribute, value):
-        if attribute == 'mode':
-            self.mode = value
-        else:
-            raise ValueError(f'Unhandled write! {attribute} {value}')
+    def writeHandlers(self):
+        return {'mode': self._writeMode}
+
+    def _writeMode(self, value):
+        self.mode = value
 
     def toObject(self):
         return {
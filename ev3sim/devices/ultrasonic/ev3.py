@@ -8,19 +8,27 @@ from ev3sim.visual.manager import ScreenObjectManager
 
 class UltrasonicInteractor(IDeviceInteractor):
 
+    LAZY = True
     UPDATE_PER_SECOND = 5
 
-    def tick(self, tick):
-        if tick == -1:
-            self.device_class.saved = 0
-        if tick % (ScriptLoader.instance.GAME_TICK_RATE // self.UPDATE_PER_SECOND) == 0:
-            self.device_class._calc()
-            ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = (
-                min(max((self.device_class.MAX_RAYCAST - self.device_class.distance_centimeters) * 255 / self.device_class.MAX_RAYCAST, 0), 255),
-                0,
-                0,
-            )
-        return False
+    def refresh(self):
+        super().refresh()
+        UltrasonicSensor._calc_all([self])
+        self.device_class._readings_key = self.device_class._readingsKey()
+        self.updateLight()
+
+    @classmethod
+    def tickAll(cls, group, tick):
+        if tick % (ScriptLoader.instance.GAME_TICK_RATE // cls.UPDATE_PER_SECOND) == 0:
+            for interactor in UltrasonicSensor._calc_all(group.inUse(), only_stale=True):
+                interactor.updateLight()
+
+    def updateLight(self):
+        ScriptLoader.instance.object_map[self.getPrefix() + 'light_up'].visual.fill = (
+            min(max((self.device_class.MAX_RAYCAST - self.device_class.distance_centimeters) * 255 / self.device_class.MAX_RAYCAST, 0), 255),
+            0,
+            0,
+        )
 
 class UltrasonicSensor(UltrasonicSensorMixin, Device):
     """
@@ -34,9 +42,39 @@ class UltrasonicSensor(UltrasonicSensorMixin, Device):
     def __init__(self, parent, relativePos, relativeRot, **kwargs):
         super().__init__(parent, relativePos, relativeRot, **kwargs)
         self._SetIgnoredObjects([parent])
+        self.saved = 0
+        # The objects the sensor's ray currently passes near (see ``_calc_all``).
+        self.nearby_objects = []
+
+    def _readingsKey(self):
+        # The sensor moves with its robot, and only objects near its ray can get in the way (or move out of it).
+        return self.parent.version, tuple((obj, obj.version) for obj in self.nearby_objects)
 
-    def _calc(self):
-        self.saved = self._DistanceFromSensor(ScriptLoader.instance.object_map[self._interactor.getPrefix() + 'light_up'].position, self.parent.rotation + self.relativeRot)
+    @staticmethod
+    def _calc_all(interactors, only_stale=False):
+        """
+        Calculate the readings of every sensor at once, measuring from the lights on the sensors.
+
+        :param only_stale: Skip the sensors whose readings are still valid (see ``_readingsKey``).
+        :returns: The interactors whose readings were calculated.
+        """
+        sensors = [interactor.device_class for interactor in interactors]
+        lights = [ScriptLoader.instance.object_map[interactor.getPrefix() + 'light_up'] for interactor in interactors]
+        rays = UltrasonicSensorMixin._SensorRays(
+            sensors,
+            [light.position for light in lights],
+            [sensor.parent.rotation + sensor.relativeRot for sensor in sensors],
+        )
+        calculated = []
+        for interactor, sensor, ray in zip(interactors, sensors, rays):
+            # Objects with several shapes only count once.
+            sensor.nearby_objects = list(dict.fromkeys(shape.obj for shape in ray[3]))
+            if not only_stale or sensor._readingsStale():
+                calculated.append((interactor, ray))
+        distances = UltrasonicSensorMixin._DistancesAlongRays([ray for _, ray in calculated])
+        for (interactor, _), distance in zip(calculated, distances):
+            interactor.device_class.saved = float(distance)
+        return [interactor for interactor, _ in calculated]
     
     @property
     def distance_centimeters(self):
@@ -82,8 +82,16 @@ class PhysicsObject(BaseObject):
 
     static: bool
 
+    # How far the object has to move (in world units and radians) before it counts as having moved (see ``version``).
+    # Objects coming to rest creep by ever smaller amounts, as their velocity is damped rather than stopped.
+    MOVE_TOLERANCE = 1e-3
+    ROTATE_TOLERANCE = 1e-4
+
     def initFromKwargs(self, **kwargs):
         super().initFromKwargs(**kwargs)
+        # Counts up every time the object moves, so anything calculated from where it is can tell when it needs recalculating.
+        self.version = 0
+        self._versioned_pose = None
         self.mass = kwargs.get('mass', 1)
         self.static = kwargs.get('static', False)
         self.friction_coefficient = kwargs.get('friction', 1)
@@ -99,9 +107,22 @@ class PhysicsObject(BaseObject):
                 self.shapes.append(child.shape)
 
     def update(self):
+        """Follow the physics body after a physics tick. Returns whether the object has moved (see ``version``)."""
         self.position = self.body.position - self.visual.getPositionAnchorOffset()
         self.rotation = self.body.angle
         self.update_velocities()
+        return self._checkMoved()
+
+    def _checkMoved(self):
+        x, y = self.body.position
+        angle = self.body.angle
+        if self._versioned_pose is not None:
+            last_x, last_y, last_angle = self._versioned_pose
+            if abs(x - last_x) <= self.MOVE_TOLERANCE and abs(y - last_y) <= self.MOVE_TOLERANCE and abs(angle - last_angle) <= self.ROTATE_TOLERANCE:
+                return False
+        self._versioned_pose = (x, y, angle)
+        self.version += 1
+        return True
 
     @stop_on_pause
     def update_velocities(self):
@@ -11,6 +11,12 @@ class PauseInteractor(IInteractor):
         if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
             # Toggle pause state.
             World.instance.paused = not World.instance.paused
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+            # Toggle running as fast as possible.
+            ScriptLoader.instance.setFastForward(not ScriptLoader.instance.FAST_FORWARD)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_t and ScriptLoader.instance.PROFILE:
+            # Print where tick time has been going recently.
+            print(ScriptLoader.instance.profiler.summary())
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             m_pos = screenspace_to_worldspace(event.pos)
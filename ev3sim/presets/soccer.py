@@ -166,6 +166,7 @@ class SoccerInteractor(IInteractor):
             # Pause the game, and make it so that further tick increases don't update the timer text.
             World.instance.paused = True
             self.update_time_text = False
+            ScriptLoader.instance.finish(team_names=list(self.names), team_scores=list(self.team_scores))
         ScriptLoader.instance.object_map['TimerText'].text = '{:02d}:{:02d}'.format(minutes, seconds)
 
     def goalScoredIn(self, teamIndex):
@@ -1,6 +1,7 @@
 from ev3sim.simulation.interactor import IInteractor
 from ev3sim.simulation.loader import ScriptLoader
-from ev3sim.simulation.world import stop_on_pause
+from ev3sim.simulation.world import World, stop_on_pause
+from ev3sim.visual.manager import ScreenObjectManager
 
 def add_devices(parent, device_info):
     devices = []
@@ -57,9 +58,24 @@ class RobotInteractor(IInteractor):
     
     def connectDevices(self):
         self.devices = {}
+        # Devices by the (device_type, name) path scripts use to write to them.
+        self.device_paths = {}
         for interactor in ScriptLoader.instance.object_map[self.robot_key].device_interactors:
             self.devices[interactor.port] = interactor.device_class
+            self.device_paths[(interactor.device_class.device_type, interactor.device_class._getObjName(interactor.port))] = interactor.device_class
+        # The function applying a write to each (device_type, name, attribute) path.
+        self.write_routes = {
+            (device_type, name, attribute): handler
+            for (device_type, name), device in self.device_paths.items()
+            for attribute, handler in device.writeHandlers().items()
+        }
+        # The devices of each device_type, by name, in the shape of collectDeviceData.
+        self.device_layout = {}
+        for (device_type, name), device in self.device_paths.items():
+            self.device_layout.setdefault(device_type, []).append((name, device))
         ScriptLoader.instance.object_map[self.robot_key].robot_class = self.robot_class
+        # Give each robot a group of its own, so that its sensors can see straight past it.
+        World.instance.assignCollisionGroup(ScriptLoader.instance.object_map[self.robot_key])
 
     def sendDeviceInitTicks(self):
         for interactor in ScriptLoader.instance.object_map[self.robot_key].device_interactors:
@@ -77,12 +93,39 @@ class RobotInteractor(IInteractor):
         self.robot_class.handleEvent(event)
 
     def collectDeviceData(self):
-        res = {}
-        for port, device in self.devices.items():
-            if device.device_type not in res:
-                res[device.device_type] = {}
-            res[device.device_type][device._getObjName(port)] = device.toObject()
-        return res
+        # A new dictionary every tick, as the last one may still be being sent.
+        return {
+            device_type: {name: device.toObject() for name, device in named}
+            for device_type, named in self.device_layout.items()
+        }
+
+    def useDevices(self, opened):
+        """
+        Mark which of this robot's devices are in use, so that sensors which nothing reads can skip calculating their readings.
+        Devices coming into use have their readings calculated straight away, so the next data collected is up to date.
+
+        :param opened: The (device_type, name) of each device the attached script has opened, or ``None`` if it could read any of them.
+        """
+        # The sensors' lights are visible in the window, and robots with their own class may read their devices themselves.
+        use_all = (
+            opened is None or not ScriptLoader.instance.LAZY_DEVICES
+            or not ScreenObjectManager.instance.headless or type(self.robot_class) is not Robot
+        )
+        for path, device in self.device_paths.items():
+            in_use = use_all or path in opened
+            if in_use and not device.in_use and device._interactor.LAZY:
+                device._interactor.refresh()
+            device.in_use = in_use
+
+    def applyWrite(self, device_type, name, attribute, value):
+        """Apply a write made by a script to the device attribute at this path."""
+        try:
+            handler = self.write_routes[(device_type, name, attribute)]
+        except KeyError:
+            # Raises the relevant error for a missing device or attribute.
+            self.robot_class.getDeviceFromPath(device_type, name).applyWrite(attribute, value)
+            return
+        handler(value)
 
 class Robot:
     """
@@ -113,10 +156,10 @@ class Robot:
             raise ValueError(f"No device on port {port} found.")
 
     def getDeviceFromPath(self, device_class, device_name):
-        for port, dev in self._interactor.devices.items():
-            if dev.device_type == device_class and dev._getObjName(port) == device_name:
-                return dev
-        raise ValueError(f"No device found with path {device_class} {device_name}")
+        try:
+            return self._interactor.device_paths[(device_class, device_name)]
+        except KeyError:
+            raise ValueError(f"No device found with path {device_class} {device_name}")
 
     def startUp(self):
         """
@@ -7,6 +7,13 @@ parser = argparse.ArgumentParser(description='Run the simulation, include some r
 parser.add_argument('--preset', '-p', type=str, help="Path of preset file to load. (You shouldn't need to change this, by default it is presets/soccer.yaml)", default='soccer.yaml', dest='preset')
 parser.add_argument('robots', nargs='+', help='Path of robots to load. Separate each robot path by a space.')
 parser.add_argument('--batch', '-b', action='store_true', help='Whether to use a batched command to run this simulation.', dest='batched')
+parser.add_argument('--tournament', '-t', action='store_true', help='Whether to run every match in a tournament file, several at a time. Matches are run headless, fast forwarded and in lockstep.', dest='tournament')
+parser.add_argument('--workers', type=int, default=None, help='How many tournament matches to run at once. Defaults to the number of CPUs.', dest='workers')
+parser.add_argument('--results', type=str, default='tournament_results.csv', help='Where to write the results table of a tournament. Default is tournament_results.csv', dest='results_file')
+parser.add_argument('--headless', action='store_true', help="Run the simulation without opening a window (useful for running matches on machines without a display).", dest='headless')
+parser.add_argument('--fast', action='store_true', help="Run game ticks as fast as possible, rather than in real time. Can be toggled while running by pressing F.", dest='fast_forward')
+parser.add_argument('--lockstep', action='store_true', help="Wait for attached scripts to acknowledge each tick before simulating the next, so that results don't depend on how busy your computer is.", dest='lockstep')
+parser.add_argument('--profile', action='store_true', help="Time each part of the simulation loop, and print a breakdown when the simulation exits. Press T (or send SIGUSR1) to print it while running.", dest='profile')
 parser.add_argument('--bind_addr', default='[::1]:50051', metavar='address:port', help="The IP address and port to run on (you shouldn't need to change this). Default is [::1]:50051 (localhost only). Use [::]:50051 to listen on all network interfaces.")
 
 def main(passed_args = None):
@@ -15,13 +22,17 @@ def main(passed_args = None):
 
     args = parser.parse_args(passed_args[1:])
 
-    if args.batched:
+    if args.tournament:
+        from ev3sim.batched_run import tournament_run
+        assert len(args.robots) == 1, "Exactly one tournament file should be provided."
+        tournament_run(args.robots[0], args.bind_addr, workers=args.workers, results_file=args.results_file)
+    elif args.batched:
         from ev3sim.batched_run import batched_run
         assert len(args.robots) == 1, "Exactly one batched command file should be provided."
-        batched_run(args.robots[0], args.bind_addr)
+        batched_run(args.robots[0], args.bind_addr, headless=args.headless, fast_forward=args.fast_forward, lockstep=args.lockstep, profile=args.profile)
     else:
         from ev3sim.single_run import single_run
-        single_run(args.preset, args.robots, args.bind_addr)
+        single_run(args.preset, args.robots, args.bind_addr, headless=args.headless, fast_forward=args.fast_forward, lockstep=args.lockstep, profile=args.profile)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n#ev3sim/simulation/comm_schema.proto\x12\nserverComm\" \n\x0cRobotRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\"=\n\tRobotData\x12\x0c\n\x04tick\x18\x01 \x01(\x05\x12\x11\n\ttick_rate\x18\x02 \x01(\x05\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\"E\n\nRobotWrite\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x16\n\x0e\x61ttribute_path\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"\x1d\n\x0bWriteResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\"k\n\x0fRobotLogRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0b\n\x03log\x18\x02 \x01(\t\x12\r\n\x05print\x18\x03 \x01(\x08\x12*\n\x06source\x18\x04 \x01(\x0e\x32\x1a.serverComm.RobotLogSource\" \n\x0eRobotLogResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\"@\n\rServerRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"+\n\x0cServerResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"@\n\rClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"B\n\x0c\x43lientResult\x12\x15\n\rhost_robot_id\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"_\n\x0bSendRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\t\x12\x11\n\tclient_id\x18\x05 \x01(\t\")\n\nSendResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"Q\n\x0bRecvRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x11\n\tclient_id\x18\x04 \x01(\t\"7\n\nRecvResult\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"C\n\x10GetClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"A\n\x0fGetClientResult\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"E\n\x12\x43loseServerRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"0\n\x11\x43loseServerResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"X\n\x12\x43loseClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x11\n\tserver_id\x18\x04 \x01(\t\"0\n\x11\x43loseClientResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t*>\n\x0eRobotLogSource\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x43OMMS\x10\x01\x12\t\n\x05WRITE\x10\x02\x12\t\n\x05ROBOT\x10\x03\x32\x86\x06\n\x10SimulationDealer\x12I\n\x12RequestTickUpdates\x12\x18.serverComm.RobotRequest\x1a\x15.serverComm.RobotData\"\x00\x30\x01\x12\x42\n\rSendWriteInfo\x12\x16.serverComm.RobotWrite\x1a\x17.serverComm.WriteResult\"\x00\x12I\n\x0cSendRobotLog\x12\x1b.serverComm.RobotLogRequest\x1a\x1a.serverComm.RobotLogResult\"\x00\x12\x46\n\rRequestServer\x12\x19.serverComm.ServerRequest\x1a\x18.serverComm.ServerResult\"\x00\x12G\n\x0eRequestConnect\x12\x19.serverComm.ClientRequest\x1a\x18.serverComm.ClientResult\"\x00\x12@\n\x0bRequestSend\x12\x17.serverComm.SendRequest\x1a\x16.serverComm.SendResult\"\x00\x12@\n\x0bRequestRecv\x12\x17.serverComm.RecvRequest\x1a\x16.serverComm.RecvResult\"\x00\x12O\n\x10RequestGetClient\x12\x1c.serverComm.GetClientRequest\x1a\x1b.serverComm.GetClientResult\"\x00\x12X\n\x15\x43loseServerConnection\x12\x1e.serverComm.CloseServerRequest\x1a\x1d.serverComm.CloseServerResult\"\x00\x12X\n\x15\x43loseClientConnection\x12\x1e.serverComm.CloseClientRequest\x1a\x1d.serverComm.CloseClientResult\"\x00\x62\x06proto3'
+  serialized_pb=b'\n#ev3sim/simulation/comm_schema.proto\x12\nserverComm\"V\n\x0cRobotRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x15\n\raccept_deltas\x18\x02 \x01(\x08\x12\x1d\n\x15report_opened_devices\x18\x03 \x01(\x08\"\x8d\x01\n\tRobotData\x12\x0c\n\x04tick\x18\x01 \x01(\x05\x12\x11\n\ttick_rate\x18\x02 \x01(\x05\x12\x0f\n\x07\x63ontent\x18\x03 \x01(\t\x12\x10\n\x08lockstep\x18\x04 \x01(\x08\x12\r\n\x05\x64\x65lta\x18\x05 \x01(\t\x12\x15\n\rdropped_ticks\x18\x06 \x01(\x05\x12\x16\n\x0eopened_devices\x18\x07 \x01(\x05\"\xb3\x01\n\tMotorData\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x02 \x01(\t\x12\x15\n\rcount_per_rot\x18\x03 \x01(\x05\x12\x13\n\x0b\x64river_name\x18\x04 \x01(\t\x12\x11\n\tmax_speed\x18\x05 \x01(\x05\x12\x10\n\x08speed_sp\x18\x06 \x01(\x05\x12\r\n\x05state\x18\x07 \x01(\t\x12\x13\n\x0bstop_action\x18\x08 \x01(\t\x12\x0f\n\x07time_sp\x18\t \x01(\x05\"v\n\x10\x43olourSensorData\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x13\n\x0b\x64river_name\x18\x02 \x01(\t\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x0e\n\x06value0\x18\x04 \x01(\x05\x12\x0e\n\x06value1\x18\x05 \x01(\x05\x12\x0e\n\x06value2\x18\x06 \x01(\x05\"l\n\x14UltrasonicSensorData\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x13\n\x0b\x64river_name\x18\x02 \x01(\t\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x0e\n\x06value0\x18\x04 \x01(\x05\x12\x10\n\x08\x64\x65\x63imals\x18\x05 \x01(\x05\"\xb8\x01\n\x12InfraredSensorData\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x13\n\x0b\x64river_name\x18\x02 \x01(\t\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x0e\n\x06value0\x18\x04 \x01(\x05\x12\x0e\n\x06value1\x18\x05 \x01(\x05\x12\x0e\n\x06value2\x18\x06 \x01(\x05\x12\x0e\n\x06value3\x18\x07 \x01(\x05\x12\x0e\n\x06value4\x18\x08 \x01(\x05\x12\x0e\n\x06value5\x18\t \x01(\x05\x12\x0e\n\x06value6\x18\n \x01(\x05\"i\n\x11\x43ompassSensorData\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x13\n\x0b\x64river_name\x18\x02 \x01(\t\x12\x0c\n\x04mode\x18\x03 \x01(\t\x12\x0e\n\x06value0\x18\x04 \x01(\x05\x12\x10\n\x08\x64\x65\x63imals\x18\x05 \x01(\x05\"\x85\x01\n\x0fOtherDeviceData\x12?\n\nattributes\x18\x01 \x03(\x0b\x32+.serverComm.OtherDeviceData.AttributesEntry\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xdc\x02\n\nDeviceData\x12\x13\n\x0b\x64\x65vice_type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12&\n\x05motor\x18\x03 \x01(\x0b\x32\x15.serverComm.MotorDataH\x00\x12.\n\x06\x63olour\x18\x04 \x01(\x0b\x32\x1c.serverComm.ColourSensorDataH\x00\x12\x36\n\nultrasonic\x18\x05 \x01(\x0b\x32 .serverComm.UltrasonicSensorDataH\x00\x12\x32\n\x08infrared\x18\x06 \x01(\x0b\x32\x1e.serverComm.InfraredSensorDataH\x00\x12\x30\n\x07\x63ompass\x18\x07 \x01(\x0b\x32\x1d.serverComm.CompassSensorDataH\x00\x12,\n\x05other\x18\x08 \x01(\x0b\x32\x1b.serverComm.OtherDeviceDataH\x00\x42\x07\n\x05state\"\x99\x01\n\x0cRobotDevices\x12\x0c\n\x04tick\x18\x01 \x01(\x05\x12\x11\n\ttick_rate\x18\x02 \x01(\x05\x12\x10\n\x08lockstep\x18\x03 \x01(\x08\x12\'\n\x07\x64\x65vices\x18\x04 \x03(\x0b\x32\x16.serverComm.DeviceData\x12\x15\n\rdropped_ticks\x18\x05 \x01(\x05\x12\x16\n\x0eopened_devices\x18\x06 \x01(\x05\"E\n\nRobotWrite\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x16\n\x0e\x61ttribute_path\x18\x02 \x01(\t\x12\r\n\x05value\x18\x03 \x01(\t\"R\n\x0b\x44\x65viceWrite\x12\x13\n\x0b\x64\x65vice_type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tattribute\x18\x03 \x01(\t\x12\r\n\x05value\x18\x04 \x01(\t\"\x8f\x01\n\x0fRobotWriteBatch\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\'\n\x06writes\x18\x02 \x03(\x0b\x32\x17.serverComm.DeviceWrite\x12\x0b\n\x03\x61\x63k\x18\x03 \x01(\x08\x12\x0c\n\x04tick\x18\x04 \x01(\x05\x12&\n\x06opened\x18\x05 \x03(\x0b\x32\x16.serverComm.DevicePath\"/\n\nDevicePath\x12\x13\n\x0b\x64\x65vice_type\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x1d\n\x0bWriteResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\"k\n\x0fRobotLogRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0b\n\x03log\x18\x02 \x01(\t\x12\r\n\x05print\x18\x03 \x01(\x08\x12*\n\x06source\x18\x04 \x01(\x0e\x32\x1a.serverComm.RobotLogSource\" \n\x0eRobotLogResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\"@\n\rServerRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"+\n\x0cServerResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"@\n\rClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"B\n\x0c\x43lientResult\x12\x15\n\rhost_robot_id\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"_\n\x0bSendRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\t\x12\x11\n\tclient_id\x18\x05 \x01(\t\")\n\nSendResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"`\n\x0bRecvRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x11\n\tclient_id\x18\x04 \x01(\t\x12\r\n\x05limit\x18\x05 \x01(\x05\"7\n\nRecvResult\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"C\n\x10GetClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"A\n\x0fGetClientResult\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x0e\n\x06result\x18\x02 \x01(\x08\x12\x0b\n\x03msg\x18\x03 \x01(\t\"E\n\x12\x43loseServerRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\"0\n\x11\x43loseServerResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t\"X\n\x12\x43loseClientRequest\x12\x10\n\x08robot_id\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\t\x12\x11\n\tserver_id\x18\x04 \x01(\t\"0\n\x11\x43loseClientResult\x12\x0e\n\x06result\x18\x01 \x01(\x08\x12\x0b\n\x03msg\x18\x02 \x01(\t*>\n\x0eRobotLogSource\x12\x0b\n\x07UNKNOWN\x10\x00\x12\t\n\x05\x43OMMS\x10\x01\x12\t\n\x05WRITE\x10\x02\x12\t\n\x05ROBOT\x10\x03\x32\xa3\x07\n\x10SimulationDealer\x12I\n\x12RequestTickUpdates\x12\x18.serverComm.RobotRequest\x1a\x15.serverComm.RobotData\"\x00\x30\x01\x12N\n\x14RequestDeviceUpdates\x12\x18.serverComm.RobotRequest\x1a\x18.serverComm.RobotDevices\"\x00\x30\x01\x12\x42\n\rSendWriteInfo\x12\x16.serverComm.RobotWrite\x1a\x17.serverComm.WriteResult\"\x00\x12K\n\x0fSendWriteStream\x12\x1b.serverComm.RobotWriteBatch\x1a\x17.serverComm.WriteResult\"\x00(\x01\x12I\n\x0cSendRobotLog\x12\x1b.serverComm.RobotLogRequest\x1a\x1a.serverComm.RobotLogResult\"\x00\x12\x46\n\rRequestServer\x12\x19.serverComm.ServerRequest\x1a\x18.serverComm.ServerResult\"\x00\x12G\n\x0eRequestConnect\x12\x19.serverComm.ClientRequest\x1a\x18.serverComm.ClientResult\"\x00\x12@\n\x0bRequestSend\x12\x17.serverComm.SendRequest\x1a\x16.serverComm.SendResult\"\x00\x12@\n\x0bRequestRecv\x12\x17.serverComm.RecvRequest\x1a\x16.serverComm.RecvResult\"\x00\x12O\n\x10RequestGetClient\x12\x1c.serverComm.GetClientRequest\x1a\x1b.serverComm.GetClientResult\"\x00\x12X\n\x15\x43loseServerConnection\x12\x1e.serverComm.CloseServerRequest\x1a\x1d.serverComm.CloseServerResult\"\x00\x12X\n\x15\x43loseClientConnection\x12\x1e.serverComm.CloseClientRequest\x1a\x1d.serverComm.CloseClientResult\"\x00\x62\x06proto3'
 )
 
 _ROBOTLOGSOURCE = _descriptor.EnumDescriptor(
@@ -53,8 +53,8 @@ _ROBOTLOGSOURCE = _descriptor.EnumDescriptor(
   ],
   containing_type=None,
   serialized_options=None,
-  serialized_start=1315,
-  serialized_end=1377,
+  serialized_start=3093,
+  serialized_end=3155,
 )
 _sym_db.RegisterEnumDescriptor(_ROBOTLOGSOURCE)
 
@@ -81,6 +81,615 @@ _ROBOTREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='accept_deltas', full_name='serverComm.RobotRequest.accept_deltas', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='report_opened_devices', full_name='serverComm.RobotRequest.report_opened_devices', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=51,
+  serialized_end=137,
+)
+
+
+_ROBOTDATA = _descriptor.Descriptor(
+  name='RobotData',
+  full_name='serverComm.RobotData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='serverComm.RobotData.tick', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick_rate', full_name='serverComm.RobotData.tick_rate', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='content', full_name='serverComm.RobotData.content', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='lockstep', full_name='serverComm.RobotData.lockstep', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='delta', full_name='serverComm.RobotData.delta', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dropped_ticks', full_name='serverComm.RobotData.dropped_ticks', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='opened_devices', full_name='serverComm.RobotData.opened_devices', index=6,
+      number=7, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=140,
+  serialized_end=281,
+)
+
+
+_MOTORDATA = _descriptor.Descriptor(
+  name='MotorData',
+  full_name='serverComm.MotorData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='address', full_name='serverComm.MotorData.address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='command', full_name='serverComm.MotorData.command', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='count_per_rot', full_name='serverComm.MotorData.count_per_rot', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='driver_name', full_name='serverComm.MotorData.driver_name', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='max_speed', full_name='serverComm.MotorData.max_speed', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='speed_sp', full_name='serverComm.MotorData.speed_sp', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='serverComm.MotorData.state', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='stop_action', full_name='serverComm.MotorData.stop_action', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='time_sp', full_name='serverComm.MotorData.time_sp', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=284,
+  serialized_end=463,
+)
+
+
+_COLOURSENSORDATA = _descriptor.Descriptor(
+  name='ColourSensorData',
+  full_name='serverComm.ColourSensorData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='address', full_name='serverComm.ColourSensorData.address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='driver_name', full_name='serverComm.ColourSensorData.driver_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mode', full_name='serverComm.ColourSensorData.mode', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value0', full_name='serverComm.ColourSensorData.value0', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value1', full_name='serverComm.ColourSensorData.value1', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value2', full_name='serverComm.ColourSensorData.value2', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=465,
+  serialized_end=583,
+)
+
+
+_ULTRASONICSENSORDATA = _descriptor.Descriptor(
+  name='UltrasonicSensorData',
+  full_name='serverComm.UltrasonicSensorData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='address', full_name='serverComm.UltrasonicSensorData.address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='driver_name', full_name='serverComm.UltrasonicSensorData.driver_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mode', full_name='serverComm.UltrasonicSensorData.mode', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value0', full_name='serverComm.UltrasonicSensorData.value0', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='decimals', full_name='serverComm.UltrasonicSensorData.decimals', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=585,
+  serialized_end=693,
+)
+
+
+_INFRAREDSENSORDATA = _descriptor.Descriptor(
+  name='InfraredSensorData',
+  full_name='serverComm.InfraredSensorData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='address', full_name='serverComm.InfraredSensorData.address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='driver_name', full_name='serverComm.InfraredSensorData.driver_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mode', full_name='serverComm.InfraredSensorData.mode', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value0', full_name='serverComm.InfraredSensorData.value0', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value1', full_name='serverComm.InfraredSensorData.value1', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value2', full_name='serverComm.InfraredSensorData.value2', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value3', full_name='serverComm.InfraredSensorData.value3', index=6,
+      number=7, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value4', full_name='serverComm.InfraredSensorData.value4', index=7,
+      number=8, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value5', full_name='serverComm.InfraredSensorData.value5', index=8,
+      number=9, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value6', full_name='serverComm.InfraredSensorData.value6', index=9,
+      number=10, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=696,
+  serialized_end=880,
+)
+
+
+_COMPASSSENSORDATA = _descriptor.Descriptor(
+  name='CompassSensorData',
+  full_name='serverComm.CompassSensorData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='address', full_name='serverComm.CompassSensorData.address', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='driver_name', full_name='serverComm.CompassSensorData.driver_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='mode', full_name='serverComm.CompassSensorData.mode', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value0', full_name='serverComm.CompassSensorData.value0', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='decimals', full_name='serverComm.CompassSensorData.decimals', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=882,
+  serialized_end=987,
+)
+
+
+_OTHERDEVICEDATA_ATTRIBUTESENTRY = _descriptor.Descriptor(
+  name='AttributesEntry',
+  full_name='serverComm.OtherDeviceData.AttributesEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='serverComm.OtherDeviceData.AttributesEntry.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='serverComm.OtherDeviceData.AttributesEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=b'8\001',
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1074,
+  serialized_end=1123,
+)
+
+_OTHERDEVICEDATA = _descriptor.Descriptor(
+  name='OtherDeviceData',
+  full_name='serverComm.OtherDeviceData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='attributes', full_name='serverComm.OtherDeviceData.attributes', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[_OTHERDEVICEDATA_ATTRIBUTESENTRY, ],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=990,
+  serialized_end=1123,
+)
+
+
+_DEVICEDATA = _descriptor.Descriptor(
+  name='DeviceData',
+  full_name='serverComm.DeviceData',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='device_type', full_name='serverComm.DeviceData.device_type', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='serverComm.DeviceData.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='motor', full_name='serverComm.DeviceData.motor', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='colour', full_name='serverComm.DeviceData.colour', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ultrasonic', full_name='serverComm.DeviceData.ultrasonic', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='infrared', full_name='serverComm.DeviceData.infrared', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='compass', full_name='serverComm.DeviceData.compass', index=6,
+      number=7, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='other', full_name='serverComm.DeviceData.other', index=7,
+      number=8, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -92,38 +701,64 @@ _ROBOTREQUEST = _descriptor.Descriptor(
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
-  ],
-  serialized_start=51,
-  serialized_end=83,
+    _descriptor.OneofDescriptor(
+      name='state', full_name='serverComm.DeviceData.state',
+      index=0, containing_type=None,
+      create_key=_descriptor._internal_create_key,
+    fields=[]),
+  ],
+  serialized_start=1126,
+  serialized_end=1474,
 )
 
 
-_ROBOTDATA = _descriptor.Descriptor(
-  name='RobotData',
-  full_name='serverComm.RobotData',
+_ROBOTDEVICES = _descriptor.Descriptor(
+  name='RobotDevices',
+  full_name='serverComm.RobotDevices',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
     _descriptor.FieldDescriptor(
-      name='tick', full_name='serverComm.RobotData.tick', index=0,
+      name='tick', full_name='serverComm.RobotDevices.tick', index=0,
       number=1, type=5, cpp_type=1, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='tick_rate', full_name='serverComm.RobotData.tick_rate', index=1,
+      name='tick_rate', full_name='serverComm.RobotDevices.tick_rate', index=1,
       number=2, type=5, cpp_type=1, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
     _descriptor.FieldDescriptor(
-      name='content', full_name='serverComm.RobotData.content', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=b"".decode('utf-8'),
+      name='lockstep', full_name='serverComm.RobotDevices.lockstep', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='devices', full_name='serverComm.RobotDevices.devices', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='dropped_ticks', full_name='serverComm.RobotDevices.dropped_ticks', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='opened_devices', full_name='serverComm.RobotDevices.opened_devices', index=5,
+      number=6, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
@@ -139,8 +774,8 @@ _ROBOTDATA = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=85,
-  serialized_end=146,
+  serialized_start=1477,
+  serialized_end=1630,
 )
 
 
@@ -185,8 +820,160 @@ _ROBOTWRITE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=148,
-  serialized_end=217,
+  serialized_start=1632,
+  serialized_end=1701,
+)
+
+
+_DEVICEWRITE = _descriptor.Descriptor(
+  name='DeviceWrite',
+  full_name='serverComm.DeviceWrite',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='device_type', full_name='serverComm.DeviceWrite.device_type', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='serverComm.DeviceWrite.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='attribute', full_name='serverComm.DeviceWrite.attribute', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='serverComm.DeviceWrite.value', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1703,
+  serialized_end=1785,
+)
+
+
+_ROBOTWRITEBATCH = _descriptor.Descriptor(
+  name='RobotWriteBatch',
+  full_name='serverComm.RobotWriteBatch',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='robot_id', full_name='serverComm.RobotWriteBatch.robot_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='writes', full_name='serverComm.RobotWriteBatch.writes', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ack', full_name='serverComm.RobotWriteBatch.ack', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tick', full_name='serverComm.RobotWriteBatch.tick', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='opened', full_name='serverComm.RobotWriteBatch.opened', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1788,
+  serialized_end=1931,
+)
+
+
+_DEVICEPATH = _descriptor.Descriptor(
+  name='DevicePath',
+  full_name='serverComm.DevicePath',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='device_type', full_name='serverComm.DevicePath.device_type', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='serverComm.DevicePath.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1933,
+  serialized_end=1980,
 )
 
 
@@ -217,8 +1004,8 @@ _WRITERESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=219,
-  serialized_end=248,
+  serialized_start=1982,
+  serialized_end=2011,
 )
 
 
@@ -270,8 +1057,8 @@ _ROBOTLOGREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=250,
-  serialized_end=357,
+  serialized_start=2013,
+  serialized_end=2120,
 )
 
 
@@ -302,11 +1089,13 @@ _ROBOTLOGRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=359,
-  serialized_end=391,
+  serialized_start=2122,
+  serialized_end=2154,
 )
 
 
+
+
 _SERVERREQUEST = _descriptor.Descriptor(
   name='ServerRequest',
   full_name='serverComm.ServerRequest',
@@ -348,8 +1137,8 @@ _SERVERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=393,
-  serialized_end=457,
+  serialized_start=2156,
+  serialized_end=2220,
 )
 
 
@@ -387,8 +1176,8 @@ _SERVERRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=459,
-  serialized_end=502,
+  serialized_start=2222,
+  serialized_end=2265,
 )
 
 
@@ -433,8 +1222,8 @@ _CLIENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=504,
-  serialized_end=568,
+  serialized_start=2267,
+  serialized_end=2331,
 )
 
 
@@ -479,8 +1268,8 @@ _CLIENTRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=570,
-  serialized_end=636,
+  serialized_start=2333,
+  serialized_end=2399,
 )
 
 
@@ -539,8 +1328,8 @@ _SENDREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=638,
-  serialized_end=733,
+  serialized_start=2401,
+  serialized_end=2496,
 )
 
 
@@ -578,8 +1367,8 @@ _SENDRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=735,
-  serialized_end=776,
+  serialized_start=2498,
+  serialized_end=2539,
 )
 
 
@@ -619,6 +1408,13 @@ _RECVREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='limit', full_name='serverComm.RecvRequest.limit', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -631,8 +1427,8 @@ _RECVREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=778,
-  serialized_end=859,
+  serialized_start=2541,
+  serialized_end=2637,
 )
 
 
@@ -677,8 +1473,8 @@ _RECVRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=861,
-  serialized_end=916,
+  serialized_start=2639,
+  serialized_end=2694,
 )
 
 
@@ -723,8 +1519,8 @@ _GETCLIENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=918,
-  serialized_end=985,
+  serialized_start=2696,
+  serialized_end=2763,
 )
 
 
@@ -769,8 +1565,8 @@ _GETCLIENTRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=987,
-  serialized_end=1052,
+  serialized_start=2765,
+  serialized_end=2830,
 )
 
 
@@ -815,8 +1611,8 @@ _CLOSESERVERREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1054,
-  serialized_end=1123,
+  serialized_start=2832,
+  serialized_end=2901,
 )
 
 
@@ -854,8 +1650,8 @@ _CLOSESERVERRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1125,
-  serialized_end=1173,
+  serialized_start=2903,
+  serialized_end=2951,
 )
 
 
@@ -907,8 +1703,8 @@ _CLOSECLIENTREQUEST = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1175,
-  serialized_end=1263,
+  serialized_start=2953,
+  serialized_end=3041,
 )
 
 
@@ -946,14 +1742,54 @@ _CLOSECLIENTRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1265,
-  serialized_end=1313,
+  serialized_start=3043,
+  serialized_end=3091,
 )
 
+_OTHERDEVICEDATA_ATTRIBUTESENTRY.containing_type = _OTHERDEVICEDATA
+_OTHERDEVICEDATA.fields_by_name['attributes'].message_type = _OTHERDEVICEDATA_ATTRIBUTESENTRY
+_DEVICEDATA.fields_by_name['motor'].message_type = _MOTORDATA
+_DEVICEDATA.fields_by_name['colour'].message_type = _COLOURSENSORDATA
+_DEVICEDATA.fields_by_name['ultrasonic'].message_type = _ULTRASONICSENSORDATA
+_DEVICEDATA.fields_by_name['infrared'].message_type = _INFRAREDSENSORDATA
+_DEVICEDATA.fields_by_name['compass'].message_type = _COMPASSSENSORDATA
+_DEVICEDATA.fields_by_name['other'].message_type = _OTHERDEVICEDATA
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['motor'])
+_DEVICEDATA.fields_by_name['motor'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['colour'])
+_DEVICEDATA.fields_by_name['colour'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['ultrasonic'])
+_DEVICEDATA.fields_by_name['ultrasonic'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['infrared'])
+_DEVICEDATA.fields_by_name['infrared'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['compass'])
+_DEVICEDATA.fields_by_name['compass'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_DEVICEDATA.oneofs_by_name['state'].fields.append(
+  _DEVICEDATA.fields_by_name['other'])
+_DEVICEDATA.fields_by_name['other'].containing_oneof = _DEVICEDATA.oneofs_by_name['state']
+_ROBOTDEVICES.fields_by_name['devices'].message_type = _DEVICEDATA
+_ROBOTWRITEBATCH.fields_by_name['writes'].message_type = _DEVICEWRITE
+_ROBOTWRITEBATCH.fields_by_name['opened'].message_type = _DEVICEPATH
 _ROBOTLOGREQUEST.fields_by_name['source'].enum_type = _ROBOTLOGSOURCE
 DESCRIPTOR.message_types_by_name['RobotRequest'] = _ROBOTREQUEST
 DESCRIPTOR.message_types_by_name['RobotData'] = _ROBOTDATA
+DESCRIPTOR.message_types_by_name['MotorData'] = _MOTORDATA
+DESCRIPTOR.message_types_by_name['ColourSensorData'] = _COLOURSENSORDATA
+DESCRIPTOR.message_types_by_name['UltrasonicSensorData'] = _ULTRASONICSENSORDATA
+DESCRIPTOR.message_types_by_name['InfraredSensorData'] = _INFRAREDSENSORDATA
+DESCRIPTOR.message_types_by_name['CompassSensorData'] = _COMPASSSENSORDATA
+DESCRIPTOR.message_types_by_name['OtherDeviceData'] = _OTHERDEVICEDATA
+DESCRIPTOR.message_types_by_name['DeviceData'] = _DEVICEDATA
+DESCRIPTOR.message_types_by_name['RobotDevices'] = _ROBOTDEVICES
 DESCRIPTOR.message_types_by_name['RobotWrite'] = _ROBOTWRITE
+DESCRIPTOR.message_types_by_name['DeviceWrite'] = _DEVICEWRITE
+DESCRIPTOR.message_types_by_name['RobotWriteBatch'] = _ROBOTWRITEBATCH
+DESCRIPTOR.message_types_by_name['DevicePath'] = _DEVICEPATH
 DESCRIPTOR.message_types_by_name['WriteResult'] = _WRITERESULT
 DESCRIPTOR.message_types_by_name['RobotLogRequest'] = _ROBOTLOGREQUEST
 DESCRIPTOR.message_types_by_name['RobotLogResult'] = _ROBOTLOGRESULT
@@ -988,6 +1824,70 @@ RobotData = _reflection.GeneratedProtocolMessageType('RobotData', (_message.Mess
   })
 _sym_db.RegisterMessage(RobotData)
 
+MotorData = _reflection.GeneratedProtocolMessageType('MotorData', (_message.Message,), {
+  'DESCRIPTOR' : _MOTORDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.MotorData)
+  })
+_sym_db.RegisterMessage(MotorData)
+
+ColourSensorData = _reflection.GeneratedProtocolMessageType('ColourSensorData', (_message.Message,), {
+  'DESCRIPTOR' : _COLOURSENSORDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.ColourSensorData)
+  })
+_sym_db.RegisterMessage(ColourSensorData)
+
+UltrasonicSensorData = _reflection.GeneratedProtocolMessageType('UltrasonicSensorData', (_message.Message,), {
+  'DESCRIPTOR' : _ULTRASONICSENSORDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.UltrasonicSensorData)
+  })
+_sym_db.RegisterMessage(UltrasonicSensorData)
+
+InfraredSensorData = _reflection.GeneratedProtocolMessageType('InfraredSensorData', (_message.Message,), {
+  'DESCRIPTOR' : _INFRAREDSENSORDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.InfraredSensorData)
+  })
+_sym_db.RegisterMessage(InfraredSensorData)
+
+CompassSensorData = _reflection.GeneratedProtocolMessageType('CompassSensorData', (_message.Message,), {
+  'DESCRIPTOR' : _COMPASSSENSORDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.CompassSensorData)
+  })
+_sym_db.RegisterMessage(CompassSensorData)
+
+OtherDeviceData = _reflection.GeneratedProtocolMessageType('OtherDeviceData', (_message.Message,), {
+
+  'AttributesEntry' : _reflection.GeneratedProtocolMessageType('AttributesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _OTHERDEVICEDATA_ATTRIBUTESENTRY,
+    '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+    # @@protoc_insertion_point(class_scope:serverComm.OtherDeviceData.AttributesEntry)
+    })
+  ,
+  'DESCRIPTOR' : _OTHERDEVICEDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.OtherDeviceData)
+  })
+_sym_db.RegisterMessage(OtherDeviceData)
+_sym_db.RegisterMessage(OtherDeviceData.AttributesEntry)
+
+DeviceData = _reflection.GeneratedProtocolMessageType('DeviceData', (_message.Message,), {
+  'DESCRIPTOR' : _DEVICEDATA,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.DeviceData)
+  })
+_sym_db.RegisterMessage(DeviceData)
+
+RobotDevices = _reflection.GeneratedProtocolMessageType('RobotDevices', (_message.Message,), {
+  'DESCRIPTOR' : _ROBOTDEVICES,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.RobotDevices)
+  })
+_sym_db.RegisterMessage(RobotDevices)
+
 RobotWrite = _reflection.GeneratedProtocolMessageType('RobotWrite', (_message.Message,), {
   'DESCRIPTOR' : _ROBOTWRITE,
   '__module__' : 'ev3sim.simulation.comm_schema_pb2'
@@ -995,6 +1895,27 @@ RobotWrite = _reflection.GeneratedProtocolMessageType('RobotWrite', (_message.Me
   })
 _sym_db.RegisterMessage(RobotWrite)
 
+DeviceWrite = _reflection.GeneratedProtocolMessageType('DeviceWrite', (_message.Message,), {
+  'DESCRIPTOR' : _DEVICEWRITE,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.DeviceWrite)
+  })
+_sym_db.RegisterMessage(DeviceWrite)
+
+RobotWriteBatch = _reflection.GeneratedProtocolMessageType('RobotWriteBatch', (_message.Message,), {
+  'DESCRIPTOR' : _ROBOTWRITEBATCH,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.RobotWriteBatch)
+  })
+_sym_db.RegisterMessage(RobotWriteBatch)
+
+DevicePath = _reflection.GeneratedProtocolMessageType('DevicePath', (_message.Message,), {
+  'DESCRIPTOR' : _DEVICEPATH,
+  '__module__' : 'ev3sim.simulation.comm_schema_pb2'
+  # @@protoc_insertion_point(class_scope:serverComm.DevicePath)
+  })
+_sym_db.RegisterMessage(DevicePath)
+
 WriteResult = _reflection.GeneratedProtocolMessageType('WriteResult', (_message.Message,), {
   'DESCRIPTOR' : _WRITERESULT,
   '__module__' : 'ev3sim.simulation.comm_schema_pb2'
@@ -1115,6 +2036,7 @@ CloseClientResult = _reflection.GeneratedProtocolMessageType('CloseClientResult'
 _sym_db.RegisterMessage(CloseClientResult)
 
 
+_OTHERDEVICEDATA_ATTRIBUTESENTRY._options = None
 
 _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   name='SimulationDealer',
@@ -1123,8 +2045,8 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=1380,
-  serialized_end=2154,
+  serialized_start=3158,
+  serialized_end=4089,
   methods=[
   _descriptor.MethodDescriptor(
     name='RequestTickUpdates',
@@ -1136,20 +2058,40 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='RequestDeviceUpdates',
+    full_name='serverComm.SimulationDealer.RequestDeviceUpdates',
+    index=1,
+    containing_service=None,
+    input_type=_ROBOTREQUEST,
+    output_type=_ROBOTDEVICES,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='SendWriteInfo',
     full_name='serverComm.SimulationDealer.SendWriteInfo',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_ROBOTWRITE,
     output_type=_WRITERESULT,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='SendWriteStream',
+    full_name='serverComm.SimulationDealer.SendWriteStream',
+    index=3,
+    containing_service=None,
+    input_type=_ROBOTWRITEBATCH,
+    output_type=_WRITERESULT,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='SendRobotLog',
     full_name='serverComm.SimulationDealer.SendRobotLog',
-    index=2,
+    index=4,
     containing_service=None,
     input_type=_ROBOTLOGREQUEST,
     output_type=_ROBOTLOGRESULT,
@@ -1159,7 +2101,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='RequestServer',
     full_name='serverComm.SimulationDealer.RequestServer',
-    index=3,
+    index=5,
     containing_service=None,
     input_type=_SERVERREQUEST,
     output_type=_SERVERRESULT,
@@ -1169,7 +2111,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='RequestConnect',
     full_name='serverComm.SimulationDealer.RequestConnect',
-    index=4,
+    index=6,
     containing_service=None,
     input_type=_CLIENTREQUEST,
     output_type=_CLIENTRESULT,
@@ -1179,7 +2121,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='RequestSend',
     full_name='serverComm.SimulationDealer.RequestSend',
-    index=5,
+    index=7,
     containing_service=None,
     input_type=_SENDREQUEST,
     output_type=_SENDRESULT,
@@ -1189,7 +2131,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='RequestRecv',
     full_name='serverComm.SimulationDealer.RequestRecv',
-    index=6,
+    index=8,
     containing_service=None,
     input_type=_RECVREQUEST,
     output_type=_RECVRESULT,
@@ -1199,7 +2141,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='RequestGetClient',
     full_name='serverComm.SimulationDealer.RequestGetClient',
-    index=7,
+    index=9,
     containing_service=None,
     input_type=_GETCLIENTREQUEST,
     output_type=_GETCLIENTRESULT,
@@ -1209,7 +2151,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CloseServerConnection',
     full_name='serverComm.SimulationDealer.CloseServerConnection',
-    index=8,
+    index=10,
     containing_service=None,
     input_type=_CLOSESERVERREQUEST,
     output_type=_CLOSESERVERRESULT,
@@ -1219,7 +2161,7 @@ _SIMULATIONDEALER = _descriptor.ServiceDescriptor(
   _descriptor.MethodDescriptor(
     name='CloseClientConnection',
     full_name='serverComm.SimulationDealer.CloseClientConnection',
-    index=9,
+    index=11,
     containing_service=None,
     input_type=_CLOSECLIENTREQUEST,
     output_type=_CLOSECLIENTRESULT,
@@ -19,11 +19,21 @@ class SimulationDealerStub(object):
                 request_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotRequest.SerializeToString,
                 response_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotData.FromString,
                 )
+        self.RequestDeviceUpdates = channel.unary_stream(
+                '/serverComm.SimulationDealer/RequestDeviceUpdates',
+                request_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotRequest.SerializeToString,
+                response_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotDevices.FromString,
+                )
         self.SendWriteInfo = channel.unary_unary(
                 '/serverComm.SimulationDealer/SendWriteInfo',
                 request_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotWrite.SerializeToString,
                 response_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.WriteResult.FromString,
                 )
+        self.SendWriteStream = channel.stream_unary(
+                '/serverComm.SimulationDealer/SendWriteStream',
+                request_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotWriteBatch.SerializeToString,
+                response_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.WriteResult.FromString,
+                )
         self.SendRobotLog = channel.unary_unary(
                 '/serverComm.SimulationDealer/SendRobotLog',
                 request_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotLogRequest.SerializeToString,
@@ -75,12 +85,24 @@ class SimulationDealerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RequestDeviceUpdates(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SendWriteInfo(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendWriteStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SendRobotLog(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -137,11 +159,21 @@ def add_SimulationDealerServicer_to_server(servicer, server):
                     request_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotRequest.FromString,
                     response_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotData.SerializeToString,
             ),
+            'RequestDeviceUpdates': grpc.unary_stream_rpc_method_handler(
+                    servicer.RequestDeviceUpdates,
+                    request_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotRequest.FromString,
+                    response_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotDevices.SerializeToString,
+            ),
             'SendWriteInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.SendWriteInfo,
                     request_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotWrite.FromString,
                     response_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.WriteResult.SerializeToString,
             ),
+            'SendWriteStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.SendWriteStream,
+                    request_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotWriteBatch.FromString,
+                    response_serializer=ev3sim_dot_simulation_dot_comm__schema__pb2.WriteResult.SerializeToString,
+            ),
             'SendRobotLog': grpc.unary_unary_rpc_method_handler(
                     servicer.SendRobotLog,
                     request_deserializer=ev3sim_dot_simulation_dot_comm__schema__pb2.RobotLogRequest.FromString,
@@ -209,6 +241,23 @@ class SimulationDealer(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def RequestDeviceUpdates(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/serverComm.SimulationDealer/RequestDeviceUpdates',
+            ev3sim_dot_simulation_dot_comm__schema__pb2.RobotRequest.SerializeToString,
+            ev3sim_dot_simulation_dot_comm__schema__pb2.RobotDevices.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def SendWriteInfo(request,
             target,
@@ -226,6 +275,23 @@ class SimulationDealer(object):
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def SendWriteStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/serverComm.SimulationDealer/SendWriteStream',
+            ev3sim_dot_simulation_dot_comm__schema__pb2.RobotWriteBatch.SerializeToString,
+            ev3sim_dot_simulation_dot_comm__schema__pb2.WriteResult.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
     @staticmethod
     def SendRobotLog(request,
             target,
@@ -0,0 +1,72 @@
+import heapq
+import itertools
+import random
+import threading
+
+class CommsLinks:
+    """
+    Models the bluetooth links between robots, so that messages take time to arrive, have limited bandwidth, and can be lost.
+
+    Each direction of each connection is its own link, which transmits one message at a time at ``bandwidth`` bytes per second.
+    A message arrives ``latency`` ticks after it has finished transmitting, unless it is lost.
+
+    Messages are submitted by the communications server, and delivered by the simulation loop as ticks pass (see ``advance``),
+    so time on the link is measured in game ticks, and pauses, slow downs and fast forwarding along with the rest of the simulation.
+    """
+
+    def __init__(self):
+        self.configure()
+        self.lock = threading.Lock()
+        self.tick = 0
+        # Messages in flight, as (arrival tick, order sent, callback).
+        self.in_flight = []
+        self.order = itertools.count()
+        # The tick each link will next be free to start transmitting.
+        self.link_free = {}
+
+    def configure(self, latency=0, bandwidth=0, max_message_size=0, loss=0, tick_rate=60):
+        """
+        :param latency: Ticks between a message finishing transmission and arriving.
+        :param bandwidth: Bytes per second each link can transmit, or 0 for no limit.
+        :param max_message_size: Largest message (in bytes) which can be sent, or 0 for no limit.
+        :param loss: Probability that any message is lost.
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.max_message_size = max_message_size
+        self.loss = loss
+        self.tick_rate = tick_rate
+
+    @property
+    def enabled(self):
+        """Whether messages are affected at all. If not, they can be delivered immediately."""
+        return bool(self.latency or self.bandwidth or self.loss)
+
+    def checkSize(self, size):
+        """Raise a ``ValueError`` if a message of ``size`` bytes is too large to send."""
+        if self.max_message_size and size > self.max_message_size:
+            raise ValueError(f"Message of {size} bytes is larger than the maximum of {self.max_message_size} bytes.")
+
+    def submit(self, link, size, callback):
+        """
+        Send a message of ``size`` bytes over ``link``.
+
+        Once the message would arrive, ``callback`` is called from the simulation thread with whether it arrived (``False`` if it was lost).
+        """
+        with self.lock:
+            start = max(self.tick, self.link_free.get(link, self.tick))
+            finish = start + (size * self.tick_rate / self.bandwidth if self.bandwidth else 0)
+            self.link_free[link] = finish
+            heapq.heappush(self.in_flight, (finish + self.latency, next(self.order), callback))
+
+    def advance(self, tick):
+        """Deliver every message due to arrive by ``tick``."""
+        due = []
+        with self.lock:
+            self.tick = tick
+            while self.in_flight and self.in_flight[0][0] <= tick:
+                due.append(heapq.heappop(self.in_flight)[2])
+            # Links which are idle don't need to be remembered.
+            self.link_free = {link: free for link, free in self.link_free.items() if free > tick}
+        for callback in due:
+            callback(random.random() >= self.loss)
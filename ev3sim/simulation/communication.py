@@ -2,7 +2,7 @@
 # To do this, run
 # python -m grpc_tools.protoc -I. --python_out=. --grpc_python_out=. ev3sim/simulation/comm_schema.proto
 
-from concurrent import futures
+import asyncio
 import logging
 
 import grpc
@@ -12,47 +12,210 @@ import ev3sim.simulation.comm_schema_pb2_grpc
 import collections
 import json
 import threading
-import time
-from queue import Queue
+from queue import Empty
 from ev3sim.simulation.loader import ScriptLoader
+from ev3sim.simulation.device_data import device_data_delta, device_data_message
 
-TICK_WAITING_TIMEOUT = 0.03
 SIM_DIED_TIME = 0.3
 
+class TickMailbox:
+    """
+    Holds the device data of the most recent ticks for one robot, until the connection sending them to the robot is ready for more.
+
+    Once ``size`` ticks are waiting the oldest is dropped for each new one, so memory stays bounded and a slow connection skips
+    straight to the newest data rather than replaying stale ticks. Dropped ticks are counted so the robot can be told it lagged.
+
+    Ticks are put in from the simulation thread, and taken out by the server's event loop, which must be the loop running when this is created.
+    """
+
+    def __init__(self, size=1):
+        self.ticks = collections.deque(maxlen=size)
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.loop = asyncio.get_running_loop()
+        self.arrived = asyncio.Event()
+        # The (device_type, name) of each device the robot has opened, if it reports them.
+        # ``None`` if it doesn't, in which case every device might be read.
+        self.opened = None
+        # How many opened devices have been reported, added to once they are in ``opened``.
+        self.opened_count = 0
+
+    def put(self, item):
+        with self.lock:
+            if len(self.ticks) == self.ticks.maxlen:
+                self.dropped += 1
+            self.ticks.append(item)
+        try:
+            self.loop.call_soon_threadsafe(self.arrived.set)
+        except RuntimeError:
+            # The server has stopped, so nothing is waiting.
+            pass
+
+    async def get(self, timeout=None):
+        """Remove and return the oldest tick waiting, waiting up to ``timeout`` seconds for one to arrive before raising ``Empty``."""
+        while True:
+            with self.lock:
+                if self.ticks:
+                    return self.ticks.popleft()
+                self.arrived.clear()
+            try:
+                await asyncio.wait_for(self.arrived.wait(), timeout)
+            except asyncio.TimeoutError:
+                raise Empty
+
+class SimulationDied(Exception):
+    """Raised while waiting on behalf of a robot, if the simulation stops in the meantime."""
+
+class ConnectionClosed(Exception):
+    """Raised while waiting on behalf of a robot, if the communications server or connection it is using is closed in the meantime."""
+
+def notify_simulation_died(data):
+    """Wake everything the server is waiting for on behalf of robots, as the simulation has stopped. Safe to call from any thread."""
+    if data.get('server_loop') is not None:
+        try:
+            data['server_loop'].call_soon_threadsafe(data['simulation_died'].set)
+        except RuntimeError:
+            # The server has already stopped.
+            pass
+
+def acknowledge_tick(data, rob_id, tick):
+    """
+    Record that ``rob_id`` has finished reacting to ``tick``, and wake the simulation if it is waiting for that (in lockstep).
+
+    Only ever called from the server's event loop, which is the only writer of ``data['tick_acks']``, so this never waits on the simulation.
+    """
+    data['tick_acks'][rob_id] = max(tick, data['tick_acks'].get(rob_id, -1))
+    data['tick_acked'].set()
+
 def start_server_with_shared_data(data, result, bind_addr):
     try:
         class SimulationDealer(ev3sim.simulation.comm_schema_pb2_grpc.SimulationDealerServicer):
-            def RequestTickUpdates(self, request, context):
-                rob_id = request.robot_id
+            """
+            Serves every robot from a single asyncio event loop, so that any number of robots can be streaming data or waiting on communications at once.
+
+            Everything in ``data['bot_communications_data']`` belongs to this loop, and is only touched from it.
+            """
+
+            def __init__(self):
+                # Notified whenever a communications server is opened, for clients waiting to connect.
+                self.servers_changed = asyncio.Condition()
+
+            async def _waitUntil(self, awaitable, closed=None):
+                """
+                Wait for ``awaitable`` to complete and return its result.
+
+                Raises ``ConnectionClosed`` if the ``closed`` event is set first, or ``SimulationDied`` if the simulation stops first.
+                """
+                task = asyncio.ensure_future(awaitable)
+                interruptions = {asyncio.ensure_future(data['simulation_died'].wait()): SimulationDied}
+                if closed is not None:
+                    interruptions[asyncio.ensure_future(closed.wait())] = ConnectionClosed
+                try:
+                    await asyncio.wait([task, *interruptions], return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    for future in (task, *interruptions):
+                        future.cancel()
+                if task.done() and not task.cancelled():
+                    return task.result()
+                for future, error in interruptions.items():
+                    if future.done() and not future.cancelled():
+                        raise error()
+
+            async def _deviceDataStream(self, rob_id, report_opened=False):
+                """
+                Register a new connection for ``rob_id``, then yield the tick, device data, number of ticks dropped so far
+                and number of opened devices kept up to date, until the connection is replaced or the simulation stops.
+
+                If ``report_opened`` is set, the robot reports each device it opens, and only those need to be kept up to date.
+                """
                 if rob_id not in data['active_count']:
                     data['active_count'][rob_id] = 0
                 data['active_count'][rob_id] += 1
-                data['bot_locks'][rob_id] = {
-                    'lock': threading.Lock()
-                }
-                data['bot_locks'][rob_id]['condition_waiting'] = threading.Condition(data['bot_locks'][rob_id]['lock'])
-                data['bot_locks'][rob_id]['condition_changing'] = threading.Condition(data['bot_locks'][rob_id]['lock'])
                 c = data['active_count'][rob_id]
-                data['data_queue'][rob_id] = Queue(maxsize=0)
-                while True:
-                    if data['active_count'][rob_id] != c:
-                        return
-                    # if no data is added for a second, then simulation has hung. Die.
-                    try:
-                        res = data['data_queue'][rob_id].get(timeout=SIM_DIED_TIME)
-                    except:
-                        return
-                    tick = data['tick']
-                    yield ev3sim.simulation.comm_schema_pb2.RobotData(tick=tick, tick_rate=ScriptLoader.instance.GAME_TICK_RATE, content=json.dumps(res))
+                mailbox = TickMailbox(ScriptLoader.instance.TICK_MAILBOX_SIZE)
+                if report_opened:
+                    mailbox.opened = set()
+                data['data_queue'][rob_id] = mailbox
+                try:
+                    while True:
+                        if data['active_count'][rob_id] != c:
+                            return
+                        # if no data is added for a second, then simulation has hung. Die.
+                        try:
+                            tick, res, opened = await mailbox.get(timeout=SIM_DIED_TIME)
+                        except Empty:
+                            if data['lockstep_waiting'].is_set():
+                                # Still waiting for a robot to acknowledge a tick, which can take up to LOCKSTEP_TIMEOUT.
+                                continue
+                            return
+                        yield tick, res, mailbox.dropped, opened
+                finally:
+                    # Stop sending data (and waiting for acknowledgements) once this connection closes, unless another has replaced it.
+                    if data['active_count'][rob_id] == c:
+                        del data['data_queue'][rob_id]
+                        data['tick_acked'].set()
 
-            def SendWriteInfo(self, request, context):
+            async def RequestTickUpdates(self, request, context):
+                stream = self._deviceDataStream(request.robot_id, request.report_opened_devices)
+                # The device data this connection has been sent so far, if it only wants to be sent what changes.
+                sent = None
+                try:
+                    async for tick, res, dropped, opened in stream:
+                        content, delta = '', ''
+                        if sent is None:
+                            content = json.dumps(res)
+                            if request.accept_deltas:
+                                sent = res
+                        else:
+                            changed = device_data_delta(sent, res)
+                            if changed:
+                                delta = json.dumps(changed)
+                                sent = res
+                        yield ev3sim.simulation.comm_schema_pb2.RobotData(tick=tick, tick_rate=ScriptLoader.instance.GAME_TICK_RATE, content=content, delta=delta, lockstep=ScriptLoader.instance.LOCKSTEP, dropped_ticks=dropped, opened_devices=opened)
+                finally:
+                    await stream.aclose()
+
+            async def RequestDeviceUpdates(self, request, context):
+                stream = self._deviceDataStream(request.robot_id, request.report_opened_devices)
+                # The attributes of each device this connection has been sent, if it only wants to be sent devices which change.
+                sent = None
+                try:
+                    async for tick, res, dropped, opened in stream:
+                        devices = []
+                        for device_type, named in res.items():
+                            for name, attributes in named.items():
+                                if sent is not None:
+                                    if sent.get((device_type, name)) == attributes:
+                                        continue
+                                    sent[(device_type, name)] = attributes
+                                devices.append(device_data_message(device_type, name, attributes))
+                        yield ev3sim.simulation.comm_schema_pb2.RobotDevices(tick=tick, tick_rate=ScriptLoader.instance.GAME_TICK_RATE, lockstep=ScriptLoader.instance.LOCKSTEP, dropped_ticks=dropped, opened_devices=opened, devices=devices)
+                        if sent is None and request.accept_deltas:
+                            sent = {(device_type, name): attributes for device_type, named in res.items() for name, attributes in named.items()}
+                finally:
+                    await stream.aclose()
+
+            async def SendWriteInfo(self, request, context):
                 rob_id = request.robot_id
-                attribute_path = request.attribute_path
-                value = request.value
-                data['write_stack'].append((rob_id, attribute_path, value))
+                device_type, name, attribute = request.attribute_path.split()
+                data['write_stack'].append((rob_id, [(device_type, name, attribute, request.value)]))
+                return ev3sim.simulation.comm_schema_pb2.WriteResult(result=True)
+
+            async def SendWriteStream(self, request_iterator, context):
+                async for batch in request_iterator:
+                    if batch.writes:
+                        # Queued as one entry, so that the whole batch is applied in the same tick.
+                        data['write_stack'].append((batch.robot_id, [(write.device_type, write.name, write.attribute, write.value) for write in batch.writes]))
+                    if batch.opened:
+                        mailbox = data['data_queue'].get(batch.robot_id)
+                        if mailbox is not None and mailbox.opened is not None:
+                            mailbox.opened.update((path.device_type, path.name) for path in batch.opened)
+                            mailbox.opened_count += len(batch.opened)
+                    if batch.ack:
+                        acknowledge_tick(data, batch.robot_id, batch.tick)
                 return ev3sim.simulation.comm_schema_pb2.WriteResult(result=True)
 
-            def SendRobotLog(self, request, context):
+            async def SendRobotLog(self, request, context):
                 if request.print:
                     tag = f'[{request.robot_id}] '
                     lines = request.log.split('\n')
@@ -62,7 +225,7 @@ def start_server_with_shared_data(data, result, bind_addr):
                     print(*message, sep='\n', end='')
                 return ev3sim.simulation.comm_schema_pb2.RobotLogResult(result=True)
 
-            def RequestServer(self, request, context):
+            async def RequestServer(self, request, context):
                 rob_id = request.robot_id
                 if request.address == 'aa:bb:cc:dd:ee:ff':
                         print(f"While this example will work, for competition bots please change the host address from {request.address} so competing bots can communicate separately.")
@@ -72,76 +235,55 @@ def start_server_with_shared_data(data, result, bind_addr):
                 data['bot_communications_data'][key] = {
                     'server_id': rob_id,
                     'connections': {},
-                    'client_queue': Queue(),
+                    'client_queue': asyncio.Queue(),
+                    'closed': asyncio.Event(),
                 }
-                for locks in data['bot_locks'].values():
-                    with locks['condition_changing']:
-                        locks['condition_waiting'].notify()
+                async with self.servers_changed:
+                    self.servers_changed.notify_all()
                 return ev3sim.simulation.comm_schema_pb2.ServerResult(result=True, msg="")
 
-            def RequestConnect(self, request, context):
+            async def _serverOpened(self, key):
+                async with self.servers_changed:
+                    await self.servers_changed.wait_for(lambda: key in data['bot_communications_data'])
+
+            async def RequestConnect(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
-                last_tick = time.time()
-                update_key = f'{rob_id}:RC'
-                data['tick_updates'][update_key] = Queue(0)
                 try:
-                    with data['bot_locks'][rob_id]['condition_waiting']:
-                        while True:
-                            if key in data['bot_communications_data']:
-                                if rob_id in data['bot_communications_data'][key]['connections'] or data['bot_communications_data'][key]['server_id'] == rob_id:
-                                    return ev3sim.simulation.comm_schema_pb2.ClientResult(result=False, host_robot_id='N/A', msg="This bot already has a connection to the server.")
-                                data['bot_communications_data'][key]['connections'][rob_id] = {
-                                    'sends': Queue(0),
-                                    'recvs': Queue(0),
-                                }
-                                data['bot_communications_data'][key]['client_queue'].put(rob_id)
-                                del data['tick_updates'][update_key]
-                                return ev3sim.simulation.comm_schema_pb2.ClientResult(result=True, host_robot_id=data['bot_communications_data'][key]['server_id'], msg="")
-                            data['bot_locks'][rob_id]['condition_waiting'].wait(TICK_WAITING_TIMEOUT)
-                            try:
-                                data['tick_updates'][update_key].get(timeout=TICK_WAITING_TIMEOUT)
-                                last_tick = time.time()
-                            except:
-                                if result._qsize():
-                                    return ev3sim.simulation.comm_schema_pb2.ClientResult(result=False, host_robot_id='N/A', msg="Simulation died.")
-                except KeyError:
-                    if update_key in data['tick_updates']:
-                        del data['tick_updates'][update_key]
-                    return ev3sim.simulation.comm_schema_pb2.ClientResult(result=False, host_robot_id='N/A', msg="Your connection was closed.")
-
-            def RequestGetClient(self, request, context):
+                    await self._waitUntil(self._serverOpened(key))
+                except SimulationDied:
+                    return ev3sim.simulation.comm_schema_pb2.ClientResult(result=False, host_robot_id='N/A', msg="Simulation died.")
+                if rob_id in data['bot_communications_data'][key]['connections'] or data['bot_communications_data'][key]['server_id'] == rob_id:
+                    return ev3sim.simulation.comm_schema_pb2.ClientResult(result=False, host_robot_id='N/A', msg="This bot already has a connection to the server.")
+                data['bot_communications_data'][key]['connections'][rob_id] = {
+                    'sends': asyncio.Queue(),
+                    'recvs': asyncio.Queue(),
+                    # Messages which have been partially received.
+                    'unread': {'sends': '', 'recvs': ''},
+                    'closed': asyncio.Event(),
+                }
+                data['bot_communications_data'][key]['client_queue'].put_nowait(rob_id)
+                return ev3sim.simulation.comm_schema_pb2.ClientResult(result=True, host_robot_id=data['bot_communications_data'][key]['server_id'], msg="")
+
+            async def RequestGetClient(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
                 if key not in data['bot_communications_data'] or data['bot_communications_data'][key]['server_id'] != rob_id:
-                    return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=False, client_id='N/A', msg="Server does not exist, or you are not the host of it.")    
-                last_tick = time.time()
-                update_key = f'{rob_id}:RGC'
-                data['tick_updates'][update_key] = Queue(0)
+                    return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=False, client_id='N/A', msg="Server does not exist, or you are not the host of it.")
+                server = data['bot_communications_data'][key]
                 try:
-                    with data['bot_communications_data'][key]['client_queue'].not_empty:
-                        while not data['bot_communications_data'][key]['client_queue']._qsize():
-                            data['bot_communications_data'][key]['client_queue'].not_empty.wait(TICK_WAITING_TIMEOUT)
-                            try:
-                                data['tick_updates'][update_key].get(timeout=TICK_WAITING_TIMEOUT)
-                                last_tick = time.time()
-                            except:
-                                if result._qsize():
-                                    return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=False, client_id='N/A', msg="Simulation died.")    
-                    c_id = data['bot_communications_data'][key]['client_queue'].get(block=False)
-                    del data['tick_updates'][update_key]
+                    c_id = await self._waitUntil(server['client_queue'].get(), server['closed'])
                     return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=True, client_id=c_id, msg="")
-                except KeyError:
-                    if update_key in data['tick_updates']:
-                        del data['tick_updates'][update_key]
+                except SimulationDied:
+                    return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=False, client_id='N/A', msg="Simulation died.")
+                except ConnectionClosed:
                     return ev3sim.simulation.comm_schema_pb2.GetClientResult(result=False, client_id='N/A', msg="Your connection was closed.")
 
-            def RequestSend(self, request, context):
+            async def RequestSend(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
                 client_id = request.client_id
                 d = request.data
-                update_key = f'{rob_id}:RS'
                 try:
                     if key not in data['bot_communications_data'] or (data['bot_communications_data'][key]['server_id'] not in (rob_id, client_id)):
                         return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg="Server on address does not exist, or the incorrect Robot ID was specified.")
@@ -151,32 +293,36 @@ def start_server_with_shared_data(data, result, bind_addr):
                         data_keys = (rob_id, 'sends')
                     if data_keys[0] not in data['bot_communications_data'][key]['connections']:
                         return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg="Server on address does not exist, or the incorrect Robot ID was specified.")
-                    data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]].put(d)
-                    # Wait for the request to be consumed.
-                    last_tick = time.time()
-                    data['tick_updates'][update_key] = Queue(0)
-                    with data['bot_locks'][rob_id]['condition_waiting']:
-                        while True:
-                            if not data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]]._qsize():
-                                del data['tick_updates'][update_key]
-                                return ev3sim.simulation.comm_schema_pb2.SendResult(result=True, msg="")
-                            data['bot_locks'][rob_id]['condition_waiting'].wait(TICK_WAITING_TIMEOUT)
-                            try:
-                                data['tick_updates'][update_key].get(timeout=TICK_WAITING_TIMEOUT)
-                                last_tick = time.time()
-                            except:
-                                if result._qsize():
-                                    return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg="Simulation died.")
-                except KeyError:
-                    if update_key in data['tick_updates']:
-                        del data['tick_updates'][update_key]
+                    connection = data['bot_communications_data'][key]['connections'][data_keys[0]]
+                    links = data['comms_links']
+                    size = len(d.encode())
+                    try:
+                        links.checkSize(size)
+                    except ValueError as e:
+                        return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg=str(e))
+                    if links.enabled:
+                        # Wait for the simulation to carry the message across the link.
+                        loop = asyncio.get_running_loop()
+                        arrival = loop.create_future()
+                        def arrived(delivered):
+                            loop.call_soon_threadsafe(lambda: arrival.done() or arrival.set_result(delivered))
+                        links.submit((key, *data_keys), size, arrived)
+                        if not await self._waitUntil(arrival, connection['closed']):
+                            # Lost on the way, which the sender never finds out about.
+                            return ev3sim.simulation.comm_schema_pb2.SendResult(result=True, msg="")
+                    # This wakes the receiver straight away, then waits for it to take the message.
+                    connection[data_keys[1]].put_nowait(d)
+                    await self._waitUntil(connection[data_keys[1]].join(), connection['closed'])
+                    return ev3sim.simulation.comm_schema_pb2.SendResult(result=True, msg="")
+                except SimulationDied:
+                    return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg="Simulation died.")
+                except ConnectionClosed:
                     return ev3sim.simulation.comm_schema_pb2.SendResult(result=False, msg="Your connection was closed.")
-            
-            def RequestRecv(self, request, context):
+
+            async def RequestRecv(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
                 client_id = request.client_id
-                update_key = f'{rob_id}:RR'
                 try:
                     if key not in data['bot_communications_data'] or (data['bot_communications_data'][key]['server_id'] not in (rob_id, client_id)):
                         return ev3sim.simulation.comm_schema_pb2.RecvResult(result=False, data='N/A', msg="Server on address does not exist, or the incorrect Sender ID was specified.")
@@ -186,36 +332,35 @@ def start_server_with_shared_data(data, result, bind_addr):
                         data_keys = (rob_id, 'recvs')
                     if data_keys[0] not in data['bot_communications_data'][key]['connections']:
                         return ev3sim.simulation.comm_schema_pb2.RecvResult(result=False, data='N/A', msg="Server on address does not exist, or the incorrect Sender ID was specified.")
-                    last_tick = time.time()
-                    data['tick_updates'][update_key] = Queue(0)
-                    with data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]].not_empty:
-                        while not data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]]._qsize():
-                            data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]].not_empty.wait(TICK_WAITING_TIMEOUT)
-                            try:
-                                data['tick_updates'][update_key].get(timeout=TICK_WAITING_TIMEOUT)
-                                last_tick = time.time()
-                            except:
-                                if result._qsize():
-                                    return ev3sim.simulation.comm_schema_pb2.RecvResult(result=False, data='N/A', msg="Simulation died.")
-                    d = data['bot_communications_data'][key]['connections'][data_keys[0]][data_keys[1]].get()
-                    with data['bot_locks'][client_id]['condition_changing']:
-                        data['bot_locks'][client_id]['condition_waiting'].notify()
-                    del data['tick_updates'][update_key]
-                    return ev3sim.simulation.comm_schema_pb2.RecvResult(data=d, result=True, msg="")
-                except KeyError:
-                    if update_key in data['tick_updates']:
-                        del data['tick_updates'][update_key]
+                    connection = data['bot_communications_data'][key]['connections'][data_keys[0]]
+                    unread = connection['unread']
+                    if not unread[data_keys[1]]:
+                        unread[data_keys[1]] = await self._waitUntil(connection[data_keys[1]].get(), connection['closed'])
+                        # Let the sender know its message has been received.
+                        connection[data_keys[1]].task_done()
+                    # Anything past the limit is kept for the next receive, like a socket buffer.
+                    d = unread[data_keys[1]]
+                    limit = request.limit or len(d)
+                    unread[data_keys[1]] = d[limit:]
+                    return ev3sim.simulation.comm_schema_pb2.RecvResult(data=d[:limit], result=True, msg="")
+                except SimulationDied:
+                    return ev3sim.simulation.comm_schema_pb2.RecvResult(result=False, data='N/A', msg="Simulation died.")
+                except ConnectionClosed:
                     return ev3sim.simulation.comm_schema_pb2.RecvResult(data='', result=False, msg="Your connection was closed.")
 
-            def CloseServerConnection(self, request, context):
+            async def CloseServerConnection(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
-                if key not in data['bot_communications_data'] or data['bot_communications_data'][key]['server_id'] != rob_id:   
+                if key not in data['bot_communications_data'] or data['bot_communications_data'][key]['server_id'] != rob_id:
                     return ev3sim.simulation.comm_schema_pb2.CloseServerResult(result=False, msg="Server is already closed, or you are not the host of it.")
-                del data['bot_communications_data'][key]
+                server = data['bot_communications_data'].pop(key)
+                # Wake anything still waiting on this server or its connections.
+                server['closed'].set()
+                for connection in server['connections'].values():
+                    connection['closed'].set()
                 return ev3sim.simulation.comm_schema_pb2.CloseServerResult(result=True, msg="")
-            
-            def CloseClientConnection(self, request, context):
+
+            async def CloseClientConnection(self, request, context):
                 rob_id = request.robot_id
                 key = f'{request.address}:{request.port}'
                 server_id = request.server_id
@@ -224,28 +369,34 @@ def start_server_with_shared_data(data, result, bind_addr):
                     return ev3sim.simulation.comm_schema_pb2.CloseClientResult(result=True, msg="Server you are connecting to is already closed.")
                 if rob_id not in data['bot_communications_data'][key]['connections']:
                     return ev3sim.simulation.comm_schema_pb2.CloseClientResult(result=False, msg="You don't have a connection with this server currently.")
-                # Delete send/receive data.
-                del data['bot_communications_data'][key]['connections'][rob_id]
+                # Delete send/receive data, waking anything still waiting on it.
+                data['bot_communications_data'][key]['connections'].pop(rob_id)['closed'].set()
                 # Delete client_queue elements.
+                client_queue = data['bot_communications_data'][key]['client_queue']
                 objs = []
-                while data['bot_communications_data'][key]['client_queue']._qsize():
-                    try:
-                        objs.append(data['bot_communications_data'][key]['client_queue'].get(timeout=TICK_WAITING_TIMEOUT))
-                    except: pass
+                while not client_queue.empty():
+                    objs.append(client_queue.get_nowait())
                 if rob_id in objs:
                     objs.remove(rob_id)
                 for obj in objs:
-                    data['bot_communications_data'][key]['client_queue'].put(obj)
+                    client_queue.put_nowait(obj)
                 return ev3sim.simulation.comm_schema_pb2.CloseClientResult(result=True, msg="")
 
-        def serve():
-            server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        async def serve():
+            data['simulation_died'] = asyncio.Event()
+            data['server_loop'] = asyncio.get_running_loop()
+            if result._qsize():
+                # The simulation stopped before the server started.
+                data['simulation_died'].set()
+            server = grpc.aio.server()
             ev3sim.simulation.comm_schema_pb2_grpc.add_SimulationDealerServicer_to_server(SimulationDealer(), server)
-            server.add_insecure_port(bind_addr)
-            server.start()
-            server.wait_for_termination()
+            # Kept so that the server can be stopped, and found when bound to port 0.
+            data['server'] = server
+            data['server_port'] = server.add_insecure_port(bind_addr)
+            await server.start()
+            await server.wait_for_termination()
 
         logging.basicConfig()
-        serve()
+        asyncio.run(serve())
     except Exception as e:
-        result.put(('Communications', e))
\ No newline at end of file
+        result.put(('Communications', e))
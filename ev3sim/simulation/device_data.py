@@ -0,0 +1,65 @@
+import ev3sim.simulation.comm_schema_pb2 as comm_schema
+
+# The DeviceData field, and message, used for each device driver. Any other driver is sent as OtherDeviceData.
+DRIVER_MESSAGES = {
+    'lego-ev3-l-motor': ('motor', comm_schema.MotorData),
+    'lego-ev3-m-motor': ('motor', comm_schema.MotorData),
+    'lego-ev3-color': ('colour', comm_schema.ColourSensorData),
+    'lego-ev3-us': ('ultrasonic', comm_schema.UltrasonicSensorData),
+    'ht-nxt-ir-seek-v2': ('infrared', comm_schema.InfraredSensorData),
+    'ht-nxt-compass': ('compass', comm_schema.CompassSensorData),
+}
+
+def device_data_delta(previous, current):
+    """
+    Find the attributes of ``current`` which differ from ``previous``, where both are device data as returned by ``RobotInteractor.collectDeviceData``.
+
+    :returns: A dictionary in the same ``{device_type: {device_name: {attribute: value}}}`` form, containing only the changed attributes.
+    """
+    delta = {}
+    for device_type, devices in current.items():
+        previous_devices = previous.get(device_type, {})
+        for name, attributes in devices.items():
+            previous_attributes = previous_devices.get(name, {})
+            changed = {key: value for key, value in attributes.items() if key not in previous_attributes or previous_attributes[key] != value}
+            if changed:
+                delta.setdefault(device_type, {})[name] = changed
+    return delta
+
+def apply_device_data_delta(data, delta):
+    """Update the device data ``data`` in place with the changed attributes from ``device_data_delta``."""
+    for device_type, devices in delta.items():
+        for name, attributes in devices.items():
+            data.setdefault(device_type, {}).setdefault(name, {}).update(attributes)
+
+def typed_messages_preferred():
+    """
+    Whether typed device messages (``RequestDeviceUpdates``) are cheaper to handle than JSON (``RequestTickUpdates``).
+    Only true with a compiled protobuf implementation: in pure python they are several times slower (see ``benchmarks/device_data.py``).
+    """
+    from google.protobuf.internal import api_implementation
+    return api_implementation.Type() in ('cpp', 'upb')
+
+def device_data_message(device_type, name, attributes):
+    """Convert the attributes of one device, as returned by ``toObject``, into a ``DeviceData`` message."""
+    if attributes.get('driver_name') in DRIVER_MESSAGES:
+        field, message = DRIVER_MESSAGES[attributes['driver_name']]
+        return comm_schema.DeviceData(device_type=device_type, name=name, **{field: message(**attributes)})
+    return comm_schema.DeviceData(device_type=device_type, name=name, other=comm_schema.OtherDeviceData(
+        attributes={key: str(value) for key, value in attributes.items()},
+    ))
+
+def device_state(device):
+    """The state held by a ``DeviceData`` message: a typed message, or a dictionary of strings for other devices."""
+    field = device.WhichOneof('state')
+    if field == 'other':
+        return dict(device.other.attributes)
+    return getattr(device, field)
+
+def get_device_attribute(state, attribute):
+    """Read an attribute from a state returned by ``device_state``, raising a ``KeyError`` if the device doesn't have it."""
+    if isinstance(state, dict):
+        return state[attribute]
+    if attribute not in state.DESCRIPTOR.fields_by_name:
+        raise KeyError(attribute)
+    return getattr(state, attribute)
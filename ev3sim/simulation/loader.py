@@ -2,6 +2,8 @@ import time
 from typing import List
 from ev3sim.objects.base import objectFactory
 from ev3sim.simulation.interactor import IInteractor, fromOptions
+from ev3sim.simulation.profiler import TickProfiler
+from ev3sim.simulation.scheduler import TickScheduler
 from ev3sim.simulation.world import World, stop_on_pause
 from ev3sim.visual import ScreenObjectManager
 from ev3sim.visual.objects import visualFactory
@@ -17,6 +19,39 @@ class ScriptLoader:
     TIME_SCALE = 1
     # TIME_SCALE simply affects the speed at which the simulation runs 
     # (TIME_SCALE = 2, GAME_TICK_RATE = 30 implies 60 ticks of per actual seconds)
+    # When ticks are running late, how many extra game ticks can be run back to back to catch up (further lag is dropped),
+    # and how many frames in a row can be skipped to make time for this.
+    MAX_CATCHUP_TICKS = 3
+    MAX_SKIPPED_FRAMES = 5
+    # Split each game tick into this many physics steps, for more accurate collisions.
+    PHYSICS_SUBSTEPS = 1
+    # Print how long the simulation spent sleeping vs working when it exits.
+    REPORT_TIMINGS = False
+    # Run game ticks back to back, ignoring GAME_TICK_RATE and TIME_SCALE as far as wall-clock time is concerned.
+    # Game time still advances by 1 / GAME_TICK_RATE every tick, so anything measured in ticks is unaffected.
+    FAST_FORWARD = False
+    # Don't simulate the next tick until every attached robot has acknowledged the data from the previous one.
+    LOCKSTEP = False
+    # How long to wait (in seconds) for a robot to acknowledge a tick, before continuing without it.
+    LOCKSTEP_TIMEOUT = 1
+    # Time each phase of the simulation loop, and print percentiles when the simulation exits or lags.
+    PROFILE = False
+    # Robots which need a script attached before the simulation starts, and how long (in seconds) to wait for them.
+    WAIT_FOR_ATTACH = []
+    WAIT_FOR_ATTACH_TIMEOUT = 30
+    # Stop the simulation once an interactor reports that the game is finished.
+    QUIT_WHEN_FINISHED = False
+    # How many ticks of device data to hold for each robot that hasn't received them yet. Older ticks are dropped once this is full,
+    # so a slow script always receives the newest data.
+    TICK_MAILBOX_SIZE = 1
+    # The bluetooth link between each pair of robots: how many ticks messages take to arrive, how many bytes per second can be sent,
+    # the largest message which can be sent (in bytes), and the probability of a message being lost. 0 means no delay or limit.
+    COMMS_LATENCY = 0
+    COMMS_BANDWIDTH = 0
+    COMMS_MAX_MESSAGE_SIZE = 0
+    COMMS_LOSS = 0
+    # When running headless, only calculate the readings of sensors which the attached scripts have opened.
+    LAZY_DEVICES = True
 
     instance: 'ScriptLoader' = None
     running = True
@@ -24,11 +59,19 @@ class ScriptLoader:
     def __init__(self, **kwargs):
         ScriptLoader.instance = self
         self.robots = {}
+        self.results = {}
         for key, value in kwargs.items():
             setattr(self, key, value)
 
     def setSharedData(self, data):
         self.data = data
+        self.data['comms_links'].configure(
+            latency=self.COMMS_LATENCY,
+            bandwidth=self.COMMS_BANDWIDTH,
+            max_message_size=self.COMMS_MAX_MESSAGE_SIZE,
+            loss=self.COMMS_LOSS,
+            tick_rate=self.GAME_TICK_RATE,
+        )
 
     def startUp(self, **kwargs):
         man = ScreenObjectManager(**kwargs)
@@ -80,52 +123,148 @@ class ScriptLoader:
             interactor.startUp()
         self.physics_tick = 0
         tick = 0
-        last_vis_update = time.time() - 1.1 / self.VISUAL_TICK_RATE
-        last_game_update = time.time() - 1.1 / self.GAME_TICK_RATE / self.TIME_SCALE
+        self.waitForAttach()
+        # The tick of the last data sent to each robot, and the robots that have stopped acknowledging them.
+        self.sent_ticks = {}
+        self.lockstep_ignored = set()
+        self.scheduler = TickScheduler(1 / self.GAME_TICK_RATE / self.TIME_SCALE, 1 / self.VISUAL_TICK_RATE, self.MAX_CATCHUP_TICKS)
+        self.profiler = TickProfiler(self.PROFILE)
+        self.fast_forwarded = False
+        self.setFastForward(self.FAST_FORWARD)
         total_lag_ticks = 0
         lag_printed = False
-        while self.active_scripts:
-            if not self.running:
-                return
-            new_time = time.time()
-            if new_time - last_game_update > 1 / self.GAME_TICK_RATE / self.TIME_SCALE:
-                # Send out static tick updates
-                for key in self.data['tick_updates']:
-                    self.data['tick_updates'][key].put(True)
-                # Handle any writes
-                while self.data['write_stack']:
-                    rob_id, attribute_path, value = self.data['write_stack'].popleft()
-                    sensor_type, specific_sensor, attribute = attribute_path.split()
-                    self.robots[rob_id].getDeviceFromPath(sensor_type, specific_sensor).applyWrite(attribute, value)
-                for key, robot in self.robots.items():
-                    if robot.spawned and key in self.data['data_queue']:
-                        self.data['data_queue'][key].put(robot._interactor.collectDeviceData())
-                # Handle simulation.
-                # First of all, check the script can handle the current settings.
-                if new_time - last_game_update > 2 / self.GAME_TICK_RATE / self.TIME_SCALE:
-                    total_lag_ticks += 1
-                last_game_update = new_time
-                to_remove = []
-                for i, interactor in enumerate(self.active_scripts):
-                    if interactor.tick(tick):
-                        to_remove.append(i)
-                for i in to_remove[::-1]:
-                    self.active_scripts[i].tearDown()
-                    del self.active_scripts[i]
-                self.world.tick(1 / self.GAME_TICK_RATE)
-                for interactor in self.active_scripts:
-                    interactor.afterPhysics()
-                tick += 1
-                self.incrementPhysicsTick()
+        skipped_frames = 0
+        try:
+            while self.active_scripts:
+                if not self.running:
+                    return
+                self.scheduler.sleepUntilDue()
+                self.profiler.start()
+                # If we have fallen behind, run a few game ticks back to back to catch up.
+                game_ticks = 0
+                while self.running and game_ticks <= self.MAX_CATCHUP_TICKS and self.scheduler.gameDue():
+                    if self.LOCKSTEP:
+                        # Any writes made in response to the last tick will have arrived before the acknowledgement.
+                        self.waitForTickAcks()
+                        self.profiler.lap('lockstep wait')
+                    self.applyWrites()
+                    self.profiler.lap('writes')
+                    # Deliver any messages between robots which have now arrived.
+                    self.data['comms_links'].advance(self.physics_tick)
+                    self.profiler.lap('comms')
+                    for key, robot in self.robots.items():
+                        mailbox = self.data['data_queue'].get(key)
+                        if mailbox is None:
+                            # Without a script attached, nothing reads the robot's devices.
+                            robot._interactor.useDevices(set())
+                            continue
+                        # Counted first, so that every device counted is in use by the time its data is collected.
+                        opened_count = mailbox.opened_count
+                        robot._interactor.useDevices(mailbox.opened)
+                        if robot.spawned:
+                            mailbox.put((self.physics_tick, robot._interactor.collectDeviceData(), opened_count))
+                            self.sent_ticks[key] = self.physics_tick
+                    self.profiler.lap('device data')
+                    # Handle simulation.
+                    self.scheduler.completeGameTick()
+                    to_remove = []
+                    for i, interactor in enumerate(self.active_scripts):
+                        if interactor.tick(tick):
+                            to_remove.append(i)
+                        self.profiler.lap('tick', interactor)
+                    for i in to_remove[::-1]:
+                        self.active_scripts[i].tearDown()
+                        del self.active_scripts[i]
+                    self.world.tick(1 / self.GAME_TICK_RATE, self.PHYSICS_SUBSTEPS)
+                    self.profiler.lap('physics')
+                    for interactor in self.active_scripts:
+                        interactor.afterPhysics()
+                        self.profiler.lap('afterPhysics', interactor)
+                    tick += 1
+                    game_ticks += 1
+                    self.incrementPhysicsTick()
+                total_lag_ticks += self.scheduler.dropMissedTicks()
                 if (tick > 10 and total_lag_ticks / tick > 0.5) and not lag_printed:
                     lag_printed = True
                     print("The simulation is currently lagging, you may want to turn down the game tick rate.")
-            if new_time - last_vis_update > 1 / self.VISUAL_TICK_RATE:
-                last_vis_update = new_time
-                ScreenObjectManager.instance.applyToScreen()
-                for event in ScreenObjectManager.instance.handleEvents():
-                    for interactor in self.active_scripts:
-                        interactor.handleEvent(event)
+                    print(self.scheduler.summary())
+                    if self.PROFILE:
+                        print(self.profiler.summary())
+                if self.scheduler.visualDue():
+                    self.scheduler.completeVisualTick()
+                    if self.scheduler.behind() and skipped_frames < self.MAX_SKIPPED_FRAMES:
+                        # Spend the time on catching up instead.
+                        skipped_frames += 1
+                    else:
+                        skipped_frames = 0
+                        ScreenObjectManager.instance.applyToScreen()
+                        self.profiler.lap('render')
+                    for event in ScreenObjectManager.instance.handleEvents():
+                        for interactor in self.active_scripts:
+                            interactor.handleEvent(event)
+                    self.profiler.lap('events')
+                self.profiler.completeIteration()
+        finally:
+            if self.REPORT_TIMINGS:
+                print(self.scheduler.summary())
+            if self.PROFILE:
+                print(self.profiler.summary())
+            if self.REPORT_TIMINGS or self.fast_forwarded:
+                print(f"Ran {self.scheduler.game_ticks} ticks at an average of {self.scheduler.ticksPerSecond():.1f} ticks per second.")
+
+    def waitForAttach(self):
+        """Wait for every robot in WAIT_FOR_ATTACH to have a script connected, or for WAIT_FOR_ATTACH_TIMEOUT seconds to pass."""
+        deadline = time.time() + self.WAIT_FOR_ATTACH_TIMEOUT
+        for rob_id in self.WAIT_FOR_ATTACH:
+            while rob_id not in self.data['data_queue']:
+                if time.time() > deadline:
+                    print(f"No script attached to {rob_id}, starting without it.")
+                    break
+                time.sleep(0.05)
+
+    def finish(self, **results):
+        """Called by interactors when the game is over, with any results worth reporting (such as the final scores)."""
+        self.results.update(results)
+        if self.QUIT_WHEN_FINISHED:
+            self.running = False
+
+    def applyWrites(self):
+        """Apply every batch of writes the robots have sent since the last tick, each batch as a whole."""
+        while self.data['write_stack']:
+            rob_id, writes = self.data['write_stack'].popleft()
+            for device_type, name, attribute, value in writes:
+                self.robots[rob_id]._interactor.applyWrite(device_type, name, attribute, value)
+
+    def waitForTickAcks(self):
+        """Wait for every attached robot to acknowledge the last data it was sent, or for LOCKSTEP_TIMEOUT seconds to pass."""
+        deadline = time.time() + self.LOCKSTEP_TIMEOUT
+        # No new data is sent in the meantime, which robots' connections shouldn't mistake for the simulation dying.
+        self.data['lockstep_waiting'].set()
+        try:
+            for rob_id, sent_tick in self.sent_ticks.items():
+                while True:
+                    # Cleared before checking, so that an acknowledgement arriving in between still ends the wait below.
+                    self.data['tick_acked'].clear()
+                    if rob_id not in self.data['data_queue'] or self.data['tick_acks'].get(rob_id, -1) >= sent_tick:
+                        # Up to date, so wait for this robot again.
+                        self.lockstep_ignored.discard(rob_id)
+                        break
+                    if rob_id in self.lockstep_ignored:
+                        break
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        print(f"{rob_id} has not acknowledged tick {sent_tick}, continuing without it until it catches up.")
+                        self.lockstep_ignored.add(rob_id)
+                        break
+                    self.data['tick_acked'].wait(remaining)
+        finally:
+            self.data['lockstep_waiting'].clear()
+
+    def setFastForward(self, value):
+        """Turn fast forwarding (running ticks as fast as possible, rather than in real time) on or off."""
+        self.FAST_FORWARD = value
+        self.fast_forwarded = self.fast_forwarded or value
+        self.scheduler.setUnthrottled(value)
 
     def getSimulationConstants(self):
         return {
@@ -156,3 +295,4 @@ def runFromConfig(config, shared):
         sl.simulate()
     else:
         print("No interactors succesfully loaded. Quitting...")
+    return sl.results
@@ -0,0 +1,60 @@
+import time
+import numpy as np
+from collections import deque
+
+class TickProfiler:
+    """
+    Times each phase of the simulation loop (and each interactor class within a phase), keeping the most recent samples so percentiles can be reported.
+
+    Time is attributed with ``lap``, which charges everything since the previous lap (or ``start``) to the given phase.
+    Multiple laps for the same phase and interactor class in one loop iteration (such as one for every ``ColorInteractor``) are summed into a single sample.
+    """
+
+    # How many of the most recent samples to keep for each phase.
+    HISTORY_LENGTH = 1000
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.timings = {}
+        self.current = {}
+        self.last = 0
+
+    def start(self):
+        """Begin timing a loop iteration."""
+        if self.enabled:
+            self.last = time.perf_counter()
+
+    def lap(self, phase, interactor=None):
+        """Charge the time since the last lap to ``phase``, or to the class of ``interactor`` within that phase."""
+        if not self.enabled:
+            return
+        key = phase if interactor is None else f'{phase} ({type(interactor).__name__})'
+        now = time.perf_counter()
+        self.current[key] = self.current.get(key, 0) + now - self.last
+        self.last = now
+
+    def completeIteration(self):
+        """Record the timings of this loop iteration."""
+        if not self.enabled:
+            return
+        for key, value in self.current.items():
+            if key not in self.timings:
+                self.timings[key] = deque(maxlen=self.HISTORY_LENGTH)
+            self.timings[key].append(value)
+        self.current.clear()
+
+    def summary(self):
+        """A table of each phase's recent timings in milliseconds, most expensive first."""
+        # Copy everything first, as this may be called from another thread.
+        samples = [(key, np.array(values) * 1000) for key, values in list(self.timings.items()) if values]
+        if not samples:
+            return "No timings have been recorded."
+        samples.sort(key=lambda item: -item[1].mean())
+        width = max(len(key) for key, _ in samples)
+        headers = ['samples', 'mean'] + [f'p{p}' for p in self.PERCENTILES] + ['max']
+        lines = [f"{'Phase (ms)':<{width}}" + ''.join(f'{header:>10}' for header in headers)]
+        for key, values in samples:
+            stats = [values.mean(), *np.percentile(values, self.PERCENTILES), values.max()]
+            lines.append(f'{key:<{width}}{len(values):>10}' + ''.join(f'{stat:>10.3f}' for stat in stats))
+        return '\n'.join(lines)
@@ -0,0 +1,110 @@
+import math
+import time
+from collections import deque
+
+class TickScheduler:
+    """
+    Keeps track of when the next game and visual ticks are due, and sleeps until the earliest of these deadlines rather than spinning.
+
+    Game and visual deadlines are tracked separately, so rendering never delays physics (and vice versa).
+    When unthrottled, game ticks are always due, and are run back to back with no wall-clock pacing.
+
+    Game ticks which are missed are owed, and stay due until they are caught up on, unless more than ``max_catchup`` are owed, in which case the rest are dropped.
+    """
+
+    # How many of the most recent loop iterations to keep sleep/work timings for.
+    HISTORY_LENGTH = 300
+
+    def __init__(self, game_period, visual_period, max_catchup=0):
+        self.game_period = game_period
+        self.visual_period = visual_period
+        self.max_catchup = max_catchup
+        self.unthrottled = False
+        now = time.time()
+        self.start_time = now
+        self.game_ticks = 0
+        # Both ticks are due immediately.
+        self.next_game = now
+        self.next_visual = now
+        self.last_wake = now
+        self.last_sleep = 0
+        # (time spent sleeping, time spent working) for each loop iteration.
+        self.timings = deque(maxlen=self.HISTORY_LENGTH)
+        self.total_sleep = 0
+        self.total_work = 0
+
+    def sleepUntilDue(self):
+        """Record the time spent working since the last wake up, and then sleep until the next game or visual tick is due."""
+        now = time.time()
+        work = now - self.last_wake
+        self.total_work += work
+        self.timings.append((self.last_sleep, work))
+        deadline = now if self.unthrottled else min(self.next_game, self.next_visual)
+        if deadline > now:
+            time.sleep(deadline - now)
+        self.last_wake = time.time()
+        self.last_sleep = self.last_wake - now
+        self.total_sleep += self.last_sleep
+
+    def gameDue(self):
+        return self.unthrottled or self.last_wake >= self.next_game
+
+    def visualDue(self):
+        return self.last_wake >= self.next_visual
+
+    def completeGameTick(self):
+        """Schedule the next game tick."""
+        self.game_ticks += 1
+        if self.unthrottled:
+            # Nothing to be late for.
+            self.next_game = self.last_wake
+        else:
+            self.next_game += self.game_period
+
+    def behind(self):
+        """Whether game ticks are still owed from before the last wake up."""
+        return not self.unthrottled and self.next_game <= self.last_wake
+
+    def dropMissedTicks(self):
+        """
+        Forget about any owed game ticks beyond the first ``max_catchup``, so that a slow simulation can't spiral further and further behind.
+
+        :returns int: The number of ticks dropped.
+        """
+        if self.unthrottled or self.next_game > self.last_wake:
+            return 0
+        owed = math.floor((self.last_wake - self.next_game) / self.game_period) + 1
+        if owed > self.max_catchup:
+            dropped = owed - self.max_catchup
+            self.next_game += dropped * self.game_period
+            return dropped
+        return 0
+
+    def setUnthrottled(self, value):
+        if self.unthrottled and not value:
+            # Resume real time pacing from now, rather than from wherever the deadline was left.
+            self.next_game = time.time()
+        self.unthrottled = value
+
+    def ticksPerSecond(self):
+        """The average number of game ticks run per second of wall-clock time."""
+        elapsed = time.time() - self.start_time
+        return self.game_ticks / elapsed if elapsed > 0 else 0
+
+    def completeVisualTick(self):
+        self.next_visual += self.visual_period
+        if self.next_visual < self.last_wake:
+            # Never try to catch up on frames.
+            self.next_visual = self.last_wake + self.visual_period
+
+    def summary(self):
+        """A human readable description of how the loop has recently spent its time."""
+        if not self.timings:
+            return "No ticks have been run."
+        sleep = sum(s for s, _ in self.timings)
+        work = sum(w for _, w in self.timings)
+        total = sleep + work
+        return (
+            f"Over the last {len(self.timings)} loop iterations, the simulation spent {work * 1000 / len(self.timings):.2f}ms working "
+            f"and {sleep * 1000 / len(self.timings):.2f}ms sleeping per iteration ({100 * work / total if total else 0:.1f}% busy)."
+        )
@@ -0,0 +1,67 @@
+import heapq
+import itertools
+import threading
+
+class TickTimers:
+    """
+    Wakes threads in an attached script on the tick they are waiting for, or when a device they are watching changes,
+    as ticks arrive from the simulator.
+
+    Timers are kept in order of the tick they are due, so each tick only touches the timers which are due on it,
+    and watchers are only woken by changes to their own device, rather than every waiting thread checking in every tick.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tick = 0
+        # Timers yet to fire, as (tick, order registered, event).
+        self.timers = []
+        self.order = itertools.count()
+        # The events woken whenever each (device_type, name) changes.
+        self.watchers = {}
+
+    def watch(self, until=None, device=None):
+        """
+        Register a ``threading.Event`` which is set once tick ``until`` is reached, and whenever ``device`` (a ``(device_type, name)`` tuple) changes.
+
+        Watching ``device`` continues until ``unwatch`` is called.
+        """
+        event = threading.Event()
+        with self.lock:
+            if until is not None:
+                if self.tick >= until:
+                    event.set()
+                else:
+                    heapq.heappush(self.timers, (until, next(self.order), event))
+            if device is not None:
+                self.watchers.setdefault(device, set()).add(event)
+        return event
+
+    def unwatch(self, event, device):
+        with self.lock:
+            watching = self.watchers.get(device, set())
+            watching.discard(event)
+            if not watching:
+                self.watchers.pop(device, None)
+
+    def advance(self, tick, changed=None):
+        """
+        Move on to ``tick``, firing any timers now due, and waking the watchers of each device in ``changed``.
+
+        If ``changed`` is ``None`` it isn't known which devices changed, so every watcher is woken.
+
+        :returns: Whether any waiting thread was woken.
+        """
+        woken = False
+        with self.lock:
+            self.tick = tick
+            while self.timers and self.timers[0][0] <= tick:
+                heapq.heappop(self.timers)[2].set()
+                woken = True
+            if changed is None:
+                changed = list(self.watchers)
+            for device in changed:
+                for event in self.watchers.get(device, ()):
+                    woken = woken or not event.is_set()
+                    event.set()
+        return woken
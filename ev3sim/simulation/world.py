@@ -28,20 +28,51 @@ class World:
         self.space = pymunk.Space()
         self.space.gravity = 0, 0
         self.objects = []
+        self.next_collision_group = 1
+        # Counts up whenever any object moves, or is added or removed (see ``PhysicsObject.version``).
+        self.version = 0
     
     def registerObject(self, obj):
         self.objects.append(obj)
         self.space.add(obj.body, *obj.shapes)
+        self.version += 1
     
     def unregisterObject(self, obj):
         self.objects.remove(obj)
         self.space.remove(obj.body, *obj.shapes)
+        self.version += 1
     
+    def assignCollisionGroup(self, *objs):
+        """
+        Put every shape of the given objects into a new collision group.
+        Shapes in the same group never collide with each other, and queries filtered by the group ignore them.
+
+        :returns int: The new group.
+        """
+        group = self.next_collision_group
+        self.next_collision_group += 1
+        for obj in objs:
+            for shape in obj.shapes:
+                shape.filter = pymunk.ShapeFilter(group=group, categories=shape.filter.categories, mask=shape.filter.mask)
+        return group
+
     @stop_on_pause
-    def physics_tick(self, dt):
-        self.space.step(dt)
+    def physics_tick(self, dt, substeps=1):
+        if substeps == 1:
+            self.space.step(dt)
+            return
+        # pymunk clears forces after every step, so reapply them for each substep.
+        forces = [(obj.body, obj.body.force, obj.body.torque) for obj in self.objects]
+        for substep in range(substeps):
+            if substep:
+                for body, force, torque in forces:
+                    body.force = force
+                    body.torque = torque
+            self.space.step(dt / substeps)
 
-    def tick(self, dt):
-        self.physics_tick(dt)
-        for obj in self.objects:
-            obj.update()
+    def tick(self, dt, substeps=1):
+        """Advance the simulation by ``dt`` seconds, split into ``substeps`` physics steps."""
+        self.physics_tick(dt, substeps)
+        # Every object is updated, even once one has been found to move.
+        if any([obj.update() for obj in self.objects]):
+            self.version += 1
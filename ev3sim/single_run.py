@@ -3,43 +3,74 @@ import sys
 from collections import deque
 from queue import Queue
 import time
+import threading
+import signal
 from ev3sim.file_helper import find_abs
 import yaml
-from ev3sim.simulation.loader import runFromConfig
+from ev3sim.simulation.loader import ScriptLoader, runFromConfig
+from ev3sim.simulation.comms_link import CommsLinks
 
-def single_run(preset_filename, robots, bind_addr):
+def single_run(preset_filename, robots, bind_addr, headless=False, fast_forward=False, lockstep=False, profile=False, wait_for_attach=None, quit_when_finished=False):
     preset_file = find_abs(preset_filename, allowed_areas=['local', 'local/presets/', 'package', 'package/presets/'])
     with open(preset_file, 'r') as f:
         config = yaml.safe_load(f)
 
     config['robots'] = config.get('robots', []) + robots
+    if headless:
+        config['screen'] = config.get('screen') or {}
+        config['screen']['headless'] = True
+    config['loader'] = config.get('loader') or {}
+    if fast_forward:
+        config['loader']['FAST_FORWARD'] = True
+    if lockstep:
+        config['loader']['LOCKSTEP'] = True
+    if profile:
+        config['loader']['PROFILE'] = True
+    if wait_for_attach:
+        config['loader']['WAIT_FOR_ATTACH'] = wait_for_attach
+    if quit_when_finished:
+        config['loader']['QUIT_WHEN_FINISHED'] = True
 
     shared_data = {
         'tick': 0,                      # Current tick
         'write_stack': deque(),         # All write actions are processed through this
         'data_queue': {},               # Simulation data for each bot
         'active_count': {},             # Keeps track of which code connection each bot has.
-        'bot_locks': {},                # Threading Locks and Conditions for each bot to wait for connection actions
-        'bot_communications_data': {},  # Buffers and information for all bot communications
-        'tick_updates': {},             # Simply a dictionary where the simulation tick will push static data, so the other methods are aware of when the simulation has exited.
+        'bot_communications_data': {},  # Buffers and information for all bot communications (owned by the server's event loop)
+        'comms_links': CommsLinks(),    # Carries messages between bots as the simulation ticks
+        'tick_acks': {},                # The latest tick each bot has acknowledged receiving (in lockstep mode)
+        'tick_acked': threading.Event(),  # Set whenever a bot acknowledges a tick, or disconnects
+        'lockstep_waiting': threading.Event(),  # Set while the simulation is waiting for bots to acknowledge a tick
     }
 
     result_bucket = Queue(maxsize=1)
+    # Anything reported by the simulation once the game is finished.
+    results = {}
 
     from threading import Thread
-    from ev3sim.simulation.communication import start_server_with_shared_data
+    from ev3sim.simulation.communication import start_server_with_shared_data, notify_simulation_died
 
     def run(shared_data, result):
         try:
-            runFromConfig(config, shared_data)
+            results.update(runFromConfig(config, shared_data))
         except Exception as e:
             result.put(('Simulation', e))
-            return
-        result.put(True)
+        else:
+            result.put(True)
+        finally:
+            # Wake any robots waiting on each other, so they find out straight away.
+            notify_simulation_died(shared_data)
 
     comm_thread = Thread(target=start_server_with_shared_data, args=(shared_data, result_bucket, bind_addr), daemon=True)
     sim_thread = Thread(target=run, args=(shared_data, result_bucket), daemon=True)
 
+    if config['loader'].get('PROFILE') and hasattr(signal, 'SIGUSR1'):
+        # Allow the profile to be printed on demand, even without a window to press keys in.
+        def print_profile(signum, frame):
+            if ScriptLoader.instance is not None and hasattr(ScriptLoader.instance, 'profiler'):
+                print(ScriptLoader.instance.profiler.summary())
+        signal.signal(signal.SIGUSR1, print_profile)
+
     comm_thread.start()
     sim_thread.start()
 
@@ -56,3 +87,4 @@ def single_run(preset_filename, robots, bind_addr):
             raise r[1]
     except KeyboardInterrupt:
         pass
+    return results
@@ -1,5 +1,7 @@
+import numpy as np
 import pygame
 import pygame.freetype
+import pygame.surfarray
 from typing import Dict, List, Tuple
 
 import ev3sim.visual.utils as utils
@@ -32,6 +34,14 @@ class ScreenObjectManager:
         self.map_width = kwargs.get('map_width', 210)
         self.map_height = kwargs.get('map_height', 160)
         self.background_color = kwargs.get('background_color', '#000000')
+        # Headless simulations never open a window, and never draw anything to the screen.
+        self.headless = kwargs.get('headless', False)
+        # Colour sensors look at a separate image of the sensorVisible elements, with this many pixels per unit of world space.
+        # This is only redrawn when one of those elements changes.
+        self.sensor_resolution = kwargs.get('sensor_resolution', 4)
+        self.sensor_floor = None
+        # Counts every change to the sensor floor, so colour sensors can tell when what they see might have changed.
+        self.sensor_floor_version = 0
 
     @property
     def background_color(self):
@@ -50,6 +60,12 @@ class ScreenObjectManager:
 
     def startScreen(self):
         from ev3sim.file_helper import find_abs
+        if self.headless:
+            # Only fonts are needed - initialising the display would also have SDL swallow SIGINT/SIGTERM as quit events we never read.
+            pygame.freetype.init()
+            # Nothing is ever drawn to this, but elements may still expect a screen to exist.
+            self.screen = pygame.Surface((self.screen_width, self.screen_height))
+            return
         pygame.init()
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
         pygame.display.set_caption('MHS Robotics Club Simulator')
@@ -61,6 +77,8 @@ class ScreenObjectManager:
     def registerVisual(self, obj: 'visual.objects.IVisualElement', key) -> str: # noqa: F821
         assert key not in self.objects, f"Tried to register visual element to screen with key that is already in use: {key}"
         self.objects[key] = obj
+        if obj.sensorVisible:
+            self.sensorFloorChanged()
         # It is assumed the z-value of an item will note change as time progresses,
         # so no extra checks need to be made to sorting_order.
         # NOTE: We could speed this up with a binary search, possible performance gain with many objects.
@@ -75,6 +93,8 @@ class ScreenObjectManager:
     def unregisterVisual(self, key) -> 'visual.objects.IVisualElement': # noqa: F821
         obj = self.objects[key]
         del self.objects[key]
+        if obj.sensorVisible:
+            self.sensorFloorChanged()
         # NOTE: We could speed this up with a binary search, possible performance gain with many objects.
         self.sorting_order.remove(key)
         return obj
@@ -87,20 +107,56 @@ class ScreenObjectManager:
             self.registerObject(child, new_key)
 
     def applyToScreen(self):
+        if self.headless:
+            # Nobody is watching, and the sensors have their own image to look at.
+            return
         self.screen.fill(self.background_color)
         for key in self.sorting_order:
-            if self.objects[key].sensorVisible:
-                self.objects[key].applyToScreen()
-        self.sensorScreen = self.screen.copy()
-        for key in self.sorting_order:
-            if not self.objects[key].sensorVisible:
-                self.objects[key].applyToScreen()
+            self.objects[key].applyToScreen()
         pygame.display.update()
 
-    def colourAtPixel(self, screen_position):
-        return self.sensorScreen.get_at(screen_position)
+    def sensorFloorChanged(self):
+        """Called whenever a sensorVisible element changes, so that the colour sensors see the change."""
+        self.sensor_floor = None
+        self.sensor_floor_version += 1
+
+    def buildSensorFloor(self):
+        """Draw all sensorVisible elements offscreen, at sensor_resolution pixels per unit of world space, and keep the pixels as an array."""
+        screen, screen_width, screen_height = self.screen, self.screen_width, self.screen_height
+        sensor_visible = [self.objects[key] for key in self.sorting_order if self.objects[key].sensorVisible]
+        # Elements draw themselves to the screen, so temporarily swap it out for a surface the size of the floor.
+        self.screen_width = int(self.map_width * self.sensor_resolution)
+        self.screen_height = int(self.map_height * self.sensor_resolution)
+        self.screen = pygame.Surface((self.screen_width, self.screen_height))
+        try:
+            self.screen.fill(self.background_color)
+            for obj in sensor_visible:
+                obj.calculatePoints()
+                obj.applyToScreen()
+            self.sensor_floor = pygame.surfarray.array3d(self.screen)
+        finally:
+            self.screen, self.screen_width, self.screen_height = screen, screen_width, screen_height
+            for obj in sensor_visible:
+                obj.calculatePoints()
+
+    def coloursAtPositions(self, positions):
+        """
+        Read the colour of the sensorVisible elements at many positions at once.
+
+        :param positions: An (n, 2) array of positions in world space. Positions off the map are moved to the nearest edge.
+        :returns: An (n, 3) array of RGB values.
+        """
+        if self.sensor_floor is None:
+            self.buildSensorFloor()
+        width, height = self.sensor_floor.shape[:2]
+        xs = (positions[:, 0] * width / self.map_width + width / 2).astype(int)
+        ys = (-positions[:, 1] * height / self.map_height + height / 2).astype(int)
+        return self.sensor_floor[np.clip(xs, 0, width - 1), np.clip(ys, 0, height - 1)]
 
     def handleEvents(self):
+        if self.headless:
+            # No window means no events (and no initialised video system to ask for them).
+            return
         for event in pygame.event.get():
             if event.type == pygame.VIDEORESIZE:
                 self.screen_width, self.screen_height = event.size
@@ -26,11 +26,11 @@ class IVisualElement:
 
     def initFromKwargs(self, **kwargs):
         """Initialise the visual object given some extra named arguments (normally provided in the ``.yaml`` files)."""
-        self.position = kwargs.get('position', [0, 0])
-        self.rotation = kwargs.get('rotation', 0)
         self.zPos = kwargs.get('zPos', 0)
         self.sensorVisible = kwargs.get('sensorVisible', False)
         self.visible = kwargs.get('visible', True)
+        self.position = kwargs.get('position', [0, 0])
+        self.rotation = kwargs.get('rotation', 0)
 
     @property
     def position(self) -> np.ndarray:
@@ -51,22 +51,31 @@ class IVisualElement:
 
     @position.setter
     def position(self, value):
+        previous = getattr(self, '_position', None)
         if not isinstance(value, np.ndarray):
             self._position = np.array(value)
         else:
             self._position = value
+        # Physics objects set their position every tick, even when stationary.
+        if getattr(self, 'sensorVisible', False) and (previous is None or not np.array_equal(previous, self._position)):
+            self.sensorAppearanceChanged()
         try:
             # Don't worry if some stuff isn't ready yet.
-            self.calculatePoints()
+            if self.drawnToScreen():
+                self.calculatePoints()
         except AttributeError:
             pass
 
     @rotation.setter
     def rotation(self, value):
+        previous = getattr(self, '_rotation', None)
         self._rotation = value
+        if previous != value:
+            self.sensorAppearanceChanged()
         try:
             # Don't worry if some stuff isn't ready yet.
-            self.calculatePoints()
+            if self.drawnToScreen():
+                self.calculatePoints()
         except AttributeError:
             pass
 
@@ -79,10 +88,24 @@ class IVisualElement:
 
     def calculatePoints(self):
         """
-        Called whenever the position or rotation of the object is changed, allowing for any calculation needed to be made.
+        Called whenever the position or rotation of the object is changed (if it is drawn, see ``drawnToScreen``), allowing for any calculation needed to be made.
         """
         raise NotImplementedError(f"The VisualElement {self.__cls__} does not implement the pivotal method `calculatePoints`")
 
+    def sensorAppearanceChanged(self):
+        """Called whenever the element changes in a way the colour sensors could see."""
+        if getattr(self, 'sensorVisible', False) and getattr(ScreenObjectManager, 'instance', None) is not None:
+            ScreenObjectManager.instance.sensorFloorChanged()
+
+    def drawnToScreen(self):
+        """
+        Whether this element will ever be drawn. Headless simulations only draw what the colour sensors can see.
+
+        Elements which are never drawn don't recalculate their points as they move, so these are left stale.
+        Colour sensors recalculate the points of everything they see before drawing it (see ``ScreenObjectManager.buildSensorFloor``).
+        """
+        return self.sensorVisible or not ScreenObjectManager.instance.headless
+
     def generateBodyAndShape(self, physObj, body=None, rel_pos=None):
         """
         Generates the physics object for this particular visual element. See other implementations of this method for examples.
@@ -114,6 +137,7 @@ class Colorable(IVisualElement):
 
     @fill.setter
     def fill(self, value):
+        previous = getattr(self, '_fill', None)
         if isinstance(value, str):
             if value in utils.GLOBAL_COLOURS:
                 value = utils.GLOBAL_COLOURS[value]
@@ -122,6 +146,8 @@ class Colorable(IVisualElement):
             self._fill = utils.hex_to_pycolor(value)
         else:
             self._fill = value
+        if getattr(self, 'sensorVisible', False) and not np.array_equal(previous, self._fill):
+            self.sensorAppearanceChanged()
 
     @property
     def stroke(self) -> Tuple[int]:
@@ -159,6 +185,7 @@ class Image(Colorable):
         from ev3sim.file_helper import find_abs
         self._image_path = find_abs(value, allowed_areas=['local', 'local/assets/', 'package', 'package/assets/'])
         self.image = pygame.image.load(self._image_path)
+        self.sensorAppearanceChanged()
 
     def calculatePoints(self):
         relative_scale = ScreenObjectManager.instance.relativeScreenScale()
@@ -375,6 +402,7 @@ class Text(Colorable):
     def text(self, value):
         self._text = value
         self.calculatePoints()
+        self.sensorAppearanceChanged()
 
     def initFromKwargs(self, **kwargs):
         super().initFromKwargs(**kwargs)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from queue import Queue
+
+import grpc
+import pytest
+import yaml
+
+class Simulation:
+    """
+    A headless soccer game with two robots, set up as ``runFromConfig`` does, but run one tick at a time by the test,
+    with no scripts attached (and no server, unless the test starts one).
+    """
+
+    def __init__(self, **loader):
+        import ev3sim.visual.utils
+        from ev3sim.file_helper import find_abs
+        from ev3sim.robot import initialise_bot, RobotInteractor
+        from ev3sim.simulation.comms_link import CommsLinks
+        from ev3sim.simulation.interactor import fromOptions
+        from ev3sim.simulation.loader import ScriptLoader
+        from ev3sim.simulation.profiler import TickProfiler
+
+        with open(find_abs('soccer.yaml', allowed_areas=['package/presets/']), 'r') as f:
+            config = yaml.safe_load(f)
+        config['screen']['headless'] = True
+        self.loader = ScriptLoader(**loader)
+        self.loader.setSharedData({
+            'tick': 0,
+            'write_stack': deque(),
+            'data_queue': {},
+            'active_count': {},
+            'bot_communications_data': {},
+            'comms_links': CommsLinks(),
+            'tick_acks': {},
+            'tick_acked': threading.Event(),
+            'lockstep_waiting': threading.Event(),
+        })
+        self.loader.active_scripts = []
+        ev3sim.visual.utils.GLOBAL_COLOURS = config.get('colours', {})
+        for index in range(2):
+            initialise_bot(config, find_abs('bot.yaml', allowed_areas=['package/robots/']), f'Robot-{index}')
+        for opt in config.get('interactors', []):
+            self.loader.active_scripts.append(fromOptions(opt))
+        self.loader.startUp(**config['screen'])
+        self.loader.loadElements(config.get('elements', []))
+        for interactor in self.loader.active_scripts:
+            if isinstance(interactor, RobotInteractor):
+                interactor.connectDevices()
+        for interactor in self.loader.active_scripts:
+            interactor.constants = self.loader.getSimulationConstants()
+            interactor.startUp()
+        self.loader.physics_tick = 0
+        self.loader.profiler = TickProfiler(False)
+        self.loader.sent_ticks = {}
+        self.loader.lockstep_ignored = set()
+        self.tick = 0
+        self.world = self.loader.world
+        self.robots = {key: robot._interactor for key, robot in self.loader.robots.items()}
+
+    def step(self, ticks=1):
+        """Run ``ticks`` game ticks, as the simulation loop would."""
+        for _ in range(ticks):
+            self.loader.applyWrites()
+            for interactor in self.loader.active_scripts:
+                interactor.tick(self.tick)
+            self.world.tick(1 / self.loader.GAME_TICK_RATE, self.loader.PHYSICS_SUBSTEPS)
+            for interactor in self.loader.active_scripts:
+                interactor.afterPhysics()
+            self.tick += 1
+            self.loader.incrementPhysicsTick()
+
+    def device(self, robot, device_type, name):
+        return self.robots[robot].device_paths[(device_type, name)]
+
+@pytest.fixture
+def simulation():
+    """Make a ``Simulation``, with any loader options as keyword arguments."""
+    return Simulation
+
+class Server:
+    """The simulator's server, serving ``data`` from a thread of its own as ``single_run`` does, with a stub to make requests with."""
+
+    def __init__(self, data):
+        from ev3sim.simulation.comm_schema_pb2_grpc import SimulationDealerStub
+        from ev3sim.simulation.communication import start_server_with_shared_data
+
+        self.data = data
+        self.result = Queue(maxsize=1)
+        self.thread = threading.Thread(target=start_server_with_shared_data, args=(data, self.result, 'localhost:0'), daemon=True)
+        self.thread.start()
+        while 'server_port' not in data:
+            assert self.thread.is_alive(), self.result.get()
+            time.sleep(0.01)
+        self.channel = grpc.insecure_channel(f"localhost:{data['server_port']}")
+        grpc.channel_ready_future(self.channel).result(timeout=5)
+        self.stub = SimulationDealerStub(self.channel)
+
+    def stop(self):
+        self.channel.close()
+        # Not waited on, as the server's loop finishes (cancelling this) as soon as the server has stopped.
+        asyncio.run_coroutine_threadsafe(self.data['server'].stop(None), self.data['server_loop'])
+        self.thread.join(5)
+        assert not self.thread.is_alive()
+        assert not self.result.qsize(), self.result.get()
+
+@pytest.fixture
+def server():
+    """Start a ``Server`` for some shared data (usually a ``Simulation``'s), which is stopped after the test."""
+    servers = []
+    def start(data):
+        servers.append(Server(data))
+        return servers[-1]
+    yield start
+    for started in servers:
+        started.stop()
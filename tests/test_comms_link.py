@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from ev3sim.simulation.comms_link import CommsLinks
+
+class Received:
+    """Records which messages arrive, and on which tick."""
+
+    def __init__(self, links):
+        self.links = links
+        self.messages = []
+
+    def callback(self, name):
+        return lambda arrived: self.messages.append((name, self.links.tick, arrived))
+
+    def run(self, ticks):
+        for tick in range(ticks):
+            self.links.advance(tick)
+
+def test_no_limits_arrive_immediately():
+    links = CommsLinks()
+    assert not links.enabled
+    received = Received(links)
+    links.submit(('a', 'b'), 1000, received.callback('first'))
+    received.run(1)
+    assert received.messages == [('first', 0, True)]
+
+def test_latency():
+    links = CommsLinks()
+    links.configure(latency=3)
+    assert links.enabled
+    received = Received(links)
+    links.submit(('a', 'b'), 10, received.callback('first'))
+    links.submit(('b', 'a'), 10, received.callback('reply'))
+    received.run(10)
+    assert received.messages == [('first', 3, True), ('reply', 3, True)]
+
+def test_bandwidth_queues_messages_on_a_link():
+    links = CommsLinks()
+    # 60 ticks per second at 120 bytes per second is 2 bytes a tick.
+    links.configure(bandwidth=120, tick_rate=60)
+    received = Received(links)
+    links.submit(('a', 'b'), 10, received.callback('first'))
+    links.submit(('a', 'b'), 4, received.callback('second'))
+    # The other direction is a separate link.
+    links.submit(('b', 'a'), 4, received.callback('reply'))
+    received.run(20)
+    assert received.messages == [('reply', 2, True), ('first', 5, True), ('second', 7, True)]
+
+def test_idle_links_are_forgotten():
+    links = CommsLinks()
+    links.configure(bandwidth=120, tick_rate=60)
+    links.submit(('a', 'b'), 10, lambda arrived: None)
+    links.advance(4)
+    assert ('a', 'b') in links.link_free
+    links.advance(5)
+    assert links.link_free == {}
+
+def test_loss(monkeypatch):
+    links = CommsLinks()
+    links.configure(loss=0.5)
+    rolls = iter([0.7, 0.2])
+    monkeypatch.setattr(random, 'random', lambda: next(rolls))
+    received = Received(links)
+    links.submit(('a', 'b'), 10, received.callback('first'))
+    links.submit(('a', 'b'), 10, received.callback('second'))
+    received.run(1)
+    assert received.messages == [('first', 0, True), ('second', 0, False)]
+
+def test_max_message_size():
+    links = CommsLinks()
+    links.configure(max_message_size=100)
+    links.checkSize(100)
+    with pytest.raises(ValueError):
+        links.checkSize(101)
@@ -0,0 +1,95 @@
+import copy
+
+import pytest
+
+import ev3sim.simulation.comm_schema_pb2 as comm_schema
+from ev3sim.simulation.device_data import apply_device_data_delta, device_data_delta, device_data_message, device_state, get_device_attribute
+
+def colour(value0, value1, value2):
+    return {
+        'address': 'in2',
+        'driver_name': 'lego-ev3-color',
+        'mode': 'RGB-RAW',
+        'value0': value0,
+        'value1': value1,
+        'value2': value2,
+    }
+
+def motor(state, speed_sp):
+    return {
+        'address': 'outB',
+        'command': 'run-forever',
+        'count_per_rot': 3,
+        'driver_name': 'lego-ev3-l-motor',
+        'max_speed': 1000,
+        'speed_sp': speed_sp,
+        'state': state,
+        'stop_action': 'hold',
+        'time_sp': 0,
+    }
+
+TICKS = [
+    {'lego-sensor': {'sensor0': colour(10, 20, 30)}, 'tacho-motor': {'motor0': motor('holding', 0)}},
+    {'lego-sensor': {'sensor0': colour(10, 20, 30)}, 'tacho-motor': {'motor0': motor('running', 500)}},
+    {'lego-sensor': {'sensor0': colour(11, 20, 31)}, 'tacho-motor': {'motor0': motor('running', 500)}},
+    # A device appearing part way through.
+    {'lego-sensor': {'sensor0': colour(11, 20, 31), 'sensor1': colour(0, 0, 0)}, 'tacho-motor': {'motor0': motor('holding', 0)}},
+]
+
+def test_delta_only_holds_changes():
+    assert device_data_delta(TICKS[0], TICKS[0]) == {}
+    assert device_data_delta(TICKS[0], TICKS[1]) == {'tacho-motor': {'motor0': {'state': 'running', 'speed_sp': 500}}}
+    assert device_data_delta(TICKS[2], TICKS[3])['lego-sensor'] == {'sensor1': colour(0, 0, 0)}
+
+def test_delta_round_trip():
+    previous = {}
+    received = {}
+    for current in TICKS:
+        apply_device_data_delta(received, device_data_delta(previous, current))
+        assert received == current
+        previous = copy.deepcopy(current)
+
+def send(device_type, name, attributes):
+    """Convert to a message, and back again, as the script would receive it."""
+    message = comm_schema.DeviceData.FromString(device_data_message(device_type, name, attributes).SerializeToString())
+    assert (message.device_type, message.name) == (device_type, name)
+    return device_state(message)
+
+def test_typed_round_trip():
+    previous = {}
+    received = {}
+    for current in TICKS:
+        # Typed messages hold every attribute of the devices which changed, and the rest are kept from before.
+        for device_type, devices in device_data_delta(previous, current).items():
+            for name in devices:
+                received.setdefault(device_type, {})[name] = send(device_type, name, current[device_type][name])
+        for device_type, devices in current.items():
+            for name, attributes in devices.items():
+                for attribute, value in attributes.items():
+                    assert get_device_attribute(received[device_type][name], attribute) == value
+        previous = copy.deepcopy(current)
+
+def test_other_devices_are_strings():
+    state = send('lego-sensor', 'sensor3', {'address': 'in3', 'driver_name': 'lego-ev3-gyro', 'value0': 90})
+    assert state == {'address': 'in3', 'driver_name': 'lego-ev3-gyro', 'value0': '90'}
+    assert get_device_attribute(state, 'value0') == '90'
+    with pytest.raises(KeyError):
+        get_device_attribute(state, 'value1')
+
+def test_missing_typed_attribute():
+    state = send('lego-sensor', 'sensor0', colour(1, 2, 3))
+    with pytest.raises(KeyError):
+        get_device_attribute(state, 'value3')
+
+def test_fractional_speed_sp(simulation):
+    sim = simulation()
+    robot = sim.robots['Robot-0']
+    motor = sim.device('Robot-0', 'tacho-motor', 'outB')
+    robot.applyWrite('tacho-motor', 'outB', 'speed_sp', '37.5')
+    robot.applyWrite('tacho-motor', 'outB', 'command', 'run-forever')
+    # The motor still runs at the speed written.
+    assert motor.applied_force == 37.5 * motor.MAX_FORCE / 100
+    attributes = motor.toObject()
+    # MotorData.speed_sp is an int32, and ev3dev2 reads it back with int(), which can't parse '37.5'.
+    assert attributes['speed_sp'] == 37 and isinstance(attributes['speed_sp'], int)
+    assert int(str(get_device_attribute(send('tacho-motor', 'outB', attributes), 'speed_sp'))) == 37
@@ -0,0 +1,147 @@
+import math
+
+import numpy as np
+import pygame
+import pytest
+
+from ev3sim.devices.base import DeviceSystem
+from ev3sim.devices.colour.base import ColourSensorMixin
+from ev3sim.devices.colour.ev3 import ColorSensor
+from ev3sim.devices.infrared.ev3 import InfraredSensor
+from ev3sim.devices.motor.ev3 import MotorInteractor
+from ev3sim.visual.manager import ScreenObjectManager
+from ev3sim.visual.utils import worldspace_to_screenspace
+
+def move(sim, key, position, rotation=0):
+    obj = sim.loader.object_map[key]
+    obj.body.position = tuple(position)
+    obj.body.angle = rotation
+    obj.body.velocity = (0, 0)
+    obj.body.angular_velocity = 0
+
+def random_poses(sim, rng):
+    """Scatter the robots around, with the ball close enough to some of them to be seen."""
+    for robot in sim.robots.values():
+        move(sim, robot.robot_key, rng.uniform(-60, 60, 2), rng.uniform(-np.pi, np.pi))
+    move(sim, 'IR_BALL', rng.uniform(-60, 60, 2))
+    sim.step()
+
+# The infrared sensor's calculation, one sensor and subsensor at a time, from before it was vectorized.
+SENSOR_BEARINGS = [np.pi/3, np.pi/6, 0, -np.pi/6, -np.pi/3]
+
+def scalar_strength(relativeBearing, distance):
+    while relativeBearing > np.pi:
+        relativeBearing -= 2*np.pi
+    while relativeBearing < -np.pi:
+        relativeBearing += 2*np.pi
+    if distance > 120:
+        return 0
+    if abs(relativeBearing) > np.pi/4:
+        return 0
+    sq_dist = pow(distance / 120, 2)
+    exclude_bearing = (1 - sq_dist) * 9
+    bearing_mult = 1 - abs(relativeBearing) / (np.pi/4)
+    return int(math.floor(exclude_bearing * bearing_mult + 0.5))
+
+def scalar_predict(sensorValues):
+    total = sum(sensorValues)
+    if total <= 4:
+        return 0
+    weighted = sum([i*v / total for i, v in enumerate(sensorValues)])
+    return int(max(min(1 + math.floor(weighted / (len(sensorValues)-1) * 9), 9), 1))
+
+def scalar_infrared(sim, interactor):
+    ball_pos = interactor.tracking_ball.position
+    sensor = sim.loader.object_map[interactor.getPrefix() + 'light_up_2']
+    vector = ball_pos - sensor.position
+    distance = np.sqrt(vector[0] ** 2 + vector[1] ** 2)
+    relative_bearing = np.arctan2(vector[1], vector[0]) - sensor.rotation
+    values = [scalar_strength(relative_bearing - b, distance) for b in SENSOR_BEARINGS]
+    return [scalar_predict(values)] + values + [int(sum(values) / len(values))]
+
+def test_infrared_matches_scalar(simulation):
+    sim = simulation()
+    rng = np.random.default_rng(1)
+    interactors = [sim.device(key, 'lego-sensor', 'sensorin1')._interactor for key in sim.robots]
+    seen = 0
+    for _ in range(200):
+        random_poses(sim, rng)
+        InfraredSensor._calc_all(interactors)
+        for interactor in interactors:
+            expected = scalar_infrared(sim, interactor)
+            assert [interactor.device_class.value(index) for index in range(7)] == expected
+            seen += expected[0] != 0
+    # Make sure the ball was actually seen, rather than only comparing zeroes.
+    assert seen > 20
+
+def scalar_motor(motor, obj, position, rotation):
+    """A motor pushing its object, one motor at a time, as before motors were vectorized."""
+    obj.apply_force(motor.applied_force * np.array([np.cos(rotation), np.sin(rotation)]), pos=position)
+
+def scalar_light(motor):
+    """The colour of a motor's light, for how hard it is pushing."""
+    ratio = motor.applied_force / motor.MAX_FORCE
+    return (0, 255 * ratio, 0) if ratio > 0 else (- 255 * ratio, 0, 0)
+
+def test_motors_match_scalar(simulation):
+    sim = simulation()
+    rng = np.random.default_rng(2)
+    system = next(interactor for interactor in sim.loader.active_scripts if isinstance(interactor, DeviceSystem))
+    group = system.groups[MotorInteractor]
+    bodies = [sim.loader.object_map[robot.robot_key].body for robot in sim.robots.values()]
+    for _ in range(20):
+        random_poses(sim, rng)
+        # Motors do nothing while the game is paused, such as after a goal.
+        sim.world.paused = False
+        for interactor in group.interactors:
+            # Leave some alone, whose lights then don't need filling again.
+            if rng.random() < 0.7:
+                interactor.device_class.on(rng.uniform(-100, 100))
+        for body in bodies:
+            body.force, body.torque = (0, 0), 0
+        MotorInteractor.tickAll(group, sim.tick)
+        vectorized = [(tuple(body.force), body.torque) for body in bodies]
+        for interactor in group.interactors:
+            light = sim.loader.object_map[interactor.getPrefix() + 'light_up'].visual
+            assert light.fill == pytest.approx(scalar_light(interactor.device_class))
+        for body in bodies:
+            body.force, body.torque = (0, 0), 0
+        # Each motor pushing its robot separately, as before they were vectorized.
+        for interactor in group.interactors:
+            scalar_motor(interactor.device_class, interactor.physical_object, interactor.relative_location, interactor.relative_rotation)
+        for body, (force, torque) in zip(bodies, vectorized):
+            assert force != (0, 0)
+            assert force == pytest.approx(tuple(body.force))
+            assert torque == pytest.approx(body.torque)
+
+def scalar_colour(manager, position):
+    """The colour of the floor at ``position``, looked up one pixel at a time as before colour sensors were vectorized."""
+    floor = pygame.surfarray.make_surface(manager.sensor_floor)
+    screen_width, screen_height = manager.screen_width, manager.screen_height
+    manager.screen_width, manager.screen_height = floor.get_size()
+    try:
+        x, y = worldspace_to_screenspace(position)
+    finally:
+        manager.screen_width, manager.screen_height = screen_width, screen_height
+    colour = floor.get_at((min(max(x, 0), floor.get_width() - 1), min(max(y, 0), floor.get_height() - 1)))
+    return np.array([colour.r, colour.g, colour.b])
+
+def test_colour_matches_scalar(simulation, monkeypatch):
+    # Sample every point at the centre of the sensor, so the random points don't matter.
+    monkeypatch.setattr(ColourSensorMixin, 'SENSOR_RADIUS', 0)
+    sim = simulation()
+    rng = np.random.default_rng(3)
+    sensors = [sim.device(key, 'lego-sensor', 'sensorin2') for key in sim.robots]
+    seen = set()
+    for _ in range(100):
+        for robot in sim.robots.values():
+            # Some of the time off the field entirely.
+            move(sim, robot.robot_key, rng.uniform(-160, 160, 2), rng.uniform(-np.pi, np.pi))
+        sim.step()
+        ColorSensor._calc_raw_all(sensors)
+        vectorized = [sensor.raw() for sensor in sensors]
+        for sensor, raw in zip(sensors, vectorized):
+            sensor._set_raw(scalar_colour(ScreenObjectManager.instance, sensor.global_position))
+            assert raw == sensor.raw()
+            seen.add(tuple(raw))
+    assert len(seen) > 3
@@ -0,0 +1,161 @@
+import contextlib
+import threading
+import time
+from queue import Queue
+
+from ev3sim.attach import acknowledge_tick, blocked_on_simulator
+from ev3sim.simulation.comm_schema_pb2 import DeviceWrite, RobotWriteBatch
+
+class FakeRobot:
+    """Stands in for an attached script, sending batches of writes and tick acknowledgements to the server as ``attach`` does."""
+
+    def __init__(self, server, robot_id='Robot-0'):
+        self.robot_id = robot_id
+        self.batches = Queue()
+        self.stream = server.stub.SendWriteStream.future(iter(self.batches.get, None))
+        # Attached, as far as the simulation is concerned.
+        server.data['data_queue'][robot_id] = None
+
+    def send(self, writes=(), ack=None, delay=0):
+        """Send a batch of ``writes``, acknowledging tick ``ack`` if given, after ``delay`` seconds."""
+        batch = RobotWriteBatch(
+            robot_id=self.robot_id,
+            writes=[DeviceWrite(device_type=device_type, name=name, attribute=attribute, value=value) for device_type, name, attribute, value in writes],
+            ack=ack is not None,
+            tick=ack or 0,
+        )
+        threading.Timer(delay, self.batches.put, (batch,)).start()
+
+    def close(self):
+        self.batches.put(None)
+        assert self.stream.result().result
+
+def timed(function):
+    start = time.time()
+    function()
+    return time.time() - start
+
+def wait_for_ack(data, robot_id, tick):
+    deadline = time.time() + 5
+    while data['tick_acks'].get(robot_id, -1) < tick:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+def test_waits_for_a_late_ack(simulation, server):
+    sim = simulation(LOCKSTEP=True, LOCKSTEP_TIMEOUT=5)
+    robot = FakeRobot(server(sim.loader.data))
+    sim.loader.sent_ticks['Robot-0'] = 0
+    robot.send(ack=0, delay=0.2)
+    assert 0.2 <= timed(sim.loader.waitForTickAcks) < 5
+    assert sim.loader.data['tick_acks'] == {'Robot-0': 0}
+    assert not sim.loader.lockstep_ignored
+    assert not sim.loader.data['lockstep_waiting'].is_set()
+    robot.close()
+
+def test_earlier_acks_are_not_enough(simulation, server):
+    sim = simulation(LOCKSTEP=True, LOCKSTEP_TIMEOUT=5)
+    robot = FakeRobot(server(sim.loader.data))
+    sim.loader.sent_ticks['Robot-0'] = 4
+    robot.send(ack=3)
+    robot.send(ack=4, delay=0.2)
+    assert timed(sim.loader.waitForTickAcks) >= 0.2
+    assert sim.loader.data['tick_acks'] == {'Robot-0': 4}
+    robot.close()
+
+def test_writes_arrive_before_the_ack(simulation, server):
+    sim = simulation(LOCKSTEP=True, LOCKSTEP_TIMEOUT=5)
+    robot = FakeRobot(server(sim.loader.data))
+    motor = sim.device('Robot-0', 'tacho-motor', 'outB')
+    sim.loader.sent_ticks['Robot-0'] = 0
+    robot.send(writes=[('tacho-motor', 'outB', 'speed_sp', '50')], delay=0.1)
+    robot.send(writes=[('tacho-motor', 'outB', 'command', 'run-forever')], ack=0, delay=0.2)
+    sim.loader.waitForTickAcks()
+    assert len(sim.loader.data['write_stack']) == 2
+    sim.step()
+    assert motor.speed_sp == 50
+    assert motor.state == 'running'
+    robot.close()
+
+def test_robot_which_never_acks_is_ignored_until_it_catches_up(simulation, server):
+    sim = simulation(LOCKSTEP=True, LOCKSTEP_TIMEOUT=0.2)
+    data = sim.loader.data
+    robot = FakeRobot(server(data))
+    sim.loader.sent_ticks['Robot-0'] = 0
+    assert timed(sim.loader.waitForTickAcks) >= 0.2
+    assert sim.loader.lockstep_ignored == {'Robot-0'}
+    # Not waited for again while it is behind.
+    sim.loader.sent_ticks['Robot-0'] = 1
+    assert timed(sim.loader.waitForTickAcks) < 0.1
+    assert sim.loader.lockstep_ignored == {'Robot-0'}
+    # Once it has caught up, it is waited for again.
+    robot.send(ack=1)
+    wait_for_ack(data, 'Robot-0', 1)
+    sim.loader.waitForTickAcks()
+    assert not sim.loader.lockstep_ignored
+    sim.loader.sent_ticks['Robot-0'] = 2
+    robot.send(ack=2, delay=0.1)
+    assert timed(sim.loader.waitForTickAcks) >= 0.1
+    assert not sim.loader.lockstep_ignored
+    robot.close()
+
+def test_detached_robots_are_not_waited_for(simulation):
+    sim = simulation(LOCKSTEP=True, LOCKSTEP_TIMEOUT=5)
+    sim.loader.sent_ticks['Robot-0'] = 0
+    assert timed(sim.loader.waitForTickAcks) < 0.1
+    # Nor is a robot which detaches while being waited for.
+    sim.loader.data['data_queue']['Robot-1'] = None
+    sim.loader.sent_ticks['Robot-1'] = 0
+    def detach():
+        del sim.loader.data['data_queue']['Robot-1']
+        sim.loader.data['tick_acked'].set()
+    threading.Timer(0.1, detach).start()
+    assert timed(sim.loader.waitForTickAcks) < 5
+    assert not sim.loader.lockstep_ignored
+
+def script_data(lockstep=True, tick=0):
+    """The parts of ``attach``'s shared data used to acknowledge ticks."""
+    return {
+        'tick': tick,
+        'lockstep': lockstep,
+        'acked_tick': -1,
+        'blocked': 0,
+        'ack_lock': threading.Lock(),
+        'actions_queue': Queue(),
+    }
+
+def queued(data):
+    actions = []
+    while data['actions_queue'].qsize():
+        actions.append(data['actions_queue'].get())
+    return actions
+
+def test_acknowledge_tick():
+    data = script_data()
+    acknowledge_tick(data, 3)
+    # Each tick is only acknowledged once, and never goes backwards.
+    acknowledge_tick(data, 3)
+    acknowledge_tick(data, 2)
+    acknowledge_tick(data, 5)
+    assert queued(data) == [('tick_ack', 3), ('tick_ack', 5)]
+    assert data['acked_tick'] == 5
+
+def test_acknowledge_tick_only_in_lockstep():
+    data = script_data(lockstep=False)
+    acknowledge_tick(data, 3)
+    assert queued(data) == []
+
+def test_blocked_on_simulator():
+    data = script_data(tick=7)
+    with blocked_on_simulator(data):
+        # The script is done with the tick it has.
+        assert data['blocked'] == 1
+        assert queued(data) == [('tick_ack', 7), ('end_tick', None)]
+        with blocked_on_simulator(data):
+            assert data['blocked'] == 2
+        assert data['blocked'] == 1
+        assert queued(data) == [('end_tick', None)]
+    assert data['blocked'] == 0
+    with contextlib.suppress(ValueError):
+        with blocked_on_simulator(data):
+            raise ValueError
+    assert data['blocked'] == 0
@@ -0,0 +1,65 @@
+import pytest
+
+from ev3sim.simulation import profiler as profiler_module
+from ev3sim.simulation.profiler import TickProfiler
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def perf_counter(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(profiler_module, 'time', clock)
+    return clock
+
+class ColorInteractor:
+    pass
+
+def test_laps_are_charged_per_phase_and_class(clock):
+    profiler = TickProfiler()
+    profiler.start()
+    clock.now += 0.002
+    profiler.lap('writes')
+    for _ in range(3):
+        clock.now += 0.001
+        profiler.lap('tick', ColorInteractor())
+    profiler.completeIteration()
+    assert list(profiler.timings['writes']) == [pytest.approx(0.002)]
+    # Laps for the same class in one iteration are a single sample.
+    assert list(profiler.timings['tick (ColorInteractor)']) == [pytest.approx(0.003)]
+    assert profiler.current == {}
+
+def test_summary_orders_by_mean(clock):
+    profiler = TickProfiler()
+    for _ in range(10):
+        profiler.start()
+        clock.now += 0.001
+        profiler.lap('writes')
+        clock.now += 0.005
+        profiler.lap('physics')
+        profiler.completeIteration()
+    lines = profiler.summary().splitlines()
+    assert lines[1].startswith('physics')
+    assert lines[2].startswith('writes')
+    assert lines[1].split()[1:3] == ['10', '5.000']
+
+def test_history_is_bounded(clock):
+    profiler = TickProfiler()
+    for _ in range(TickProfiler.HISTORY_LENGTH + 10):
+        profiler.start()
+        profiler.lap('writes')
+        profiler.completeIteration()
+    assert len(profiler.timings['writes']) == TickProfiler.HISTORY_LENGTH
+
+def test_disabled_records_nothing(clock):
+    profiler = TickProfiler(enabled=False)
+    profiler.start()
+    profiler.lap('writes')
+    profiler.completeIteration()
+    assert profiler.timings == {}
+    assert profiler.summary() == "No timings have been recorded."
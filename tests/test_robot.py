@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+def test_writes_reach_devices(simulation):
+    sim = simulation()
+    robot = sim.robots['Robot-0']
+    motor = sim.device('Robot-0', 'tacho-motor', 'outB')
+    robot.applyWrite('tacho-motor', 'outB', 'speed_sp', '50')
+    robot.applyWrite('tacho-motor', 'outB', 'command', 'run-forever')
+    assert motor.speed_sp == 50
+    assert motor.state == 'running'
+    assert motor.applied_force == 50 * motor.MAX_FORCE / 100
+    robot.applyWrite('lego-sensor', 'sensorin3', 'mode', 'US-DIST-IN')
+    assert sim.device('Robot-0', 'lego-sensor', 'sensorin3').mode == 'US-DIST-IN'
+    # The other robot's devices are untouched.
+    assert sim.device('Robot-1', 'tacho-motor', 'outB').applied_force == 0
+
+def test_timed_writes(simulation):
+    sim = simulation()
+    robot = sim.robots['Robot-0']
+    motor = sim.device('Robot-0', 'tacho-motor', 'outC')
+    robot.applyWrite('tacho-motor', 'outC', 'speed_sp', '-30')
+    robot.applyWrite('tacho-motor', 'outC', 'time_sp', '500')
+    robot.applyWrite('tacho-motor', 'outC', 'command', 'run-timed')
+    sim.step(sim.loader.GAME_TICK_RATE // 2 - 1)
+    assert motor.applied_force == -30 * motor.MAX_FORCE / 100
+    sim.step(2)
+    assert motor.applied_force == 0
+    assert motor.state == 'holding'
+
+def test_write_errors(simulation):
+    sim = simulation()
+    robot = sim.robots['Robot-0']
+    with pytest.raises(ValueError, match='No device found'):
+        robot.applyWrite('tacho-motor', 'outA', 'speed_sp', '50')
+    with pytest.raises(ValueError, match='Unhandled write'):
+        robot.applyWrite('tacho-motor', 'outB', 'max_speed', '50')
+    with pytest.raises(ValueError, match='Unhandled write'):
+        robot.applyWrite('tacho-motor', 'outB', 'command', 'run-backwards')
+    # Sensors only take writes to their mode.
+    with pytest.raises(ValueError, match='Unhandled write'):
+        robot.applyWrite('lego-sensor', 'sensorin2', 'value0', '5')
+
+def move(sim, robot, position, rotation):
+    obj = sim.loader.object_map[sim.robots[robot].robot_key]
+    obj.body.position = position
+    obj.body.angle = rotation
+    obj.body.velocity = (0, 0)
+    obj.body.angular_velocity = 0
+
+def place(sim, obj, position):
+    """Move ``obj`` as if it had got there in the last physics tick."""
+    obj.body.position = position
+    sim.world.space.reindex_shapes_for_body(obj.body)
+    obj.update()
+
+def test_unopened_sensors_are_not_calculated(simulation):
+    sim = simulation(LAZY_DEVICES=True)
+    robot = sim.robots['Robot-0']
+    colour = sim.device('Robot-0', 'lego-sensor', 'sensorin2')
+    infrared = sim.device('Robot-0', 'lego-sensor', 'sensorin1')
+    motor = sim.device('Robot-0', 'tacho-motor', 'outB')
+    sim.step()
+    robot.useDevices({('tacho-motor', 'outB')})
+    assert not colour.in_use and not infrared.in_use
+    before = colour.raw(), infrared.value(0)
+    move(sim, 'Robot-0', (110, 100), 0)
+    sim.step()
+    assert (colour.raw(), infrared.value(0)) == before
+    robot.useDevices(None)
+    assert colour.raw() != before[0]
+    # Motors aren't lazy, so still act whether or not they are opened.
+    robot.applyWrite('tacho-motor', 'outC', 'speed_sp', '50')
+    robot.applyWrite('tacho-motor', 'outC', 'command', 'run-forever')
+    sim.step()
+    assert sim.loader.object_map[robot.robot_key].body.angular_velocity != 0
+    assert motor.in_use
+
+def test_opening_a_sensor_calculates_it_straight_away(simulation):
+    sim = simulation(LAZY_DEVICES=True)
+    robot = sim.robots['Robot-0']
+    colour = sim.device('Robot-0', 'lego-sensor', 'sensorin2')
+    sim.step()
+    robot.useDevices(set())
+    # Off the green field it started on.
+    move(sim, 'Robot-0', (110, 100), 0)
+    sim.step()
+    stale = colour.raw()
+    robot.useDevices({('lego-sensor', 'sensorin2')})
+    assert colour.in_use
+    assert colour.raw() != stale
+    # Nothing has moved since, so the tick doesn't calculate it again.
+    assert not colour._readingsStale()
+    expected = colour.raw()
+    colour._calc_raw()
+    assert colour.raw() == expected
+
+@pytest.mark.parametrize('options,opened', [
+    ({'LAZY_DEVICES': True}, None),
+    ({'LAZY_DEVICES': False}, set()),
+])
+def test_everything_in_use(simulation, options, opened):
+    sim = simulation(**options)
+    robot = sim.robots['Robot-0']
+    robot.useDevices(opened)
+    assert all(device.in_use for device in robot.device_paths.values())
+
+def test_ultrasonic_only_recalculated_for_objects_near_its_ray(simulation):
+    from ev3sim.devices.ultrasonic.ev3 import UltrasonicSensor
+    sim = simulation(LAZY_DEVICES=True)
+    robot = sim.robots['Robot-0']
+    ultrasonic = sim.device('Robot-0', 'lego-sensor', 'sensorin3')
+    interactor = ultrasonic._interactor
+    other = sim.loader.object_map[sim.robots['Robot-1'].robot_key]
+    robot.useDevices(set())
+    sim.step()
+    light = sim.loader.object_map[interactor.getPrefix() + 'light_up'].position
+    rotation = ultrasonic.parent.rotation + ultrasonic.relativeRot
+    direction = np.array([np.cos(rotation), np.sin(rotation)])
+    side = np.array([-direction[1], direction[0]])
+    # Well off to the side of the ray.
+    place(sim, other, light + 60 * side)
+    robot.useDevices({('lego-sensor', 'sensorin3')})
+    before = ultrasonic.distance_centimeters
+    assert other not in ultrasonic.nearby_objects
+    assert UltrasonicSensor._calc_all([interactor], only_stale=True) == []
+    place(sim, other, light + 70 * side)
+    assert UltrasonicSensor._calc_all([interactor], only_stale=True) == []
+    # Moving into the ray's way changes what the sensor sees.
+    place(sim, other, light + 30 * direction)
+    assert UltrasonicSensor._calc_all([interactor], only_stale=True) == [interactor]
+    assert other in ultrasonic.nearby_objects
+    assert ultrasonic.distance_centimeters < min(before, 30)
+    assert UltrasonicSensor._calc_all([interactor], only_stale=True) == []
@@ -0,0 +1,100 @@
+import pytest
+
+from ev3sim.simulation import scheduler as scheduler_module
+from ev3sim.simulation.scheduler import TickScheduler
+
+class FakeClock:
+    """Stands in for the time module, so that sleeping just moves the clock on."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(scheduler_module, 'time', clock)
+    return clock
+
+def test_sleeps_until_next_deadline(clock):
+    scheduler = TickScheduler(game_period=0.1, visual_period=0.25)
+    scheduler.sleepUntilDue()
+    assert clock.sleeps == []
+    assert scheduler.gameDue() and scheduler.visualDue()
+    scheduler.completeGameTick()
+    scheduler.completeVisualTick()
+    clock.now += 0.02
+    scheduler.sleepUntilDue()
+    assert clock.sleeps == [pytest.approx(0.08)]
+    assert scheduler.gameDue() and not scheduler.visualDue()
+
+def test_unthrottled_never_sleeps(clock):
+    scheduler = TickScheduler(game_period=0.1, visual_period=0.25)
+    scheduler.setUnthrottled(True)
+    for _ in range(50):
+        scheduler.sleepUntilDue()
+        assert scheduler.gameDue()
+        scheduler.completeGameTick()
+        clock.now += 0.001
+    assert clock.sleeps == []
+    assert scheduler.game_ticks == 50
+    assert not scheduler.behind()
+    assert scheduler.dropMissedTicks() == 0
+
+def test_throttling_resumes_from_now(clock):
+    scheduler = TickScheduler(game_period=0.1, visual_period=0.25)
+    scheduler.setUnthrottled(True)
+    scheduler.sleepUntilDue()
+    scheduler.completeGameTick()
+    clock.now += 5
+    scheduler.setUnthrottled(False)
+    scheduler.sleepUntilDue()
+    # Only the one tick due now, rather than the 50 which would have been due in real time.
+    assert scheduler.gameDue()
+    scheduler.completeGameTick()
+    assert not scheduler.gameDue()
+
+def run_due_ticks(scheduler, limit):
+    ran = 0
+    while ran < limit and scheduler.gameDue():
+        scheduler.completeGameTick()
+        ran += 1
+    return ran
+
+def test_catches_up_on_late_ticks(clock):
+    scheduler = TickScheduler(game_period=0.1, visual_period=1, max_catchup=5)
+    scheduler.sleepUntilDue()
+    scheduler.completeGameTick()
+    scheduler.completeVisualTick()
+    # Working for 0.35s means the ticks at 0.1, 0.2 and 0.3 are owed.
+    clock.now += 0.35
+    scheduler.sleepUntilDue()
+    assert clock.sleeps == []
+    assert scheduler.behind()
+    assert scheduler.dropMissedTicks() == 0
+    assert run_due_ticks(scheduler, 10) == 3
+    assert not scheduler.behind()
+    scheduler.sleepUntilDue()
+    assert clock.sleeps == [pytest.approx(0.05)]
+
+@pytest.mark.parametrize('late', [0.95, 1.0])
+def test_drops_ticks_beyond_catchup(clock, late):
+    scheduler = TickScheduler(game_period=0.125, visual_period=10, max_catchup=2)
+    scheduler.sleepUntilDue()
+    scheduler.completeGameTick()
+    clock.now += late
+    scheduler.sleepUntilDue()
+    owed = int(late / 0.125)
+    # The loop only runs one tick before dropping the rest.
+    assert run_due_ticks(scheduler, 1) == 1
+    dropped = scheduler.dropMissedTicks()
+    assert dropped == owed - 1 - 2
+    assert run_due_ticks(scheduler, 10) == 2
+    assert scheduler.dropMissedTicks() == 0
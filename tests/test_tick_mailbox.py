@@ -0,0 +1,41 @@
+import asyncio
+import threading
+from queue import Empty
+
+import pytest
+
+from ev3sim.simulation.communication import TickMailbox
+
+def test_overflow_drops_oldest():
+    async def run():
+        mailbox = TickMailbox(size=2)
+        for tick in range(5):
+            mailbox.put((tick, {}))
+        assert mailbox.dropped == 3
+        assert await mailbox.get() == (3, {})
+        assert await mailbox.get() == (4, {})
+        with pytest.raises(Empty):
+            await mailbox.get(timeout=0.01)
+    asyncio.run(run())
+
+def test_get_waits_for_put_from_another_thread():
+    async def run():
+        mailbox = TickMailbox()
+        thread = threading.Timer(0.05, mailbox.put, args=((7, {'a': 1}),))
+        thread.start()
+        try:
+            assert await mailbox.get(timeout=5) == (7, {'a': 1})
+        finally:
+            thread.join()
+        assert mailbox.dropped == 0
+    asyncio.run(run())
+
+def test_put_after_server_stopped():
+    async def create():
+        return TickMailbox()
+    mailbox = asyncio.run(create())
+    # The loop is closed, but the simulation can still hand over ticks.
+    mailbox.put((0, {}))
+    mailbox.put((1, {}))
+    assert list(mailbox.ticks) == [(1, {})]
+    assert mailbox.dropped == 1
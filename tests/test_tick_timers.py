@@ -0,0 +1,65 @@
+import threading
+import types
+
+from ev3sim.simulation import tick_timers
+from ev3sim.simulation.tick_timers import TickTimers
+
+def test_timers_fire_on_their_tick():
+    timers = TickTimers()
+    events = [(until, timers.watch(until=until)) for until in (5, 3, 8, 3)]
+
+    def fired():
+        return [until for until, event in events if event.is_set()]
+
+    assert not timers.advance(2)
+    assert fired() == []
+    assert timers.advance(3)
+    assert fired() == [3, 3]
+    # Ticks can be skipped, in which case everything due by then fires.
+    assert timers.advance(6)
+    assert fired() == [5, 3, 3]
+    assert timers.advance(8)
+    assert fired() == [5, 3, 8, 3]
+    assert timers.timers == []
+
+def test_timers_already_due():
+    timers = TickTimers()
+    timers.advance(10)
+    assert timers.watch(until=10).is_set()
+    assert timers.timers == []
+
+def test_timers_due_together_fire_in_order(monkeypatch):
+    fired = []
+
+    class RecordingEvent(threading.Event):
+        def set(self):
+            fired.append(self)
+            super().set()
+
+    monkeypatch.setattr(tick_timers, 'threading', types.SimpleNamespace(Lock=threading.Lock, Event=RecordingEvent))
+    timers = TickTimers()
+    events = [timers.watch(until=4) for _ in range(3)]
+    later = timers.watch(until=5)
+    timers.advance(5)
+    assert fired == events + [later]
+
+def test_watchers_only_wake_on_their_device():
+    timers = TickTimers()
+    colour = timers.watch(device=('lego-sensor', 'sensor0'))
+    motor = timers.watch(device=('tacho-motor', 'motor0'))
+    assert timers.advance(1, [('lego-sensor', 'sensor0')])
+    assert colour.is_set() and not motor.is_set()
+    # Waking an already woken watcher doesn't count.
+    assert not timers.advance(2, [('lego-sensor', 'sensor0')])
+    # Without knowing what changed, every watcher is woken.
+    assert timers.advance(3, None)
+    assert motor.is_set()
+
+def test_unwatch():
+    timers = TickTimers()
+    device = ('lego-sensor', 'sensor0')
+    event = timers.watch(device=device)
+    timers.unwatch(event, device)
+    assert timers.watchers == {}
+    assert not timers.advance(1, [device])
+    assert not event.is_set()
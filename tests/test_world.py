@@ -0,0 +1,145 @@
+import numpy as np
+import pymunk
+import pytest
+
+from ev3sim.devices.base import Device
+from ev3sim.devices.ultrasonic.base import UltrasonicSensorMixin
+from ev3sim.objects.base import objectFactory
+from ev3sim.simulation.world import World
+
+def ball(key='ball', position=(0, 0), radius=5, **kwargs):
+    return objectFactory(type='object', physics=True, key=key, position=list(position), visual={'name': 'Circle', 'radius': radius}, **kwargs)
+
+@pytest.fixture
+def world():
+    world = World()
+    yield world
+    World.paused = False
+
+@pytest.mark.parametrize('substeps', [1, 4])
+def test_forces_last_every_substep(world, substeps):
+    obj = ball(mass=2, friction=1)
+    world.registerObject(obj)
+    obj.apply_force((10, 0))
+    world.tick(0.5, substeps)
+    # A constant 5 units/s^2 for the whole tick, however it is split up.
+    assert obj.body.velocity.x == pytest.approx(2.5)
+    assert obj.body.velocity.y == pytest.approx(0)
+    # Positions are moved by the velocity from before each step, so more substeps are more accurate.
+    assert obj.position[0] == pytest.approx(0.5 * 5 * 0.5 ** 2 * (1 - 1 / substeps))
+
+def test_paused_world_doesnt_move(world):
+    obj = ball()
+    world.registerObject(obj)
+    obj.body.velocity = (10, 0)
+    World.paused = True
+    world.tick(0.5, 4)
+    assert obj.position[0] == 0
+
+def test_collision_groups(world):
+    robot, other = ball('robot'), ball('other', position=(30, 0))
+    world.registerObject(robot)
+    world.registerObject(other)
+    categories = robot.shape.filter.categories
+    group = world.assignCollisionGroup(robot)
+    assert robot.shape.filter.group == group
+    assert robot.shape.filter.categories == categories
+    assert world.assignCollisionGroup(other) == group + 1
+    query = world.space.segment_query_first((0, 0), (100, 0), 1, pymunk.ShapeFilter(group=group))
+    # Looks straight past the robot, to the next object along.
+    assert query.shape is other.shape
+
+def test_rays_ignore_their_robot(world):
+    robot, other = ball('robot'), ball('other', position=(30, 0))
+    world.registerObject(robot)
+    world.registerObject(other)
+    sensor = UltrasonicSensorMixin()
+    sensor._SetIgnoredObjects([robot])
+    # The robot has no group of its own yet, so is given one.
+    assert sensor._QueryFilter().group == robot.shape.filter.group != 0
+    distance = sensor._DistanceFromSensor((0, 0), 0)
+    # The ray has a radius, and stops just short of what it hits.
+    assert 30 - 5 - UltrasonicSensorMixin.RAYCAST_RADIUS - UltrasonicSensorMixin.ACCEPTANCE_LEVEL <= distance <= 30 - 5
+    # Pointing away, there is nothing to see.
+    assert sensor._DistanceFromSensor((0, 0), 3.14159) == UltrasonicSensorMixin.MAX_RAYCAST
+
+def test_rays_reuse_robot_groups(world):
+    robot = ball('robot')
+    world.registerObject(robot)
+    group = world.assignCollisionGroup(robot)
+    sensor = UltrasonicSensorMixin()
+    sensor._SetIgnoredObjects([robot])
+    assert sensor._QueryFilter().group == group
+    assert world.next_collision_group == group + 1
+
+def test_batched_rays_match_single_rays(world):
+    robots = [ball(f'robot{i}', position=position) for i, position in enumerate([(0, 0), (40, 0), (0, 60), (-200, -200)])]
+    wall = objectFactory(type='object', physics=True, static=True, key='wall', position=[100, 20], visual={'name': 'Rectangle', 'width': 10, 'height': 80})
+    for obj in robots + [wall]:
+        world.registerObject(obj)
+    sensors, starts, rotations = [], [], []
+    for robot in robots:
+        sensor = UltrasonicSensorMixin()
+        sensor._SetIgnoredObjects([robot])
+        # Along and between the axes, towards each other, the wall and nothing at all.
+        for rotation in np.linspace(-np.pi, np.pi, 17):
+            sensors.append(sensor)
+            starts.append(robot.position + 6 * np.array([np.cos(rotation), np.sin(rotation)]))
+            rotations.append(rotation)
+    distances = UltrasonicSensorMixin._DistancesAlongRays(UltrasonicSensorMixin._SensorRays(sensors, starts, rotations))
+    expected = [sensor._DistanceFromSensor(start, rotation) for sensor, start, rotation in zip(sensors, starts, rotations)]
+    assert distances == pytest.approx(expected)
+    assert UltrasonicSensorMixin.MAX_RAYCAST in expected
+    assert min(expected) < UltrasonicSensorMixin.MAX_RAYCAST
+
+def test_versions_count_movement(world):
+    still, moving = ball('still'), ball('moving', position=(30, 0))
+    world.registerObject(still)
+    world.registerObject(moving)
+    world.tick(1 / 60)
+    versions = world.version, still.version, moving.version
+    world.tick(1 / 60)
+    assert (world.version, still.version, moving.version) == versions
+    moving.body.velocity = (6, 0)
+    world.tick(1 / 60)
+    assert world.version == versions[0] + 1
+    assert still.version == versions[1]
+    assert moving.version == versions[2] + 1
+    world.unregisterObject(still)
+    assert world.version == versions[0] + 2
+
+def test_versions_ignore_creeping(world):
+    obj = ball()
+    world.registerObject(obj)
+    world.tick(1 / 60)
+    version = obj.version
+    # Slower than the tolerance a tick, but enough to add up.
+    obj.body.velocity = (0.5 * obj.MOVE_TOLERANCE * 60, 0)
+    world.tick(1 / 60)
+    world.tick(1 / 60)
+    assert obj.version == version
+    world.tick(1 / 60)
+    assert obj.version == version + 1
+    obj.body.velocity = (0, 0)
+    obj.body.angular_velocity = 2 * obj.ROTATE_TOLERANCE * 60
+    world.tick(1 / 60)
+    assert obj.version == version + 2
+
+class Sensor(Device):
+
+    def __init__(self):
+        self.key = None
+
+    def _readingsKey(self):
+        return self.key
+
+def test_readings_stale():
+    sensor = Sensor()
+    # No key means readings are recalculated every time.
+    assert sensor._readingsStale() and sensor._readingsStale()
+    sensor.key = (1, 3)
+    assert sensor._readingsStale()
+    assert not sensor._readingsStale()
+    sensor.key = (2, 3)
+    assert sensor._readingsStale()
+    assert not sensor._readingsStale()
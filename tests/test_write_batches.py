@@ -0,0 +1,36 @@
+from queue import Queue
+
+from ev3sim.attach import write_batches
+
+def batches_from(actions, robot_id='Robot-0'):
+    """The batches ``write_batches`` makes of ``actions``."""
+    queue = Queue()
+    for action in actions:
+        queue.put(action)
+    batches = write_batches(queue, robot_id)
+    return [next(batches) for _ in range(sum(action[0] in ('end_tick', 'tick_ack') for action in actions))]
+
+def writes_in(batch):
+    return [(write.device_type, write.name, write.attribute, write.value) for write in batch.writes]
+
+def test_writes_in_a_tick_are_batched_together():
+    speed = ('tacho-motor', 'outB', 'speed_sp', '50')
+    command = ('tacho-motor', 'outB', 'command', 'run-forever')
+    batches = batches_from([
+        ('write', speed),
+        ('open', ('lego-sensor', 'sensorin3')),
+        ('write', command),
+        ('end_tick', None),
+        # Nothing happened in this tick, so there is nothing to send.
+        ('end_tick', None),
+        ('write', speed),
+        ('tick_ack', 4),
+    ])
+    # Only as many batches as are yielded are asked for, so the empty tick would leave one short.
+    assert len(batches) == 3
+    first, second = batches[0], batches[1]
+    assert writes_in(first) == [speed, command]
+    assert [(path.device_type, path.name) for path in first.opened] == [('lego-sensor', 'sensorin3')]
+    assert not first.ack
+    assert writes_in(second) == [speed]
+    assert second.ack and second.tick == 4